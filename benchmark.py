@@ -0,0 +1,217 @@
+"""
+Time the university_db queries and updates on synthetic databases of several sizes.
+
+Usage:
+    python benchmark.py [--sizes 1000,10000,100000] [--repeat 20] [--backend sqlite|mysql]
+        [--database NAME] [--save FILE] [--baseline FILE] [--tolerance 0.25]
+
+For each size (a number of Evaluation rows) a scratch database is filled by
+datagen.generate(): in memory for SQLite, or the MySQL database NAME_<size>, which must
+be empty or missing. Every get_* and add_* function is then called --repeat times with
+arguments drawn from the generated data. The reference cache is cleared before each
+call, so the queries themselves are timed.
+
+For each function and size the tool reports the p50 and p95 latency and rows per second
+(rows returned, or written by an add_*). --save writes the results as a JSON baseline.
+--baseline compares against one and flags every function whose p95 grew by more than
+--tolerance, and by at least MIN_REGRESSION_MS. The exit status is 1 if any did.
+"""
+import argparse
+import inspect
+import json
+import math
+import platform
+import sys
+import time
+
+import datagen
+import university_db
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 20
+DEFAULT_TOLERANCE = 0.25
+# Smaller p95 differences are timer and scheduler noise, whatever the ratio
+MIN_REGRESSION_MS = 0.5
+# Sections shown at once in the GUI, for the per-section status lookup
+SCREEN_ROWS = 20
+
+
+def _section_id(i):
+    # Letter-led IDs never collide with the generated numeric ones
+    return f"{chr(65 + i // 100)}{i % 100:02d}"
+
+
+def _pick(items, i):
+    return items[i % len(items)]
+
+
+def _span(sample):
+    # The whole generated range of semesters, for the range queries
+    return sample['first'] + sample['last']
+
+
+# The calls to time, as (function name, (sample, i) -> argument tuple) pairs in run order,
+# where sample is datagen.generate()'s. The add_* arguments are distinct for every i, and
+# later cases use rows added by earlier ones.
+CASES = [
+    ('get_semesters', lambda k, i: ()),
+    ('get_available_courses_for_semester', lambda k, i: (k['year'], k['term'])),
+    ('get_evaluation_status_for_semester', lambda k, i: (k['year'], k['term'])),
+    ('get_evaluation_status_for_sections', lambda k, i: ([s[:4] for s in k['sections'][:SCREEN_ROWS]],)),
+    ('get_sections_above_percentage', lambda k, i: (k['year'], k['term'], 50)),
+    ('get_sections_for_instructor', lambda k, i: (k['year'], k['term'], _pick(k['instructors'], i))),
+    ('get_evaluations_for_section', lambda k, i: _pick(k['sections'], i)[:4]),
+    ('get_degrees_for_course', lambda k, i: (_pick(k['courses'], i),)),
+    ('get_degree_courses', lambda k, i: (_pick(k['degrees'], i),)),
+    ('get_degree_goals', lambda k, i: (_pick(k['degrees'], i),)),
+    ('get_courses_for_goals', lambda k, i: (_pick(k['degrees'], i), k['goals'][:2])),
+    ('get_improvement_notes', lambda k, i: _pick(k['sections'], i)[:2]),
+    ('get_course_sections_in_range', lambda k, i: (_pick(k['courses'], i),) + _span(k)),
+    ('get_instructor_sections_in_range', lambda k, i: (_pick(k['instructors'], i),) + _span(k)),
+    ('get_evaluation_status_for_semesters', lambda k, i: (university_db.get_semesters(),)),
+    ('get_sections_above_percentage_for_semesters', lambda k, i: (university_db.get_semesters(), 50)),
+    ('get_sections_for_instructors', lambda k, i: (university_db.get_semesters(), k['instructors'])),
+    ('get_degree_courses_for_degrees', lambda k, i: (k['degrees'],)),
+    ('add_degree', lambda k, i: (f"BD{i:06d}", f"Benchmark {datagen.alpha_suffix(i)}", 'BS')),
+    ('add_course', lambda k, i: (f"BNCH{i:04d}", "Benchmark Course")),
+    ('add_instructor', lambda k, i: (f"{90000000 + i}", "Benchmark Instructor")),
+    ('add_goal', lambda k, i: (f"{chr(66 + i // 1000)}{i % 1000:03d}", k['degrees'][0], "Benchmark goal")),
+    ('add_semester', lambda k, i: (str(3000 + i // 3), university_db.VALID_TERMS[i % 3])),
+    ('add_course_degree', lambda k, i: (f"BNCH{i:04d}", _pick(k['degrees'], i), 1)),
+    ('add_section', lambda k, i: (_pick(k['sections'], i)[0], _section_id(i), str(k['year']), k['term'],
+                                  _pick(k['sections'], i)[4], '30')),
+    ('add_course_to_semester', lambda k, i: (f"BNCH{i:04d}", '001', str(k['year']), k['term'],
+                                             _pick(k['instructors'], i), 30)),
+]
+
+
+def uncovered():
+    """The public get_* and add_* functions of university_db that no case calls."""
+    names = {name for name, value in vars(university_db).items()
+             if inspect.isfunction(value) and name.startswith(('get_', 'add_'))}
+    return sorted(names - {'get_backend', 'get_pool'} - {name for name, _ in CASES})
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an ascending list."""
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def measure(func, args_for, repeat):
+    """
+    Call func(*args_for(i)) for i in range(repeat) and summarize the timings.
+
+    Returns:
+        dict: 'calls', 'p50_ms', 'p95_ms', 'rows' (in total) and 'rows_per_s'.
+    """
+    timings = []
+    rows = 0
+    for i in range(repeat):
+        args = args_for(i)
+        university_db.clear_cache()
+        start = time.perf_counter()
+        result = func(*args)
+        if inspect.isgenerator(result):
+            result = list(result)
+        timings.append(time.perf_counter() - start)
+        rows += len(result) if isinstance(result, list) else 1
+    timings.sort()
+    total = sum(timings)
+    return {
+        'calls': repeat,
+        'p50_ms': round(percentile(timings, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(timings, 0.95) * 1000, 3),
+        'rows': rows,
+        'rows_per_s': round(rows / total, 1) if total else None,
+    }
+
+
+def run(sizes, repeat=DEFAULT_REPEAT, backend='sqlite', database='university_bench', seed=0):
+    """
+    Benchmark every case at every size.
+
+    Returns:
+        dict: size (as a string) -> function name -> the measure() summary, plus the
+              generated row counts under '_rows'.
+    """
+    results = {}
+    for size in sizes:
+        university_db.configure_backend(backend, path=':memory:', database=f"{database}_{size}")
+        generated = datagen.generate(size, seed)
+        print(f"== {size} evaluations requested: {generated['counts']}")
+        results[str(size)] = {'_rows': generated['counts']}
+        sample = generated['sample']
+        for name, args_for in CASES:
+            summary = measure(getattr(university_db, name), lambda i: args_for(sample, i), repeat)
+            results[str(size)][name] = summary
+            print(f"{name:<38} p50 {summary['p50_ms']:>9.3f} ms  p95 {summary['p95_ms']:>9.3f} ms"
+                  f"  {summary['rows_per_s'] or 0:>12.1f} rows/s")
+    return results
+
+
+def regressions(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare results with a baseline from an earlier run.
+
+    Returns:
+        list: (size, function, baseline p95 ms, current p95 ms) for every regression.
+    """
+    found = []
+    for size, functions in results.items():
+        for name, summary in functions.items():
+            before = baseline.get(size, {}).get(name)
+            if name.startswith('_') or before is None:
+                continue
+            old, new = before['p95_ms'], summary['p95_ms']
+            if new > old * (1 + tolerance) and new - old >= MIN_REGRESSION_MS:
+                found.append((size, name, old, new))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the university_db functions on synthetic data.")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated numbers of evaluations, e.g. 1000,100000,1000000")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="calls per function and size")
+    parser.add_argument('--backend', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--database', default='university_bench',
+                        help="prefix of the scratch MySQL databases (one per size)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed of the generated data")
+    parser.add_argument('--save', metavar='FILE', help="write the results as a JSON baseline")
+    parser.add_argument('--baseline', metavar='FILE', help="compare with a baseline written by --save")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative p95 growth before flagging a regression (default 0.25)")
+    args = parser.parse_args(argv)
+    try:
+        sizes = [int(size) for size in args.sizes.split(',')]
+    except ValueError:
+        parser.error("--sizes must be comma-separated integers")
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+
+    for name in uncovered():
+        print(f"[MISS] {name}: not benchmarked; add it to CASES")
+
+    results = run(sizes, args.repeat, args.backend, args.database, args.seed)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'backend': args.backend, 'python': platform.python_version(), 'repeat': args.repeat,
+                       'results': results}, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('backend') != args.backend:
+            print(f"Warning: the baseline was measured on {baseline.get('backend')}, not {args.backend}.")
+        found = regressions(results, baseline['results'], args.tolerance)
+        for size, name, old, new in found:
+            print(f"[REGRESSION] {size} evaluations, {name}: p95 {old:.3f} ms -> {new:.3f} ms")
+        print(f"{len(found)} regression(s) against {args.baseline}.")
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,345 @@
+"""
+Headless bulk import of catalog data from CSV or JSON Lines files.
+
+Usage:
+    python bulk_load.py --degree degrees.csv --course courses.jsonl --section sections.csv \
+        [--instructor FILE] [--semester FILE] [--goal FILE] [--course-degree FILE] \
+        [--rejects rejects.csv] [--chunk-size 1000]
+
+Files use the column names of the schema in migrations/ (degreeID, name, level, ...). Rows are
+validated with the same rules as the add_* functions, in whole-column passes, and inserted
+in dependency order with executemany in chunked transactions. Rows that fail validation or
+insertion are written to the rejects file together with the reason.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from university_db import (
+    COURSE_NUMBER_PATTERN, GOAL_CODE_PATTERN, INSTRUCTOR_ID_PATTERN, NAME_PATTERN,
+    VALID_LEVELS, VALID_TERMS, DatabaseError, connect_to_db, scaffold_semester,
+)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Table name -> (insert column order, primary key columns), in dependency order
+TABLES = {
+    'Degree': (['degreeID', 'name', 'level'], ['degreeID']),
+    'Course': (['courseNumber', 'name'], ['courseNumber']),
+    'Instructor': (['instructorID', 'name'], ['instructorID']),
+    'Semester': (['year', 'term'], ['year', 'term']),
+    'Goal': (['goalCode', 'degreeID', 'description'], ['goalCode', 'degreeID']),
+    'Course_Degree': (['courseNumber', 'degreeID', 'isCore'], ['degreeID', 'courseNumber']),
+    'Section': (['courseNumber', 'sectionID', 'year', 'term', 'instructorID', 'enrollmentCount'],
+                ['courseNumber', 'sectionID', 'year', 'term']),
+}
+
+TRUE_VALUES = {'1', 'true', 't', 'yes', 'y'}
+FALSE_VALUES = {'0', 'false', 'f', 'no', 'n', ''}
+
+
+def read_records(path):
+    """
+    Read a CSV (with a header row) or JSON Lines file.
+
+    Returns:
+        list: (line number, record dict) pairs with every value as a stripped string.
+    """
+    records = []
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith(('.jsonl', '.json', '.ndjson')):
+            for line_no, line in enumerate(f, start=1):
+                if line.strip():
+                    records.append((line_no, json.loads(line)))
+        else:
+            # Line 1 is the header
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                records.append((line_no, row))
+    return [(line_no, {k.strip(): _clean(v) for k, v in rec.items() if k}) for line_no, rec in records]
+
+
+def _clean(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    return str(value).strip()
+
+
+class Batch:
+    """The rows for one table as they move through validation, with the rows rejected so far."""
+
+    def __init__(self, table, records):
+        self.table = table
+        self.rows = records
+        self.rejected = []
+
+    def reject_where(self, reason, predicate):
+        """Drop every remaining row for which predicate(row) is true, recording the reason."""
+        kept = []
+        for line_no, row in self.rows:
+            if predicate(row):
+                self.rejected.append((self.table, line_no, reason, row))
+            else:
+                kept.append((line_no, row))
+        self.rows = kept
+
+    def require(self, *columns):
+        for column in columns:
+            self.reject_where(f"{column} is required.", lambda r, c=column: not r.get(c))
+
+    def reject_duplicates(self, key_columns, existing, label='key'):
+        """Reject rows whose key is already in the database or earlier in the file."""
+        seen = set(existing)
+
+        def is_duplicate(row):
+            key = tuple(row[c] for c in key_columns)
+            if key in seen:
+                return True
+            seen.add(key)
+            return False
+
+        self.reject_where(f"Duplicate {label}: already exists.", is_duplicate)
+
+    def keys(self, columns):
+        return {tuple(row[c] for c in columns) for _, row in self.rows}
+
+
+def _fetch_keys(cursor, sql):
+    cursor.execute(sql)
+    return {tuple(str(v) for v in row) for row in cursor.fetchall()}
+
+
+def validate(batches, cursor):
+    """
+    Validate every batch in dependency order. Parent keys accepted from earlier files count
+    as existing for later ones.
+    """
+    known = {
+        'Degree': _fetch_keys(cursor, "SELECT degreeID FROM Degree"),
+        'Course': _fetch_keys(cursor, "SELECT courseNumber FROM Course"),
+        'Instructor': _fetch_keys(cursor, "SELECT instructorID FROM Instructor"),
+        'Goal': _fetch_keys(cursor, "SELECT goalCode, degreeID FROM Goal"),
+    }
+
+    degree = batches.get('Degree')
+    if degree:
+        degree.require('degreeID', 'name', 'level')
+        degree.reject_where("Degree name must contain only alphabetic characters and spaces.",
+                            lambda r: not NAME_PATTERN.match(r['name']))
+        degree.reject_where(f"Invalid level. Must be one of: {', '.join(VALID_LEVELS)}",
+                            lambda r: r['level'] not in VALID_LEVELS)
+        degree.reject_duplicates(['degreeID'], known['Degree'], 'Degree ID')
+        degree.reject_duplicates(['name', 'level'], _fetch_keys(cursor, "SELECT name, level FROM Degree"),
+                                 'degree name and level')
+        known['Degree'] |= degree.keys(['degreeID'])
+
+    course = batches.get('Course')
+    if course:
+        course.require('courseNumber', 'name')
+        course.reject_where("Course name must contain only alphabetic characters and spaces.",
+                            lambda r: not NAME_PATTERN.match(r['name']))
+        course.reject_where("Course number must be 2-4 uppercase letters followed by 4 digits.",
+                            lambda r: not COURSE_NUMBER_PATTERN.match(r['courseNumber']))
+        course.reject_duplicates(['courseNumber'], known['Course'], 'Course Number')
+        known['Course'] |= course.keys(['courseNumber'])
+
+    instructor = batches.get('Instructor')
+    if instructor:
+        instructor.require('instructorID', 'name')
+        instructor.reject_where("Instructor ID must be exactly 8 numeric characters.",
+                                lambda r: not INSTRUCTOR_ID_PATTERN.match(r['instructorID']))
+        instructor.reject_duplicates(['instructorID'], known['Instructor'], 'Instructor ID')
+        known['Instructor'] |= instructor.keys(['instructorID'])
+
+    semester = batches.get('Semester')
+    if semester:
+        semester.require('year', 'term')
+        _validate_year_term(semester)
+        semester.reject_duplicates(['year', 'term'], _fetch_keys(cursor, "SELECT year, term FROM Semester"), 'semester')
+
+    goal = batches.get('Goal')
+    if goal:
+        goal.require('goalCode', 'degreeID', 'description')
+        goal.reject_where("Goal code must be exactly 4 characters.", lambda r: len(r['goalCode']) != 4)
+        goal.reject_where("Goal code must be any single character followed by 3 positive numbers.",
+                          lambda r: not GOAL_CODE_PATTERN.match(r['goalCode']))
+        goal.reject_where("No matching Degree ID found.", lambda r: (r['degreeID'],) not in known['Degree'])
+        goal.reject_duplicates(['goalCode', 'degreeID'], known['Goal'], 'goal')
+
+    course_degree = batches.get('Course_Degree')
+    if course_degree:
+        course_degree.require('courseNumber', 'degreeID')
+        course_degree.reject_where("isCore must be true/false or 1/0.",
+                                   lambda r: r.get('isCore', '').lower() not in TRUE_VALUES | FALSE_VALUES)
+        course_degree.reject_where("No matching course found for Course Number.",
+                                   lambda r: (r['courseNumber'],) not in known['Course'])
+        course_degree.reject_where("No matching degree found for Degree ID.",
+                                   lambda r: (r['degreeID'],) not in known['Degree'])
+        course_degree.reject_duplicates(['degreeID', 'courseNumber'],
+                                        _fetch_keys(cursor, "SELECT degreeID, courseNumber FROM Course_Degree"),
+                                        'course-degree association')
+        for _, row in course_degree.rows:
+            row['isCore'] = '1' if row.get('isCore', '').lower() in TRUE_VALUES else '0'
+
+    section = batches.get('Section')
+    if section:
+        section.require('courseNumber', 'sectionID', 'year', 'term', 'instructorID')
+        section.reject_where("Section ID must be exactly 3 characters.", lambda r: len(r['sectionID']) != 3)
+        _validate_year_term(section)
+        for _, row in section.rows:
+            row['enrollmentCount'] = row.get('enrollmentCount') or '0'
+        section.reject_where("Enrollment count must be a non-negative integer.",
+                             lambda r: not r['enrollmentCount'].isdigit())
+        section.reject_where("No match found for Instructor ID.",
+                             lambda r: (r['instructorID'],) not in known['Instructor'])
+        section.reject_where("No match found for Course Number.",
+                             lambda r: (r['courseNumber'],) not in known['Course'])
+        section.reject_duplicates(TABLES['Section'][1],
+                                  _fetch_keys(cursor, "SELECT courseNumber, sectionID, year, term FROM Section"),
+                                  'section')
+
+
+def _validate_year_term(batch):
+    batch.reject_where("Year must be a valid 4-digit number.",
+                       lambda r: not r['year'].isdigit() or len(r['year']) != 4)
+    batch.reject_where(f"Invalid term. Must be one of: {', '.join(VALID_TERMS)}.",
+                       lambda r: r['term'] not in VALID_TERMS)
+
+
+def insert(conn, batch, chunk_size):
+    """
+    Insert a validated batch with executemany, one transaction per chunk. A chunk that
+    fails is retried row by row so only the offending rows are rejected.
+
+    Returns:
+        int: The number of rows inserted.
+    """
+    columns, _ = TABLES[batch.table]
+    sql = f"INSERT INTO {batch.table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    cursor = conn.cursor()
+    inserted = 0
+    for start in range(0, len(batch.rows), chunk_size):
+        chunk = batch.rows[start:start + chunk_size]
+        try:
+            cursor.executemany(sql, [tuple(row[c] for c in columns) for _, row in chunk])
+            conn.commit()
+            inserted += len(chunk)
+        except DatabaseError:
+            conn.rollback()
+            for line_no, row in chunk:
+                try:
+                    cursor.execute(sql, tuple(row[c] for c in columns))
+                    conn.commit()
+                    inserted += 1
+                except DatabaseError as e:
+                    conn.rollback()
+                    batch.rejected.append((batch.table, line_no, f"Database Error: {e}", row))
+    cursor.close()
+    return inserted
+
+
+def ensure_semesters(conn, section_batch):
+    """Create the semesters referenced by sections, as add_course_to_semester does."""
+    cursor = conn.cursor()
+    cursor.executemany("INSERT IGNORE INTO Semester (year, term) VALUES (%s, %s)",
+                       sorted(section_batch.keys(['year', 'term'])))
+    conn.commit()
+    cursor.close()
+
+
+def scaffold_evaluations(conn, semesters):
+    """Create the empty Evaluation rows for new sections, one set-based statement per semester."""
+    cursor = conn.cursor()
+    for year, term in sorted(semesters):
+        scaffold_semester(cursor, year, term)
+    conn.commit()
+    cursor.close()
+
+
+def write_rejects(path, rejected):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['table', 'line', 'reason', 'record'])
+        for table, line_no, reason, row in rejected:
+            writer.writerow([table, line_no, reason, json.dumps(row, sort_keys=True)])
+
+
+def bulk_load(files, rejects_path='rejects.csv', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Load catalog files into the database.
+
+    Parameters:
+        files (dict): Table name (e.g. 'Course', 'Course_Degree') -> path of a CSV or JSONL file.
+        rejects_path (str): Where to write rejected rows; nothing is written if none are rejected.
+        chunk_size (int): Rows per executemany call and transaction.
+
+    Returns:
+        dict: Per table, the number of rows 'read', 'inserted' and 'rejected'.
+    """
+    unknown = set(files) - set(TABLES)
+    if unknown:
+        raise ValueError(f"Unknown table(s): {', '.join(sorted(unknown))}")
+
+    batches = {table: Batch(table, read_records(path)) for table, path in files.items()}
+    read_counts = {table: len(batch.rows) for table, batch in batches.items()}
+
+    conn = connect_to_db()
+    if not conn:
+        raise ConnectionError("Failed to establish a database connection.")
+    try:
+        cursor = conn.cursor()
+        validate(batches, cursor)
+        cursor.close()
+        conn.rollback()
+
+        summary = {}
+        for table in TABLES:
+            batch = batches.get(table)
+            if batch is None:
+                continue
+            if table == 'Section' and batch.rows:
+                ensure_semesters(conn, batch)
+            inserted = insert(conn, batch, chunk_size)
+            if table == 'Section' and inserted:
+                scaffold_evaluations(conn, batch.keys(['year', 'term']))
+            summary[table] = {'read': read_counts[table], 'inserted': inserted, 'rejected': len(batch.rejected)}
+    finally:
+        conn.close()
+
+    rejected = [r for batch in batches.values() for r in batch.rejected]
+    if rejected:
+        write_rejects(rejects_path, rejected)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk load catalog data from CSV or JSON Lines files.")
+    for table in TABLES:
+        option = '--' + table.lower().replace('_', '-')
+        parser.add_argument(option, dest=table, metavar='FILE', help=f"Rows for the {table} table")
+    parser.add_argument('--rejects', default='rejects.csv', help="Where to write rejected rows (default: rejects.csv)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per transaction")
+    args = parser.parse_args(argv)
+
+    files = {table: getattr(args, table) for table in TABLES if getattr(args, table)}
+    if not files:
+        parser.error("Give at least one input file.")
+    for path in files.values():
+        if not os.path.exists(path):
+            parser.error(f"File not found: {path}")
+
+    summary = bulk_load(files, args.rejects, args.chunk_size)
+    total_rejected = 0
+    for table, counts in summary.items():
+        print(f"{table}: {counts['inserted']} inserted, {counts['rejected']} rejected of {counts['read']} read")
+        total_rejected += counts['rejected']
+    if total_rejected:
+        print(f"Rejected rows written to {args.rejects}")
+    return 1 if total_rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+Synthetic university data at a configurable scale, for benchmarks and experiments.
+
+Usage:
+    python datagen.py --evaluations 100000 [--backend sqlite|mysql] [--path FILE]
+        [--database NAME] [--seed 0]
+
+Fills an empty database with degrees, goals, courses, instructors, semesters, sections
+and evaluations, sized by the number of Evaluation rows wanted and shaped like a
+department: every course belongs to one or two degrees with five goals each, and runs
+about once per semester. Every row satisfies the schema's constraints and the rules of
+the add_* functions (ID and name formats, degree levels, evaluation types), and every
+entered evaluation has A+B+C+F equal to its section's enrollment, as the GUI requires.
+The stored section summaries and pass rates are rebuilt at the end.
+"""
+import argparse
+import math
+import random
+import sys
+
+import university_db
+
+GOALS_PER_DEGREE = 5
+DEGREES_PER_COURSE = (1, 2)
+# Evaluation rows per section on average: 1.5 degrees of GOALS_PER_DEGREE goals
+EVALUATIONS_PER_SECTION = GOALS_PER_DEGREE * sum(DEGREES_PER_COURSE) / len(DEGREES_PER_COURSE)
+MAX_SEMESTERS = 30
+SECTIONS_PER_INSTRUCTOR = 3      # per semester
+COURSES_PER_DEGREE = 40
+FIRST_YEAR = 2015
+ENROLLMENT = (5, 60)
+ENTERED_RATE = 0.6               # share of Evaluation rows with an evaluation entered
+NOTE_RATE = 0.25                 # share of entered evaluations with an improvement note
+SAMPLE_SIZE = 50
+CHUNK_SIZE = 5000
+
+# The Evaluation.evaluationType ENUM of the schema
+EVALUATION_TYPES = ['Homework', 'Project', 'Quiz', 'Oral Presentation', 'Report', 'Mid-term', 'Final Exam', 'Other']
+COURSE_PREFIXES = ['CS', 'MATH', 'EE', 'PHYS', 'STAT', 'BIO', 'CHEM', 'ECE']
+
+
+def alpha_suffix(i):
+    """The i-th alphabetic name suffix: 0 -> 'A', 25 -> 'Z', 26 -> 'AA', ..."""
+    name = ''
+    i += 1
+    while i:
+        i, r = divmod(i - 1, 26)
+        name = chr(65 + r) + name
+    return name
+
+
+def course_number(i):
+    """The i-th generated course number (2-4 letters and 4 digits)."""
+    return f"{COURSE_PREFIXES[i % len(COURSE_PREFIXES)]}{1000 + i // len(COURSE_PREFIXES)}"
+
+
+def plan(evaluations):
+    """
+    Work out how many rows of each kind give about the wanted number of evaluations.
+
+    Returns:
+        dict: Counts of 'sections', 'semesters', 'courses', 'instructors' and 'degrees'.
+    """
+    if evaluations < 1:
+        raise ValueError("The number of evaluations must be positive.")
+    sections = max(1, round(evaluations / EVALUATIONS_PER_SECTION))
+    # Small databases span a few semesters, large ones up to MAX_SEMESTERS
+    semesters = min(MAX_SEMESTERS, max(3, round(math.sqrt(sections) / 4)))
+    courses = max(len(COURSE_PREFIXES), math.ceil(sections / semesters))
+    if courses > len(COURSE_PREFIXES) * 9000:
+        raise ValueError("Too many evaluations for the course number format.")
+    return {
+        'sections': sections,
+        'semesters': semesters,
+        'courses': courses,
+        'instructors': max(5, math.ceil(sections / semesters / SECTIONS_PER_INSTRUCTOR)),
+        'degrees': max(2, math.ceil(courses / COURSES_PER_DEGREE)),
+    }
+
+
+def split_grades(rng, enrollment):
+    """Split an enrollment into A, B, C and F counts that add up to it."""
+    a, b, c = sorted(rng.randint(0, enrollment) for _ in range(3))
+    return a, b - a, c - b, enrollment - c
+
+
+def _insert(cursor, query, rows):
+    for start in range(0, len(rows), CHUNK_SIZE):
+        cursor.executemany(query, rows[start:start + CHUNK_SIZE])
+
+
+def generate(evaluations=1000, seed=0, verbose=False):
+    """
+    Fill the configured (empty) database with synthetic data.
+
+    Parameters:
+        evaluations (int): About how many Evaluation rows to create.
+        seed (int): Seed of the random generator; the same seed gives the same data.
+        verbose (bool): Print progress.
+
+    Returns:
+        dict: 'counts' (rows created per table) and 'sample', keys for driving queries:
+              'year' and 'term' of a semester in the middle of the range, 'first' and
+              'last' semesters as (year, term), and lists of that semester's 'sections'
+              (courseNumber, sectionID, year, term, instructorID), 'instructors',
+              'courses' and 'degrees', plus the 'goals' of every degree.
+
+    Raises:
+        DatabaseUnavailableError: If no connection could be established.
+        DatabaseError: If the database is not empty (duplicate keys) or an insert fails.
+    """
+    rng = random.Random(seed)
+    shape = plan(evaluations)
+    counts = {}
+
+    degrees = [f"D{i:04d}" for i in range(shape['degrees'])]
+    goals = [f"G{g:03d}" for g in range(1, GOALS_PER_DEGREE + 1)]
+    courses = [course_number(i) for i in range(shape['courses'])]
+    instructors = [f"{10000000 + i}" for i in range(shape['instructors'])]
+    semesters = [(FIRST_YEAR + i // 3, university_db.VALID_TERMS[i % 3]) for i in range(shape['semesters'])]
+    course_degrees = {course: rng.sample(degrees, min(len(degrees), rng.randint(*DEGREES_PER_COURSE)))
+                      for course in courses}
+
+    conn = university_db.connect_to_db()
+    if not conn:
+        raise university_db.DatabaseUnavailableError("Failed to establish a database connection.")
+    try:
+        cursor = conn.cursor()
+        _insert(cursor, "INSERT INTO Degree (degreeID, name, level) VALUES (%s, %s, %s)",
+                [(d, f"Program {alpha_suffix(i)}", university_db.VALID_LEVELS[i % len(university_db.VALID_LEVELS)])
+                 for i, d in enumerate(degrees)])
+        _insert(cursor, "INSERT INTO Goal (goalCode, degreeID, description) VALUES (%s, %s, %s)",
+                [(g, d, f"Goal {g} of {d}") for d in degrees for g in goals])
+        _insert(cursor, "INSERT INTO Course (courseNumber, name) VALUES (%s, %s)",
+                [(c, f"Course {alpha_suffix(i)}") for i, c in enumerate(courses)])
+        _insert(cursor, "INSERT INTO Instructor (instructorID, name) VALUES (%s, %s)",
+                [(p, f"Instructor {alpha_suffix(i)}") for i, p in enumerate(instructors)])
+        _insert(cursor, "INSERT INTO Semester (year, term) VALUES (%s, %s)", semesters)
+        _insert(cursor, "INSERT INTO Course_Degree (courseNumber, degreeID, isCore) VALUES (%s, %s, %s)",
+                [(c, d, rng.random() < 0.5) for c in courses for d in course_degrees[c]])
+        conn.commit()
+        counts.update(Degree=len(degrees), Goal=len(degrees) * len(goals), Course=len(courses),
+                      Instructor=len(instructors), Semester=len(semesters),
+                      Course_Degree=sum(len(d) for d in course_degrees.values()))
+        if verbose:
+            print(f"Catalog: {counts}")
+
+        counts['Section'] = counts['Evaluation'] = 0
+        per_semester = shape['sections'] // len(semesters)
+        extra = shape['sections'] % len(semesters)
+        middle = semesters[len(semesters) // 2]
+        sample_sections = []
+        for index, (year, term) in enumerate(semesters):
+            taken = {}
+            sections = []
+            evaluation_rows = []
+            for _ in range(per_semester + (index < extra)):
+                course = rng.choice(courses)
+                taken[course] = taken.get(course, 0) + 1
+                section = (course, f"{taken[course]:03d}", year, term, rng.choice(instructors),
+                           rng.randint(*ENROLLMENT))
+                sections.append(section)
+                for degree in course_degrees[course]:
+                    for goal in goals:
+                        if rng.random() < ENTERED_RATE:
+                            note = "Review the weakest topic" if rng.random() < NOTE_RATE else None
+                            evaluation_rows.append(section[:4] + (degree, goal, rng.choice(EVALUATION_TYPES))
+                                                   + split_grades(rng, section[5]) + (note,))
+                        else:
+                            evaluation_rows.append(section[:4] + (degree, goal, None, 0, 0, 0, 0, None))
+            _insert(cursor, """
+                INSERT INTO Section (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, sections)
+            _insert(cursor, """
+                INSERT INTO Evaluation (courseNumber, sectionID, year, term, degreeID, goalCode, evaluationType,
+                                        gradeCountA, gradeCountB, gradeCountC, gradeCountF, improvementNote)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, evaluation_rows)
+            conn.commit()
+            counts['Section'] += len(sections)
+            counts['Evaluation'] += len(evaluation_rows)
+            if (year, term) == middle:
+                sample_sections = [s[:5] for s in rng.sample(sections, min(SAMPLE_SIZE, len(sections)))]
+            if verbose:
+                print(f"{year} {term:<6}  {len(sections)} sections, {len(evaluation_rows)} evaluations")
+        cursor.close()
+    finally:
+        conn.close()
+
+    # The derived tables are maintained by university_db's own writes, not by these inserts
+    for year, term in semesters:
+        university_db.rebuild_section_summaries(year, term)
+        university_db.refresh_section_pass_rates(year, term)
+
+    return {
+        'counts': counts,
+        'sample': {
+            'year': middle[0],
+            'term': middle[1],
+            'first': semesters[0],
+            'last': semesters[-1],
+            'sections': sample_sections,
+            'instructors': list(dict.fromkeys(s[4] for s in sample_sections)),
+            'courses': list(dict.fromkeys(s[0] for s in sample_sections)),
+            'degrees': degrees[:SAMPLE_SIZE],
+            'goals': goals,
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fill an empty database with synthetic university data.")
+    parser.add_argument('--evaluations', type=int, default=1000, help="about how many Evaluation rows to create")
+    parser.add_argument('--backend', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--path', default='synthetic.sqlite3', help="SQLite database file")
+    parser.add_argument('--database', default='university_synthetic', help="MySQL database to fill")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    args = parser.parse_args(argv)
+    if args.backend == 'mysql' and args.database == 'university':
+        parser.error("refusing to fill the application database; pass a scratch --database")
+
+    university_db.configure_backend(args.backend, path=args.path, database=args.database)
+    try:
+        result = generate(args.evaluations, args.seed, verbose=True)
+    except (university_db.UniversityDBError, university_db.DatabaseError, ValueError) as err:
+        print(f"Error: {err}")
+        return 2
+    for table, count in result['counts'].items():
+        print(f"{table:<14} {count}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
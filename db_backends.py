@@ -0,0 +1,700 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from db_metrics import metrics
+
+
+class errorcode:
+    """The MySQL error numbers the application checks for. Both backends report these."""
+    ER_ACCESS_DENIED_ERROR = 1045
+    ER_BAD_DB_ERROR = 1049
+    ER_BAD_NULL_ERROR = 1048
+    ER_DUP_ENTRY = 1062
+    ER_ROW_IS_REFERENCED_2 = 1451
+    ER_NO_REFERENCED_ROW_2 = 1452
+    ER_CHECK_CONSTRAINT_VIOLATED = 3819
+    CR_CONN_HOST_ERROR = 2003
+
+
+class DatabaseError(Exception):
+    """Base class for errors raised by any backend. Carries the MySQL errno when known."""
+
+    def __init__(self, msg, errno=None):
+        super().__init__(msg)
+        self.msg = msg
+        self.errno = errno
+
+
+class IntegrityError(DatabaseError):
+    """A constraint (primary key, unique, foreign key, check, not null) was violated."""
+
+
+class OperationalError(DatabaseError):
+    """The connection or server failed, independent of the statement being run."""
+
+
+class ProgrammingError(DatabaseError):
+    """The statement itself is invalid (syntax, unknown table or column)."""
+
+
+# DB-API style alias
+Error = DatabaseError
+
+
+# Prepared statements. Hot statements are run through connection.prepared(operation),
+# which keeps up to PREPARED_CACHE_SIZE prepared statements per connection (least
+# recently used out). The counters are shared by all connections of the process.
+PREPARED_CACHE_SIZE = 32
+
+_statement_stats = {
+    'prepares': 0,    # statements compiled (once per connection and statement)
+    'executions': 0,  # executions through a prepared cursor
+    'evictions': 0,   # statements dropped to stay within PREPARED_CACHE_SIZE
+    'fallbacks': 0,   # plain cursors handed out because the driver cannot prepare
+}
+_statement_stats_lock = threading.Lock()
+
+
+def _count_statement(name):
+    with _statement_stats_lock:
+        _statement_stats[name] += 1
+
+
+def statement_stats():
+    """
+    Report prepared-statement usage.
+
+    Returns:
+        dict: The counters (prepares, executions, evictions, fallbacks) plus reuse_rate,
+              the share of executions that did not need a prepare.
+    """
+    with _statement_stats_lock:
+        stats = dict(_statement_stats)
+    executions = stats['executions']
+    stats['reuse_rate'] = (executions - stats['prepares']) / executions if executions else 0.0
+    return stats
+
+
+# MySQL backend
+
+class MySQLBackend:
+    """
+    A MySQL server reached through mysql.connector, which is imported on first connect.
+
+    Parameters:
+        config (dict): Keyword arguments for mysql.connector.connect (host, user, ...).
+        database (str): The database to select, created if it does not exist.
+    """
+    name = 'mysql'
+
+    def __init__(self, config, database='university'):
+        self.config = dict(config)
+        self.database = database
+
+    def connect(self):
+        """
+        Open a new connection with the database selected.
+
+        Returns:
+            tuple: (connection, created) where created is True if the database had to be created.
+        """
+        import mysql.connector
+        from mysql.connector import errorcode as mysql_errorcode
+
+        try:
+            raw = mysql.connector.connect(database=self.database, **self.config)
+            return MySQLConnection(raw), False
+        except mysql.connector.Error as err:
+            if err.errno != mysql_errorcode.ER_BAD_DB_ERROR:
+                raise _translate_mysql_error(err) from err
+
+        print(f"Database '{self.database}' not found. Creating it...")
+        try:
+            raw = mysql.connector.connect(**self.config)
+            cursor = raw.cursor()
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.database};")
+            cursor.execute(f"USE {self.database};")
+            cursor.close()
+        except mysql.connector.Error as err:
+            raise _translate_mysql_error(err) from err
+        return MySQLConnection(raw), True
+
+
+def _translate_mysql_error(err):
+    import mysql.connector
+    if isinstance(err, mysql.connector.IntegrityError):
+        cls = IntegrityError
+    elif isinstance(err, (mysql.connector.InterfaceError, mysql.connector.OperationalError)):
+        cls = OperationalError
+    elif isinstance(err, mysql.connector.ProgrammingError):
+        cls = ProgrammingError
+    else:
+        cls = DatabaseError
+    return cls(str(err), err.errno)
+
+
+class MySQLConnection:
+    """Wraps a mysql.connector connection so its errors surface as this module's exceptions."""
+    # MySQL commits implicitly around DDL statements
+    transactional_ddl = False
+    # Cursors are unbuffered: unread rows block the connection until they are consumed
+    streams_unbuffered = True
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._prepared = OrderedDict()  # (operation, dictionary) -> MySQLPreparedCursor
+        self._can_prepare = True
+
+    def cursor(self, dictionary=False, **kwargs):
+        return MySQLCursor(self._raw.cursor(dictionary=dictionary, **kwargs))
+
+    def prepared(self, operation, dictionary=False):
+        """
+        Return a cursor that runs operation as a server-side prepared statement.
+
+        The statement is prepared on the server at its first execution on this
+        connection and only executed afterwards. If the driver cannot prepare
+        statements, a plain cursor is returned instead.
+
+        Parameters:
+            operation (str): The statement; the returned cursor only runs this one.
+            dictionary (bool): Return rows as dictionaries.
+        """
+        import mysql.connector
+        key = (operation, dictionary)
+        cursor = self._prepared.get(key)
+        if cursor is not None:
+            self._prepared.move_to_end(key)
+            return cursor
+        if self._can_prepare:
+            try:
+                raw = self._raw.cursor(prepared=True)
+            except (ValueError, NotImplementedError, mysql.connector.Error):
+                self._can_prepare = False
+        if not self._can_prepare:
+            _count_statement('fallbacks')
+            return self.cursor(dictionary=dictionary)
+        cursor = self._prepared[key] = MySQLPreparedCursor(raw, operation, dictionary)
+        while len(self._prepared) > PREPARED_CACHE_SIZE:
+            _, evicted = self._prepared.popitem(last=False)
+            evicted.close()  # Deallocates the statement on the server
+            _count_statement('evictions')
+        return cursor
+
+    def commit(self):
+        import mysql.connector
+        try:
+            self._raw.commit()
+        except mysql.connector.Error as err:
+            raise _translate_mysql_error(err) from err
+
+    def rollback(self):
+        import mysql.connector
+        try:
+            self._raw.rollback()
+        except mysql.connector.Error as err:
+            raise _translate_mysql_error(err) from err
+
+    def ping(self, reconnect=False):
+        import mysql.connector
+        try:
+            self._raw.ping(reconnect=reconnect)
+        except mysql.connector.Error as err:
+            raise _translate_mysql_error(err) from err
+
+    @property
+    def in_transaction(self):
+        return self._raw.in_transaction
+
+    def close(self):
+        self._raw.close()
+
+
+class MySQLCursor:
+    """Wraps a mysql.connector cursor, translating driver errors and recording statement metrics."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._observed = None  # The metrics entry of the last statement, if it was sampled
+
+    def execute(self, operation, params=None):
+        import mysql.connector
+        started = time.perf_counter()
+        try:
+            result = self._raw.execute(operation, params)
+        except mysql.connector.Error as err:
+            self._observed = metrics.statement(operation, started, failed=True)
+            raise _translate_mysql_error(err) from err
+        self._observe(operation, started)
+        return result
+
+    def executemany(self, operation, seq_params):
+        import mysql.connector
+        started = time.perf_counter()
+        try:
+            result = self._raw.executemany(operation, seq_params)
+        except mysql.connector.Error as err:
+            self._observed = metrics.statement(operation, started, failed=True)
+            raise _translate_mysql_error(err) from err
+        self._observe(operation, started)
+        return result
+
+    def _observe(self, operation, started):
+        # Rows of a result set are counted as they are fetched, others from rowcount
+        rowcount = -1 if self._raw.description else self._raw.rowcount
+        self._observed = metrics.statement(operation, started, rowcount)
+
+    def _fetched(self, rows):
+        if self._observed is not None:
+            metrics.add_rows(self._observed, len(rows))
+        return rows
+
+    def fetchone(self):
+        row = self._raw.fetchone()
+        if row is not None and self._observed is not None:
+            metrics.add_rows(self._observed, 1)
+        return row
+
+    def fetchmany(self, size=1):
+        return self._fetched(self._raw.fetchmany(size=size))
+
+    def fetchall(self):
+        return self._fetched(self._raw.fetchall())
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    @property
+    def description(self):
+        return self._raw.description
+
+    @property
+    def rowcount(self):
+        return self._raw.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._raw.lastrowid
+
+    def close(self):
+        self._raw.close()
+
+
+class MySQLPreparedCursor(MySQLCursor):
+    """
+    A mysql.connector prepared cursor bound to one statement.
+
+    The driver re-prepares whenever it is handed a different statement object, so the
+    statement given at construction is always the one passed down.
+    """
+
+    def __init__(self, raw, operation, dictionary=False):
+        super().__init__(raw)
+        self._operation = operation
+        self._dictionary = dictionary
+        self._is_prepared = False
+
+    def execute(self, operation, params=None):
+        if operation != self._operation:
+            raise ValueError("A prepared cursor only runs the statement it was prepared for.")
+        if not self._is_prepared:
+            _count_statement('prepares')
+        _count_statement('executions')
+        result = super().execute(self._operation, params)
+        self._is_prepared = True
+        return result
+
+    def _convert(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip(self._raw.column_names, row))
+
+    def fetchone(self):
+        return self._convert(super().fetchone())
+
+    def fetchmany(self, size=1):
+        return [self._convert(row) for row in super().fetchmany(size)]
+
+    def fetchall(self):
+        return [self._convert(row) for row in super().fetchall()]
+
+
+# SQLite backend
+
+class SQLiteBackend:
+    """
+    An embedded SQLite database file. MySQL-flavoured statements are translated on the fly.
+
+    Parameters:
+        path (str): The database file, or ':memory:' for a private in-process database
+            shared by all pooled connections of this backend.
+    """
+    name = 'sqlite'
+    _memory_ids = 0
+
+    def __init__(self, path):
+        self.path = path
+        if path == ':memory:':
+            # A named shared-cache database, so every pooled connection sees the same data
+            SQLiteBackend._memory_ids += 1
+            self._target = f"file:university_mem_{os.getpid()}_{SQLiteBackend._memory_ids}?mode=memory&cache=shared"
+            self._uri = True
+        else:
+            self._target = path
+            self._uri = False
+        self.dialect = SQLiteDialect()
+
+    def connect(self):
+        """
+        Open a new connection to the database file.
+
+        Returns:
+            tuple: (connection, created) where created is True if the schema has not been loaded yet.
+        """
+        try:
+            # The statement cache must hold at least the statements counted as prepared,
+            # on top of the ad-hoc ones run through plain cursors
+            raw = sqlite3.connect(self._target, uri=self._uri, timeout=30, check_same_thread=False,
+                                  cached_statements=4 * PREPARED_CACHE_SIZE)
+            raw.execute("PRAGMA foreign_keys = ON")
+            if not self._uri:
+                raw.execute("PRAGMA journal_mode = WAL")
+                raw.execute("PRAGMA synchronous = NORMAL")
+            created = raw.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Degree'"
+            ).fetchone() is None
+        except sqlite3.Error as err:
+            raise self.dialect.translate_error(err, None) from err
+        return SQLiteConnection(raw, self.dialect), created
+
+
+class SQLiteConnection:
+    """A sqlite3 connection that accepts the MySQL dialect used throughout the application."""
+    transactional_ddl = True
+    streams_unbuffered = False
+
+    def __init__(self, raw, dialect):
+        self._raw = raw
+        self.dialect = dialect
+        # sqlite3 compiles statements through its own per-connection cache keyed by the
+        # SQL text, so preparing is implicit; this mirrors that cache for the counters.
+        self._prepared = OrderedDict()
+
+    def cursor(self, dictionary=False, **kwargs):
+        return SQLiteCursor(self, dictionary)
+
+    def prepared(self, operation, dictionary=False):
+        """
+        Return a cursor for a frequently run statement.
+
+        sqlite3 reuses the compiled statement from its statement cache on every
+        execution after the first, as long as the statement stays among the most
+        recently used ones.
+
+        Parameters:
+            operation (str): The statement.
+            dictionary (bool): Return rows as dictionaries.
+        """
+        if operation in self._prepared:
+            self._prepared.move_to_end(operation)
+        else:
+            self._prepared[operation] = True
+            _count_statement('prepares')
+            if len(self._prepared) > PREPARED_CACHE_SIZE:
+                self._prepared.popitem(last=False)
+                _count_statement('evictions')
+        return SQLitePreparedCursor(self, dictionary)
+
+    def commit(self):
+        try:
+            self._raw.commit()
+        except sqlite3.Error as err:
+            raise self.dialect.translate_error(err, None) from err
+
+    def rollback(self):
+        self._raw.rollback()
+
+    def ping(self, reconnect=False):
+        try:
+            self._raw.execute("SELECT 1")
+        except sqlite3.Error as err:
+            raise OperationalError(str(err)) from err
+
+    @property
+    def in_transaction(self):
+        return self._raw.in_transaction
+
+    def close(self):
+        self._raw.close()
+
+
+class SQLiteCursor:
+    """Cursor over a SQLiteConnection, optionally returning rows as dictionaries."""
+
+    def __init__(self, connection, dictionary=False):
+        self._connection = connection
+        self._raw = connection._raw.cursor()
+        self._dictionary = dictionary
+        self._columns = None
+        self._observed = None  # The metrics entry of the last statement, if it was sampled
+
+    def execute(self, operation, params=None):
+        dialect = self._connection.dialect
+        started = time.perf_counter()
+        statements = dialect.translate(operation, self._connection._raw)
+        try:
+            for statement in statements:
+                self._raw.execute(statement, tuple(params) if params else ())
+        except sqlite3.Error as err:
+            self._observed = metrics.statement(operation, started, failed=True)
+            raise dialect.translate_error(err, operation, self._connection._raw) from err
+        self._columns = [d[0] for d in self._raw.description] if self._raw.description else None
+        self._observed = metrics.statement(operation, started, -1 if self._columns else self._raw.rowcount)
+
+    def executemany(self, operation, seq_params):
+        dialect = self._connection.dialect
+        started = time.perf_counter()
+        (statement,) = dialect.translate(operation, self._connection._raw)
+        try:
+            self._raw.executemany(statement, [tuple(p) for p in seq_params])
+        except sqlite3.Error as err:
+            self._observed = metrics.statement(operation, started, failed=True)
+            raise dialect.translate_error(err, operation, self._connection._raw) from err
+        self._columns = None
+        self._observed = metrics.statement(operation, started, self._raw.rowcount)
+
+    def _convert(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip(self._columns, row))
+
+    def _fetched(self, rows):
+        if self._observed is not None:
+            metrics.add_rows(self._observed, len(rows))
+        if self._dictionary:
+            columns = self._columns
+            return [dict(zip(columns, row)) for row in rows]
+        return rows
+
+    def fetchone(self):
+        row = self._raw.fetchone()
+        if row is not None and self._observed is not None:
+            metrics.add_rows(self._observed, 1)
+        return self._convert(row)
+
+    def fetchmany(self, size=1):
+        return self._fetched(self._raw.fetchmany(size))
+
+    def fetchall(self):
+        return self._fetched(self._raw.fetchall())
+
+    def __iter__(self):
+        if self._observed is not None:
+            return iter(self.fetchone, None)
+        if not self._dictionary:
+            return iter(self._raw)
+        columns = self._columns
+        return (dict(zip(columns, row)) for row in self._raw)
+
+    @property
+    def description(self):
+        return self._raw.description
+
+    @property
+    def rowcount(self):
+        return self._raw.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._raw.lastrowid
+
+    def close(self):
+        self._raw.close()
+
+
+class SQLitePreparedCursor(SQLiteCursor):
+    """A SQLiteCursor that counts its executions as prepared-statement executions."""
+
+    def execute(self, operation, params=None):
+        _count_statement('executions')
+        return super().execute(operation, params)
+
+
+_QUOTED = re.compile(r"('(?:[^'\\]|\\.|'')*')")
+_NOOP_STATEMENT = re.compile(r"^\s*(CREATE\s+DATABASE\b|USE\s+\w+)", re.IGNORECASE)
+_CREATE_TABLE = re.compile(r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\((.*)\)\s*;?\s*$",
+                           re.IGNORECASE | re.DOTALL)
+_ENUM_COLUMN = re.compile(r"(\w+)\s+ENUM\s*\(([^)]*)\)", re.IGNORECASE)
+_UNIQUE_KEY = re.compile(r"^UNIQUE\s+(?:KEY|INDEX)\s+(\w+)\s*\(([^)]*)\)$", re.IGNORECASE)
+_PLAIN_KEY = re.compile(r"^(?:KEY|INDEX)\s+(\w+)\s*\(([^)]*)\)$", re.IGNORECASE)
+_NAMED_UNIQUE = re.compile(r"CONSTRAINT\s+(\w+)\s+UNIQUE\s*\(([^)]*)\)", re.IGNORECASE)
+_INSERT_IGNORE = re.compile(r"\bINSERT\s+IGNORE\s+INTO\b", re.IGNORECASE)
+_INSERT_TABLE = re.compile(r"\bINSERT\s+(?:OR\s+IGNORE\s+)?INTO\s+(\w+)", re.IGNORECASE)
+_ON_DUPLICATE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.IGNORECASE)
+_VALUES_REF = re.compile(r"\bVALUES\s*\(\s*(\w+)\s*\)", re.IGNORECASE)
+_UNIQUE_FAILED = re.compile(r"UNIQUE constraint failed: (.+)$")
+
+
+class SQLiteDialect:
+    """
+    Rewrites the MySQL statements used by the application into SQLite, caching the result.
+
+    Handles the schema (ENUMs become CHECKed TEXT columns, inline UNIQUE KEY / KEY
+    clauses become constraints and indexes), %s placeholders, INSERT IGNORE and
+    ON DUPLICATE KEY UPDATE ... VALUES(col).
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._primary_keys = {}
+        self._unique_names = {}
+        self._lock = threading.Lock()
+
+    def translate(self, sql, raw_conn=None):
+        """
+        Translate one MySQL statement.
+
+        Returns:
+            list: Zero or more SQLite statements to run in order with the same parameters.
+        """
+        cached = self._cache.get(sql)
+        if cached is not None:
+            return cached
+        if _NOOP_STATEMENT.match(sql):
+            statements = []
+        else:
+            match = _CREATE_TABLE.match(_strip_comments(sql))
+            if match:
+                statements = self._translate_create_table(match.group(1), match.group(2))
+            else:
+                statements = [self._translate_dml(sql, raw_conn)]
+        with self._lock:
+            self._cache[sql] = statements
+        return statements
+
+    def _translate_create_table(self, table, body):
+        columns = []
+        indexes = []
+        for item in _split_top_level(body):
+            unique = _UNIQUE_KEY.match(item)
+            plain = _PLAIN_KEY.match(item)
+            if unique:
+                columns.append(f"CONSTRAINT {unique.group(1)} UNIQUE ({unique.group(2)})")
+            elif plain:
+                indexes.append(f"CREATE INDEX IF NOT EXISTS {plain.group(1)} ON {table} ({plain.group(2)})")
+            else:
+                columns.append(_ENUM_COLUMN.sub(lambda m: f"{m.group(1)} TEXT CHECK ({m.group(1)} IN ({m.group(2)}))", item))
+        create = f"CREATE TABLE IF NOT EXISTS {table} (\n    " + ",\n    ".join(columns) + "\n)"
+        return [create] + indexes
+
+    def _translate_dml(self, sql, raw_conn):
+        parts = _QUOTED.split(sql)
+        in_update_list = False
+        for i in range(0, len(parts), 2):
+            segment = parts[i].replace('%s', '?').replace('%%', '%')
+            segment = _INSERT_IGNORE.sub('INSERT OR IGNORE INTO', segment)
+            duplicate = _ON_DUPLICATE.search(segment)
+            if duplicate:
+                table = _INSERT_TABLE.search(sql).group(1)
+                target = ', '.join(self.primary_key(table, raw_conn))
+                assignments = _VALUES_REF.sub(r"excluded.\1", segment[duplicate.end():])
+                segment = f"{segment[:duplicate.start()]}ON CONFLICT ({target}) DO UPDATE SET{assignments}"
+                in_update_list = True
+            elif in_update_list:
+                segment = _VALUES_REF.sub(r"excluded.\1", segment)
+            parts[i] = segment
+        return ''.join(parts)
+
+    def primary_key(self, table, raw_conn):
+        """Return the primary-key column names of a table, read once from the database."""
+        key = self._primary_keys.get(table)
+        if key is None:
+            info = raw_conn.execute(f"PRAGMA table_info({table})").fetchall()
+            key = [row[1] for row in sorted(info, key=lambda r: r[5]) if row[5] > 0]
+            self._primary_keys[table] = key
+        return key
+
+    def unique_constraint_name(self, table, columns, raw_conn):
+        """Map a table and its unique column list back to the schema's constraint name."""
+        if table not in self._unique_names:
+            names = {tuple(self.primary_key(table, raw_conn)): 'PRIMARY'}
+            row = raw_conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+            for name, cols in _NAMED_UNIQUE.findall(row[0] if row else ''):
+                names[tuple(c.strip() for c in cols.split(','))] = name
+            self._unique_names[table] = names
+        return self._unique_names[table].get(tuple(columns))
+
+    def translate_error(self, err, operation, raw_conn=None):
+        """Convert a sqlite3 error into this module's exception types with MySQL errnos."""
+        msg = str(err)
+        if isinstance(err, sqlite3.IntegrityError):
+            unique = _UNIQUE_FAILED.search(msg)
+            if unique:
+                qualified = [c.strip() for c in unique.group(1).split(',')]
+                table = qualified[0].split('.')[0]
+                columns = [c.split('.', 1)[1] for c in qualified]
+                name = self.unique_constraint_name(table, columns, raw_conn) if raw_conn else None
+                return IntegrityError(f"Duplicate entry for key '{table}.{name or '_'.join(columns)}'",
+                                      errorcode.ER_DUP_ENTRY)
+            if 'FOREIGN KEY' in msg:
+                is_delete = operation is not None and operation.lstrip().upper().startswith('DELETE')
+                return IntegrityError(f"Foreign key constraint fails: {msg}",
+                                      errorcode.ER_ROW_IS_REFERENCED_2 if is_delete else errorcode.ER_NO_REFERENCED_ROW_2)
+            if 'CHECK constraint' in msg:
+                return IntegrityError(msg, errorcode.ER_CHECK_CONSTRAINT_VIOLATED)
+            if 'NOT NULL' in msg:
+                return IntegrityError(msg, errorcode.ER_BAD_NULL_ERROR)
+            return IntegrityError(msg)
+        if isinstance(err, sqlite3.OperationalError) and ('syntax error' in msg or 'no such' in msg):
+            return ProgrammingError(msg)
+        if isinstance(err, sqlite3.OperationalError):
+            return OperationalError(msg)
+        return DatabaseError(msg)
+
+
+def _strip_comments(sql):
+    return re.sub(r"--[^\n]*", "", sql)
+
+
+def _split_top_level(body):
+    # Split a CREATE TABLE body on commas that are not nested inside parentheses
+    items, depth, current = [], 0, []
+    for ch in body:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            items.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+    if ''.join(current).strip():
+        items.append(''.join(current).strip())
+    return [' '.join(item.split()) for item in items if item]
+
+
+def backend_from_env(mysql_config, default_sqlite_path):
+    """
+    Build the backend selected by UNIVERSITY_DB_BACKEND ('mysql', the default, or 'sqlite').
+
+    Parameters:
+        mysql_config (dict): Connection settings used when the backend is MySQL.
+        default_sqlite_path (str): Database file used when UNIVERSITY_DB_PATH is not set.
+    """
+    name = os.environ.get('UNIVERSITY_DB_BACKEND', 'mysql').strip().lower()
+    return make_backend(name, mysql_config=mysql_config,
+                        path=os.environ.get('UNIVERSITY_DB_PATH', default_sqlite_path))
+
+
+def make_backend(name, mysql_config=None, path=None, database='university'):
+    """Create a backend by name. database names the MySQL database; path the SQLite file."""
+    if name == 'mysql':
+        return MySQLBackend(mysql_config or {}, database)
+    if name == 'sqlite':
+        return SQLiteBackend(path or ':memory:')
+    raise ValueError(f"Unknown database backend: {name}. Must be one of: mysql, sqlite.")
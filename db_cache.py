@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class QueryCache:
+    """
+    A thread-safe, size-bounded (LRU) cache of query results with a time-to-live.
+
+    Entries are dropped explicitly with invalidate() by the code that changes the
+    underlying rows; the TTL only bounds staleness from writes made outside this
+    process (another GUI instance, the bulk loader, manual SQL).
+
+    Parameters:
+        maxsize (int): The maximum number of cached results; 0 disables caching.
+        ttl (float): Seconds a result may be served before it is loaded again.
+    """
+
+    def __init__(self, maxsize=256, ttl=300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'evictions': 0,
+            'invalidations': 0,
+        }
+
+    def get_or_load(self, key, load):
+        """
+        Return the cached value for key, calling load() to fill it on a miss.
+
+        Parameters:
+            key (tuple): Identifies the query and its arguments.
+            load (callable): Runs the query; its exceptions propagate and nothing is cached.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return entry[1]
+                del self._entries[key]
+                self._stats['expired'] += 1
+            self._stats['misses'] += 1
+            epoch = self._epoch
+        value = load()
+        with self._lock:
+            # A write that invalidated anything while we were loading may have made the
+            # value stale already; serve it this once but do not keep it.
+            if self.maxsize > 0 and epoch == self._epoch:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self._stats['evictions'] += 1
+        return value
+
+    def invalidate(self, *keys):
+        """Drop the given keys (missing ones are ignored)."""
+        with self._lock:
+            self._epoch += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._stats['invalidations'] += 1
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._epoch += 1
+            self._stats['invalidations'] += len(self._entries)
+            self._entries.clear()
+
+    def configure(self, maxsize=None, ttl=None):
+        """Change the bounds. Shrinking evicts the least recently used entries."""
+        with self._lock:
+            if maxsize is not None:
+                if maxsize < 0:
+                    raise ValueError("Cache size must not be negative.")
+                self.maxsize = maxsize
+            if ttl is not None:
+                self.ttl = ttl
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def stats(self):
+        """
+        Report cache usage counters.
+
+        Returns:
+            dict: Counters (hits, misses, expired, evictions, invalidations) plus the
+                  current size, maxsize, ttl and hit_rate.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            stats['maxsize'] = self.maxsize
+            stats['ttl'] = self.ttl
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+def cache_settings_from_env(default_size=256, default_ttl=300.0):
+    """Read the cache bounds from UNIVERSITY_DB_CACHE_SIZE and UNIVERSITY_DB_CACHE_TTL."""
+    try:
+        size = max(0, int(os.environ.get('UNIVERSITY_DB_CACHE_SIZE', default_size)))
+    except ValueError:
+        size = default_size
+    try:
+        ttl = max(0.0, float(os.environ.get('UNIVERSITY_DB_CACHE_TTL', default_ttl)))
+    except ValueError:
+        ttl = default_ttl
+    return size, ttl
@@ -0,0 +1,290 @@
+"""
+Statement-level instrumentation for the database backends.
+
+Every statement run through a backend cursor is timed. A sampled share of them is also
+attributed to the university_db (or other application) function that issued it and
+aggregated under its normalized SQL, with the number of rows it returned or changed
+and a rolling latency histogram. The time spent acquiring pooled connections is
+recorded per calling function the same way. Statements slower than a threshold are
+always written to the 'university_db.slow' logger, whether sampled or not.
+
+The cost when a statement is not sampled is two clock reads and a random number, so
+the instrumentation can stay on in production. It is configured from the environment:
+
+- UNIVERSITY_DB_METRICS         0 turns it off (default 1).
+- UNIVERSITY_DB_METRICS_SAMPLE  share of statements aggregated, 0..1 (default 1).
+- UNIVERSITY_DB_SLOW_MS         slow-statement threshold in milliseconds (default 200).
+- UNIVERSITY_DB_SLOW_LOG        file the slow statements are appended to (default: the
+                                logger only, which prints nothing unless configured).
+- UNIVERSITY_DB_METRICS_DUMP    file the statistics are written to as JSON at exit.
+"""
+import atexit
+import bisect
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is unbounded
+BUCKET_BOUNDS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+WINDOW_SECONDS = 60
+WINDOWS = 15          # the rolling histograms cover the last WINDOWS * WINDOW_SECONDS
+NORMALIZED_CACHE_SIZE = 1024
+
+ACQUIRE = '(connection acquire)'
+
+slow_log = logging.getLogger('university_db.slow')
+slow_log.addHandler(logging.NullHandler())
+
+# Frames in these modules are plumbing, not the caller being measured
+_PLUMBING = {'db_backends', 'db_cache', 'db_metrics', 'db_pool', 'explain_check'}
+
+_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\b\d+(?:\.\d+)?\b|%s|\?")
+_SPACE = re.compile(r"\s+")
+# A run of placeholders, e.g. an IN list
+_PLACEHOLDERS = re.compile(r"\?(?:\s*,\s*\?)+")
+# A parenthesized group repeated with OR or commas, e.g. key lookups and VALUES lists
+_REPEATED = re.compile(r"(\([^()]*\))(?:\s*(?:,|OR)\s*\1)+", re.IGNORECASE)
+
+
+def normalize(operation):
+    """Collapse whitespace, replace literals and placeholders with ?, and fold repeated groups."""
+    sql = _SPACE.sub(' ', operation).strip().rstrip(';').strip()
+    sql = _PLACEHOLDERS.sub('?, ...', _LITERAL.sub('?', sql))
+    return _REPEATED.sub(r"\1 ...", sql)
+
+
+def _caller(depth):
+    # The nearest public function outside the plumbing modules, as module.function,
+    # starting depth frames above the recording method
+    frame = sys._getframe(depth + 1)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        name = frame.f_code.co_name
+        if module not in _PLUMBING and not name.startswith(('_', '<')):
+            return f"{module}.{name}"
+        frame = frame.f_back
+    return '(unknown)'
+
+
+class _Entry:
+    """Aggregates for one (caller, statement) pair."""
+
+    __slots__ = ('count', 'errors', 'total', 'max', 'rows', 'windows')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.windows = deque(maxlen=WINDOWS)  # (window number, bucket counts)
+
+    def add(self, elapsed_ms, window, failed):
+        self.count += 1
+        self.errors += failed
+        self.total += elapsed_ms
+        if elapsed_ms > self.max:
+            self.max = elapsed_ms
+        if not self.windows or self.windows[-1][0] != window:
+            self.windows.append((window, [0] * (len(BUCKET_BOUNDS_MS) + 1)))
+        self.windows[-1][1][bisect.bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+
+    def summary(self, current_window):
+        buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        for window, counts in self.windows:
+            if window > current_window - WINDOWS:
+                for i, n in enumerate(counts):
+                    buckets[i] += n
+        recent = sum(buckets)
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_ms': round(self.total, 3),
+            'mean_ms': round(self.total / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max, 3),
+            'rows': self.rows,
+            'recent': recent,
+            'p50_ms': _bucket_percentile(buckets, recent, 0.50),
+            'p95_ms': _bucket_percentile(buckets, recent, 0.95),
+            'p99_ms': _bucket_percentile(buckets, recent, 0.99),
+            'histogram': {_bucket_label(i): n for i, n in enumerate(buckets) if n},
+        }
+
+
+def _bucket_label(i):
+    return f"<={BUCKET_BOUNDS_MS[i]}ms" if i < len(BUCKET_BOUNDS_MS) else f">{BUCKET_BOUNDS_MS[-1]}ms"
+
+
+def _bucket_percentile(buckets, total, fraction):
+    # The upper bound of the bucket holding the percentile (None past the last bound)
+    if not total:
+        return None
+    seen = 0
+    for i, n in enumerate(buckets):
+        seen += n
+        if seen >= fraction * total:
+            return BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else None
+    return None
+
+
+class StatementMetrics:
+    """
+    Thread-safe statement and connection-acquire statistics.
+
+    Parameters:
+        enabled (bool): Record anything at all.
+        sample_rate (float): Share of statements aggregated (slow ones are logged regardless).
+        slow_ms (float): Statements taking at least this long are logged to slow_log.
+    """
+
+    def __init__(self, enabled=True, sample_rate=1.0, slow_ms=200.0):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self._entries = {}       # (caller, normalized sql) -> _Entry
+        self._normalized = {}    # operation -> normalized sql
+        self._slow = 0
+        self._started = time.time()
+        self._lock = threading.Lock()
+
+    def statement(self, operation, started, rowcount=-1, failed=False):
+        """
+        Record a statement that began at time.perf_counter() value started.
+
+        Returns:
+            The aggregate to pass to add_rows() for the rows fetched afterwards, or None
+            if the statement was not sampled.
+        """
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if not self.enabled:
+            return None
+        sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+        slow = elapsed_ms >= self.slow_ms
+        if not (sampled or slow):
+            return None
+        caller = _caller(1)
+        sql = self._normalize(operation)
+        if slow:
+            with self._lock:
+                self._slow += 1
+            slow_log.warning("%.1f ms %s: %s", elapsed_ms, caller, sql)
+        if not sampled:
+            return None
+        return self._add(caller, sql, elapsed_ms, max(rowcount, 0), failed)
+
+    def acquire(self, started, failed=False):
+        """
+        Record a connection checkout that began at time.perf_counter() value started.
+
+        It is attributed to the caller of the function calling acquire(), i.e. of connect_to_db().
+        """
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if self.enabled and (self.sample_rate >= 1 or random.random() < self.sample_rate):
+            self._add(_caller(2), ACQUIRE, elapsed_ms, 0, failed)
+
+    def add_rows(self, entry, count):
+        """Add rows fetched for a sampled statement."""
+        with self._lock:
+            entry.rows += count
+
+    def _add(self, caller, sql, elapsed_ms, rows, failed):
+        window = int(time.time() // WINDOW_SECONDS)
+        with self._lock:
+            entry = self._entries.get((caller, sql))
+            if entry is None:
+                entry = self._entries[(caller, sql)] = _Entry()
+            entry.add(elapsed_ms, window, failed)
+            entry.rows += rows
+        return entry
+
+    def _normalize(self, operation):
+        sql = self._normalized.get(operation)
+        if sql is None:
+            sql = normalize(operation)
+            if len(self._normalized) >= NORMALIZED_CACHE_SIZE:
+                self._normalized.clear()
+            self._normalized[operation] = sql
+        return sql
+
+    def stats(self):
+        """
+        Report the statistics.
+
+        Returns:
+            dict: 'statements' and 'acquire', lists of per (caller, sql) summaries sorted by
+                  total time (count, errors, total/mean/max ms, rows, and p50/p95/p99 ms
+                  plus a histogram over the rolling window, whose sample count is 'recent'),
+                  and the settings, 'slow_statements' and 'since' (epoch seconds).
+        """
+        current_window = int(time.time() // WINDOW_SECONDS)
+        with self._lock:
+            summaries = [dict(caller=caller, sql=sql, **entry.summary(current_window))
+                         for (caller, sql), entry in self._entries.items()]
+            slow = self._slow
+        summaries.sort(key=lambda s: s['total_ms'], reverse=True)
+        return {
+            'statements': [s for s in summaries if s['sql'] != ACQUIRE],
+            'acquire': [s for s in summaries if s['sql'] == ACQUIRE],
+            'enabled': self.enabled,
+            'sample_rate': self.sample_rate,
+            'slow_ms': self.slow_ms,
+            'slow_statements': slow,
+            'window_seconds': WINDOW_SECONDS * WINDOWS,
+            'since': self._started,
+        }
+
+    def dump(self, path):
+        """Write stats() to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats(), f, indent=2)
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._entries.clear()
+            self._slow = 0
+            self._started = time.time()
+
+    def configure(self, enabled=None, sample_rate=None, slow_ms=None):
+        """Change the settings; None leaves a setting as it is."""
+        if sample_rate is not None and not 0 <= sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1.")
+        if enabled is not None:
+            self.enabled = enabled
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if slow_ms is not None:
+            self.slow_ms = slow_ms
+
+
+def metrics_from_env():
+    """Build the process-wide StatementMetrics from the UNIVERSITY_DB_METRICS* variables."""
+    enabled = os.environ.get('UNIVERSITY_DB_METRICS', '1').strip().lower() not in ('0', 'false', 'no', 'off')
+    try:
+        sample_rate = min(1.0, max(0.0, float(os.environ.get('UNIVERSITY_DB_METRICS_SAMPLE', 1.0))))
+    except ValueError:
+        sample_rate = 1.0
+    try:
+        slow_ms = float(os.environ.get('UNIVERSITY_DB_SLOW_MS', 200.0))
+    except ValueError:
+        slow_ms = 200.0
+    slow_path = os.environ.get('UNIVERSITY_DB_SLOW_LOG')
+    if slow_path:
+        handler = logging.FileHandler(slow_path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        slow_log.addHandler(handler)
+        slow_log.setLevel(logging.WARNING)
+    result = StatementMetrics(enabled, sample_rate, slow_ms)
+    dump_path = os.environ.get('UNIVERSITY_DB_METRICS_DUMP')
+    if dump_path:
+        atexit.register(result.dump, dump_path)
+    return result
+
+
+metrics = metrics_from_env()
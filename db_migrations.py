@@ -0,0 +1,292 @@
+"""
+Versioned schema migrations.
+
+Migrations live in the migrations/ directory as NNNN_description.sql files written in
+the MySQL dialect and are applied in version order. A migration that the SQLite
+translation cannot express gets a NNNN_description.sqlite.sql override next to it.
+Applied versions are recorded, with a checksum of the file, in the schema_version
+table, so an up-to-date database is checked with a single query.
+
+    python db_migrations.py status      # list applied and pending migrations
+    python db_migrations.py migrate     # apply pending migrations
+    python db_migrations.py rebuild     # recompute the stored section summaries and pass rates
+"""
+import hashlib
+import os
+import re
+import sys
+
+from db_backends import ProgrammingError
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), 'migrations')
+
+_FILE_NAME = re.compile(r'^(\d+)_(\w+?)(?:\.(\w+))?\.sql$')
+# Quoted literals and comments are skipped whole when splitting a file on ';'
+_SQL_TOKEN = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`|--[^\n]*|#[^\n]*|/\*.*?\*/|;",
+                        re.DOTALL)
+
+SCHEMA_VERSION_SQL = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    checksum CHAR(64) NOT NULL,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+class MigrationError(Exception):
+    """Raised when the migration files and the recorded schema history disagree, or a migration fails."""
+
+
+class Migration:
+    """One migration file, resolved for a particular dialect."""
+
+    def __init__(self, version, name, path):
+        self.version = version
+        self.name = name
+        self.path = path
+        with open(path, 'rb') as file:
+            # Normalise line endings so a checkout on another platform keeps the same checksum
+            self.sql = file.read().decode('utf-8').replace('\r\n', '\n')
+        self.checksum = hashlib.sha256(self.sql.encode('utf-8')).hexdigest()
+
+    def statements(self):
+        """Return the statements of the file, without comments."""
+        return split_statements(self.sql)
+
+    def __repr__(self):
+        return f"Migration({self.version}, {self.name!r})"
+
+
+def split_statements(sql):
+    """
+    Split a SQL script on the semicolons between statements.
+
+    Parameters:
+        sql (str): The script.
+
+    Returns:
+        list: The non-empty statements, with comments removed.
+    """
+    statements = []
+    current = []
+    position = 0
+    for match in _SQL_TOKEN.finditer(sql):
+        current.append(sql[position:match.start()])
+        token = match.group(0)
+        if token == ';':
+            statements.append(''.join(current))
+            current = []
+        elif token[0] in '\'"`':
+            current.append(token)
+        position = match.end()
+    current.append(sql[position:])
+    statements.append(''.join(current))
+    return [statement.strip() for statement in statements if statement.strip()]
+
+
+def discover(dialect='mysql', directory=MIGRATIONS_DIR):
+    """
+    Find the migrations in a directory, preferring dialect-specific overrides.
+
+    Parameters:
+        dialect (str): The backend name ('mysql' or 'sqlite').
+        directory (str): The migrations directory.
+
+    Returns:
+        list: Migration objects in version order.
+
+    Raises:
+        MigrationError: If two migrations share a version number.
+    """
+    chosen = {}
+    for file_name in sorted(os.listdir(directory)):
+        match = _FILE_NAME.match(file_name)
+        if not match:
+            continue
+        version, name, file_dialect = int(match.group(1)), match.group(2), match.group(3)
+        if file_dialect is not None and file_dialect != dialect:
+            continue
+        previous = chosen.get(version)
+        if previous is not None:
+            if previous[0] != name:
+                raise MigrationError(f"Migrations {previous[0]} and {name} share version {version}.")
+            if file_dialect is None:
+                continue  # The override has already been picked
+        chosen[version] = (name, os.path.join(directory, file_name))
+    return [Migration(version, name, path) for version, (name, path) in sorted(chosen.items())]
+
+
+def applied_versions(conn):
+    """
+    Read the recorded schema history.
+
+    Returns:
+        dict: version -> checksum, or None if the database has no schema_version table.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT version, checksum FROM schema_version ORDER BY version")
+        return {version: checksum for version, checksum in cursor.fetchall()}
+    except ProgrammingError:
+        return None
+    finally:
+        cursor.close()
+
+
+def _has_legacy_schema(conn):
+    # A database created by the old schema script has the tables but no history
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1 FROM Degree WHERE 1 = 0")
+        cursor.fetchall()
+        return True
+    except ProgrammingError:
+        return False
+    finally:
+        cursor.close()
+
+
+def pending(conn, migrations, applied=None):
+    """
+    Compare the recorded history with the migration files.
+
+    Parameters:
+        conn: An open connection.
+        migrations (list): Migration objects from discover().
+        applied (dict): The history from applied_versions(), if it has already been read.
+
+    Returns:
+        list: The migrations that still have to be applied, in order.
+
+    Raises:
+        MigrationError: If an applied migration was edited afterwards or is missing.
+    """
+    if applied is None:
+        applied = applied_versions(conn) or {}
+    known = {migration.version: migration for migration in migrations}
+    for version, checksum in applied.items():
+        migration = known.get(version)
+        if migration is None:
+            raise MigrationError(f"Database is at migration {version}, which does not exist in {MIGRATIONS_DIR}.")
+        if migration.checksum != checksum:
+            raise MigrationError(f"Migration {version} ({migration.name}) was changed after it was applied.")
+    return [migration for migration in migrations if migration.version not in applied]
+
+
+def _record(cursor, migration):
+    cursor.execute(
+        "INSERT INTO schema_version (version, name, checksum) VALUES (%s, %s, %s)",
+        (migration.version, migration.name, migration.checksum)
+    )
+
+
+def migrate(conn, dialect='mysql', migrations=None, verbose=True):
+    """
+    Bring the database schema up to date.
+
+    Each migration runs in its own transaction together with its schema_version row.
+    On SQLite a failed migration is rolled back completely; MySQL commits DDL
+    implicitly, so there a failure leaves the statements before it applied and the
+    migration unrecorded.
+
+    A database created by the old schema script (tables present, no schema_version)
+    is recorded as being at migration 1 before the rest are applied.
+
+    Parameters:
+        conn: An open connection.
+        dialect (str): The backend name, used to pick dialect-specific migration files.
+        migrations (list): Migration objects; discovered from MIGRATIONS_DIR when omitted.
+        verbose (bool): Print each migration as it is applied.
+
+    Returns:
+        list: The migrations that were applied.
+
+    Raises:
+        MigrationError: If the history does not match the files or a migration fails.
+    """
+    if migrations is None:
+        migrations = discover(dialect)
+    applied = applied_versions(conn)
+    if applied is not None:
+        todo = pending(conn, migrations, applied)
+        if not todo:
+            return []
+    cursor = conn.cursor()
+    try:
+        if applied is None:
+            cursor.execute(SCHEMA_VERSION_SQL)
+            if migrations and migrations[0].version == 1 and _has_legacy_schema(conn):
+                _record(cursor, migrations[0])
+                if verbose:
+                    print(f"Recorded the existing schema as migration 1 ({migrations[0].name}).")
+            conn.commit()
+            todo = pending(conn, migrations)
+
+        done = []
+        for migration in todo:
+            if verbose:
+                print(f"Applying migration {migration.version} ({migration.name})...")
+            try:
+                if getattr(conn, 'transactional_ddl', False):
+                    cursor.execute("BEGIN")
+                for statement in migration.statements():
+                    cursor.execute(statement)
+                _record(cursor, migration)
+                conn.commit()
+            except Exception as err:
+                conn.rollback()
+                raise MigrationError(f"Migration {migration.version} ({migration.name}) failed: {err}") from err
+            done.append(migration)
+        return done
+    finally:
+        cursor.close()
+
+
+def rebuild_derived(university_db):
+    """Recompute the stored per-section summaries and pass rates of every semester."""
+    try:
+        semesters = university_db.get_semesters()
+    except university_db.DatabaseUnavailableError as err:
+        print(f"Database Error: {err}")
+        return 2
+    for year, term in semesters:
+        summarized = university_db.rebuild_section_summaries(year, term)
+        rated = university_db.refresh_section_pass_rates(year, term)
+        print(f"{year} {term:<6}  {summarized} section summaries, {rated} pass rates")
+    return 0
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Apply or inspect the university database schema migrations.")
+    parser.add_argument('command', choices=['status', 'migrate', 'rebuild'],
+                        help="rebuild recomputes the stored section summaries and pass rates of every semester")
+    args = parser.parse_args(argv)
+
+    import university_db
+    if args.command == 'rebuild':
+        return rebuild_derived(university_db)
+    backend = university_db.get_backend()
+    conn, _ = backend.connect()
+    try:
+        migrations = discover(backend.name)
+        if args.command == 'migrate':
+            done = migrate(conn, backend.name, migrations)
+            print(f"Applied {len(done)} migration(s).")
+            return 0
+        todo = {migration.version for migration in pending(conn, migrations)}
+        for migration in migrations:
+            state = 'pending' if migration.version in todo else 'applied'
+            print(f"{migration.version:04d}  {migration.name:<30} {state}")
+        return 1 if todo else 0
+    except MigrationError as err:
+        print(f"Migration Error: {err}")
+        return 2
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+import os
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class PoolClosedError(Exception):
+    """Raised when a connection is requested from a pool that has been closed."""
+
+
+class PooledConnection:
+    """
+    A checked-out connection. Behaves like the underlying driver connection,
+    except that close() hands it back to the pool instead of disconnecting.
+    """
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+
+    def __getattr__(self, name):
+        if self._raw is None:
+            raise AttributeError(f"Connection already returned to the pool (accessing '{name}')")
+        return getattr(self._raw, name)
+
+    def close(self):
+        """Return the connection to the pool. Safe to call more than once."""
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool.checkin(raw)
+
+    def discard(self):
+        """Close the connection instead of returning it, e.g. when it holds unread results."""
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool._discard(raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class ConnectionPool:
+    """
+    A bounded, thread-safe pool of database connections.
+
+    Parameters:
+        connect (callable): Opens a new raw connection. Must raise on failure.
+        size (int): The maximum number of connections open at the same time.
+        timeout (float): Seconds to wait for a free connection before giving up.
+        ping_interval (float): Idle connections older than this many seconds are
+            pinged on checkout and replaced if the ping fails. 0 pings every time.
+    """
+
+    def __init__(self, connect, size=5, timeout=30.0, ping_interval=30.0):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        self._connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+        self._idle = deque()  # (raw, last_used) pairs, most recently used on the right
+        self._open = 0
+        self._cond = threading.Condition()
+        self._closed = False  # Set by close_all(); connections given back are then closed
+        self._stats = {
+            'checkouts': 0,
+            'checkins': 0,
+            'creations': 0,
+            'waits': 0,
+            'wait_time': 0.0,
+            'pings': 0,
+            'reconnects': 0,
+            'discarded': 0,
+            'timeouts': 0,
+        }
+
+    def checkout(self):
+        """
+        Take a connection from the pool, opening one if the pool is not full.
+
+        Returns:
+            PooledConnection: A live connection; call close() to give it back.
+        """
+        raw, last_used = self._reserve()
+        if raw is None:
+            raw = self._create()
+        elif time.monotonic() - last_used >= self.ping_interval:
+            raw = self._revive(raw)
+        with self._cond:
+            self._stats['checkouts'] += 1
+        return PooledConnection(self, raw)
+
+    def checkin(self, raw):
+        """Give a raw connection back to the pool, ending any open transaction."""
+        try:
+            if getattr(raw, 'in_transaction', True):
+                raw.rollback()
+        except Exception:
+            self._discard(raw)
+            return
+        with self._cond:
+            self._stats['checkins'] += 1
+            closed = self._closed
+            if closed:
+                self._open -= 1
+            else:
+                self._idle.append((raw, time.monotonic()))
+            self._cond.notify()
+        if closed:
+            _quiet_close(raw)
+
+    def stats(self):
+        """
+        Report pool usage counters.
+
+        Returns:
+            dict: Counters (checkouts, checkins, creations, waits, wait_time, pings,
+                  reconnects, discarded, timeouts) plus the current size, open,
+                  idle and in_use connection counts.
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats['size'] = self.size
+            stats['open'] = self._open
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = self._open - len(self._idle)
+        return stats
+
+    def resize(self, size):
+        """Change the maximum pool size. Surplus idle connections are closed."""
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        surplus = []
+        with self._cond:
+            self.size = size
+            while self._open > size and self._idle:
+                surplus.append(self._idle.popleft()[0])
+                self._open -= 1
+            self._cond.notify_all()
+        for raw in surplus:
+            _quiet_close(raw)
+
+    def close_all(self):
+        """
+        Shut the pool down: close every idle connection, close connections on checkin
+        instead of pooling them, and refuse further checkouts with PoolClosedError.
+        """
+        with self._cond:
+            self._closed = True
+            idle = [raw for raw, _ in self._idle]
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for raw in idle:
+            _quiet_close(raw)
+
+    def _reserve(self):
+        # Returns an idle (raw, last_used) pair, or (None, None) after reserving a
+        # slot for a brand-new connection. Blocks while the pool is exhausted, and
+        # raises PoolClosedError once close_all() has been called.
+        deadline = None
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolClosedError("The connection pool has been closed.")
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self.size:
+                    self._open += 1
+                    return None, None
+                if deadline is None:
+                    deadline = time.monotonic() + self.timeout
+                    self._stats['waits'] += 1
+                    started = time.monotonic()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    self._stats['wait_time'] += time.monotonic() - started
+                    raise PoolTimeoutError(f"No database connection available after {self.timeout} seconds.")
+                self._cond.wait(remaining)
+                if self._idle or self._open < self.size:
+                    self._stats['wait_time'] += time.monotonic() - started
+
+    def _create(self):
+        try:
+            raw = self._connect()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats['creations'] += 1
+        return raw
+
+    def _revive(self, raw):
+        # Ping an idle connection; transparently replace it if the server went away.
+        with self._cond:
+            self._stats['pings'] += 1
+        try:
+            if hasattr(raw, 'ping'):
+                raw.ping(reconnect=False)
+            return raw
+        except Exception:
+            _quiet_close(raw)
+            with self._cond:
+                self._stats['reconnects'] += 1
+            try:
+                raw = self._connect()
+            except Exception:
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._stats['creations'] += 1
+            return raw
+
+    def _discard(self, raw):
+        _quiet_close(raw)
+        with self._cond:
+            self._open -= 1
+            self._stats['discarded'] += 1
+            self._cond.notify()
+
+
+def _quiet_close(raw):
+    try:
+        raw.close()
+    except Exception:
+        pass
+
+
+def pool_size_from_env(default=5):
+    """Read the pool size from UNIVERSITY_DB_POOL_SIZE, falling back to default."""
+    try:
+        return max(1, int(os.environ.get('UNIVERSITY_DB_POOL_SIZE', default)))
+    except ValueError:
+        return default
@@ -0,0 +1,326 @@
+"""
+Check that every query issued by university_db is served by an index.
+
+Usage:
+    python explain_check.py [--backend sqlite|mysql] [--path FILE] [--database NAME] [--verbose]
+
+Builds a scratch database (an in-memory SQLite database by default, or the MySQL
+database named by --database, which must not be the real one), seeds it with a few
+thousand sections, then drives every university_db function that talks to the database
+while recording the statements they execute. Each distinct statement is EXPLAINed with
+the parameters it was first run with. The check fails if any plan reads a whole table,
+or if a function that executes SQL was not exercised (so new queries cannot slip by).
+"""
+import argparse
+import ast
+import inspect
+import random
+import re
+import sys
+
+import university_db
+
+SEED_DEGREES = 10
+SEED_GOALS_PER_DEGREE = 5
+SEED_COURSES = 100
+SEED_INSTRUCTORS = 30
+SEED_YEARS = range(2015, 2025)
+
+_EXPLAINABLE = re.compile(r'^\s*(SELECT|INSERT|UPDATE|DELETE|REPLACE)\b', re.IGNORECASE)
+
+
+class _RecordingCursor:
+    """Cursor wrapper that logs (calling function, statement, parameters) before executing."""
+
+    def __init__(self, cursor, log):
+        self._cursor = cursor
+        self._log = log
+
+    def execute(self, operation, params=None):
+        self._log.append((sys._getframe(1).f_code.co_name, operation, params))
+        return self._cursor.execute(operation, params)
+
+    def executemany(self, operation, seq_params):
+        seq_params = list(seq_params)
+        self._log.append((sys._getframe(1).f_code.co_name, operation, seq_params[0] if seq_params else None))
+        return self._cursor.executemany(operation, seq_params)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _RecordingConnection:
+    def __init__(self, conn, log):
+        self._conn = conn
+        self._log = log
+
+    def cursor(self, *args, **kwargs):
+        return _RecordingCursor(self._conn.cursor(*args, **kwargs), self._log)
+
+    def prepared(self, *args, **kwargs):
+        return _RecordingCursor(self._conn.prepared(*args, **kwargs), self._log)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def seed(conn, rng):
+    """
+    Fill an empty database with enough rows that the planner prefers indexes over scans.
+
+    Returns:
+        dict: Sample keys (degree, goal, course, section, semester, instructor) for the workload.
+    """
+    cursor = conn.cursor()
+    degrees = [f"D{i:02d}" for i in range(SEED_DEGREES)]
+    cursor.executemany("INSERT INTO Degree (degreeID, name, level) VALUES (%s, %s, %s)",
+                       [(d, f"Program {chr(65 + i)}", 'BS') for i, d in enumerate(degrees)])
+    goals = [f"G{g:03d}" for g in range(1, SEED_GOALS_PER_DEGREE + 1)]
+    cursor.executemany("INSERT INTO Goal (goalCode, degreeID, description) VALUES (%s, %s, %s)",
+                       [(g, d, f"Goal {g} of {d}") for d in degrees for g in goals])
+    courses = [f"CS{1000 + i}" for i in range(SEED_COURSES)]
+    cursor.executemany("INSERT INTO Course (courseNumber, name) VALUES (%s, %s)",
+                       [(c, f"Course {c}") for c in courses])
+    instructors = [f"{10000000 + i}" for i in range(SEED_INSTRUCTORS)]
+    cursor.executemany("INSERT INTO Instructor (instructorID, name) VALUES (%s, %s)",
+                       [(i, f"Instructor {i}") for i in instructors])
+    semesters = [(year, term) for year in SEED_YEARS for term in university_db.VALID_TERMS]
+    cursor.executemany("INSERT INTO Semester (year, term) VALUES (%s, %s)", semesters)
+    cursor.executemany("INSERT INTO Course_Degree (degreeID, courseNumber, isCore) VALUES (%s, %s, %s)",
+                       [(degrees[(i + k * 3) % SEED_DEGREES], c, k == 0)
+                        for i, c in enumerate(courses) for k in range(2)])
+    sections = []
+    for year, term in semesters:
+        for course in courses:
+            if rng.random() < 0.5:
+                for section_id in ('001', '002')[:rng.randint(1, 2)]:
+                    sections.append((course, section_id, year, term, rng.choice(instructors), rng.randint(10, 60)))
+    cursor.executemany("""
+        INSERT INTO Section (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+        VALUES (%s, %s, %s, %s, %s, %s)
+    """, sections)
+    for year, term in semesters:
+        university_db.scaffold_semester(cursor, year, term)
+    cursor.execute("SELECT courseNumber, sectionID, year, term, degreeID, goalCode FROM Evaluation")
+    keys = cursor.fetchall()
+    graded = []
+    for key in rng.sample(keys, len(keys) // 2):
+        note = 'Review the labs' if rng.random() < 0.2 else None
+        graded.append(('Quiz', rng.randint(0, 10), rng.randint(0, 10), rng.randint(0, 10), rng.randint(0, 10), note) + tuple(key))
+    cursor.executemany("""
+        UPDATE Evaluation
+        SET evaluationType = %s, gradeCountA = %s, gradeCountB = %s, gradeCountC = %s, gradeCountF = %s, improvementNote = %s
+        WHERE courseNumber = %s AND sectionID = %s AND year = %s AND term = %s AND degreeID = %s AND goalCode = %s
+    """, graded)
+    for section in sections:
+        university_db.refresh_section_summary(cursor, *section[:4])
+    conn.commit()
+
+    course, section_id, year, term, instructor, _ = sections[len(sections) // 2]
+    cursor.execute("SELECT degreeID FROM Course_Degree WHERE courseNumber = %s", (course,))
+    degree = cursor.fetchall()[0][0]
+    cursor.close()
+    return {
+        'degree': degree, 'goals': goals, 'course': course, 'section': section_id,
+        'year': year, 'term': term, 'instructor': instructor,
+    }
+
+
+def analyze(conn, backend_name):
+    """Refresh the planner statistics after seeding."""
+    cursor = conn.cursor()
+    if backend_name == 'sqlite':
+        cursor.execute("ANALYZE")
+    else:
+        cursor.execute("ANALYZE TABLE Degree, Course, Semester, Instructor, Course_Degree, Goal, Section, Evaluation, SectionPassRate")
+        cursor.fetchall()
+    cursor.close()
+
+
+def run_workload(k):
+    """
+    Call every university_db function that issues SQL, using the seeded keys.
+
+    Returns:
+        list: The errors raised by calls that failed.
+    """
+    year, term = k['year'], k['term']
+    calls = [
+        (university_db.add_degree, ('DNEW', 'Program New', 'BS')),
+        (university_db.add_course, ('CS2000', 'New Course')),
+        (university_db.add_instructor, ('20000000', 'New Instructor')),
+        (university_db.add_goal, ('G010', k['degree'], 'New goal')),
+        (university_db.add_semester, ('2025', 'Spring')),
+        (university_db.add_course_degree, ('CS2000', k['degree'], 1)),
+        (university_db.add_section, ('CS2000', '001', '2025', 'Spring', '20000000', '25')),
+        (university_db.add_course_to_semester, ('CS2000', '002', '2025', 'Spring', '20000000', 25)),
+        (university_db.add_goal, ('G011', k['degree'], 'Goal added after the sections')),
+        (university_db.associate_course_with_goal, ('CS2000', k['degree'], 'G011')),
+        (university_db.scaffold_semester_evaluations, ('2025', 'Spring')),
+        (university_db.update_evaluation, (k['course'], k['section'], year, term, k['degree'], k['goals'][0],
+                                           'Quiz', 5, 4, 3, 2, 'More practice')),
+        (university_db.update_evaluations_batch, ([(k['course'], k['section'], year, term, k['degree'], goal,
+                                                    'Quiz', 5, 4, 3, 2, None) for goal in k['goals'][1:3]],)),
+        (university_db.refresh_section_pass_rates, (year, term)),
+        (university_db.rebuild_section_summaries, (year, term)),
+        (university_db.get_semesters, ()),
+        (university_db.get_available_courses_for_semester, (str(year), term)),
+        (university_db.get_evaluation_status_for_semester, (year, term)),
+        (university_db.get_evaluation_status_for_sections, ([(k['course'], k['section'], year, term),
+                                                             (k['course'], '999', year, term)],)),
+    ]
+    calls += [(university_db.get_sections_above_percentage, (year, term, 50, rule))
+              for rule in university_db.PASS_RATE_RULES]
+    calls += [
+        (university_db.get_sections_above_percentage, (year, term, 50, university_db.STORED_PASS_RATE_RULE, True)),
+        (university_db.get_sections_for_instructor, (year, term, k['instructor'])),
+        (university_db.get_evaluations_for_section, (k['course'], k['section'], year, term)),
+        (university_db.get_degrees_for_course, (k['course'],)),
+        (university_db.get_degree_courses, (k['degree'],)),
+        (university_db.get_degree_goals, (k['degree'],)),
+        (university_db.get_courses_for_goals, (k['degree'], k['goals'][:2])),
+        (university_db.get_improvement_notes, (k['course'], k['section'])),
+        (university_db.get_course_sections_in_range, (k['course'], 2018, 'Fall', 2021, 'Spring')),
+        (university_db.get_instructor_sections_in_range, (k['instructor'], 2018, 'Fall', 2021, 'Spring')),
+        (university_db.get_evaluation_status_for_semesters, ([(2018, 'Fall'), (year, term), (2021, 'Spring')],)),
+        (university_db.get_sections_above_percentage_for_semesters, ([(2018, 'Fall'), (year, term)], 50)),
+        (university_db.get_sections_for_instructors, ([(2018, 'Fall'), (year, term)], [k['instructor'], '20000000'])),
+        (university_db.get_degree_courses_for_degrees, ([k['degree'], 'DNEW'],)),
+        (university_db.iter_evaluation_status_for_semester, (year, term)),
+        (university_db.iter_sections_above_percentage, (year, term, 50)),
+        (university_db.iter_sections_for_instructor, (year, term, k['instructor'])),
+        (university_db.iter_course_sections_in_range, (k['course'], 2018, 'Fall', 2021, 'Spring')),
+        (university_db.iter_instructor_sections_in_range, (k['instructor'], 2018, 'Fall', 2021, 'Spring')),
+        (university_db.page_evaluation_status_for_semester, (year, term, 1)),
+        (university_db.page_sections_for_instructor, (year, term, k['instructor'], 1)),
+        (university_db.page_course_sections_in_range, (k['course'], 2018, 'Fall', 2021, 'Spring', 1)),
+        (university_db.page_instructor_sections_in_range, (k['instructor'], 2018, 'Fall', 2021, 'Spring', 1)),
+    ]
+    errors = []
+    for func, args in calls:
+        try:
+            result = func(*args)
+            if inspect.isgenerator(result):
+                list(result)  # Streaming variants only query as they are consumed
+            elif func.__name__.startswith('page_') and result[1] is not None:
+                func(*args, page_token=result[1])  # Later pages use the keyset form of the query
+        except (university_db.UniversityDBError, university_db.DatabaseError) as err:
+            errors.append(f"{func.__name__}: {err}")
+    return errors
+
+
+def query_functions():
+    """Return the names of the top-level university_db functions that execute SQL themselves."""
+    with open(university_db.__file__) as file:
+        tree = ast.parse(file.read())
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            for call in ast.walk(node):
+                if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                        and call.func.attr in ('execute', 'executemany')):
+                    names.add(node.name)
+                    break
+    return names
+
+
+def explain(conn, backend_name, operation, params):
+    """
+    EXPLAIN one statement.
+
+    Returns:
+        tuple: (full table scans, full index scans, plan lines), each a list of strings.
+    """
+    cursor = conn.cursor(dictionary=True)
+    scans, index_scans, lines = [], [], []
+    try:
+        if backend_name == 'sqlite':
+            cursor.execute("EXPLAIN QUERY PLAN " + operation, params)
+            for row in cursor.fetchall():
+                detail = row['detail']
+                lines.append(detail)
+                if detail.startswith('SCAN ') and 'CONSTANT ROW' not in detail and '(' not in detail:
+                    (index_scans if 'USING' in detail else scans).append(detail)
+        else:
+            cursor.execute("EXPLAIN " + operation, params)
+            for row in cursor.fetchall():
+                lines.append(f"{row['table']}: type={row['type']} key={row['key']} rows={row['rows']} {row['Extra'] or ''}")
+                table = row['table'] or ''
+                if table.startswith('<'):
+                    continue
+                if row['type'] == 'ALL':
+                    scans.append(f"full scan of {table}")
+                elif row['type'] == 'index':
+                    index_scans.append(f"full index scan of {table} ({row['key']})")
+    finally:
+        cursor.close()
+    return scans, index_scans, lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail if any university_db query needs a full table scan.")
+    parser.add_argument('--backend', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--path', default=':memory:', help="SQLite database file (default: in memory)")
+    parser.add_argument('--database', default='university_explain',
+                        help="scratch MySQL database, created and seeded by this tool")
+    parser.add_argument('--verbose', action='store_true', help="print every plan")
+    args = parser.parse_args(argv)
+    if args.backend == 'mysql' and args.database == 'university':
+        parser.error("refusing to seed the application database; pass a scratch --database")
+
+    university_db.configure_backend(args.backend, path=args.path, database=args.database)
+    connect = university_db.connect_to_db
+    conn = connect()
+    if not conn:
+        return 2
+    try:
+        keys = seed(conn, random.Random(0))
+        analyze(conn, args.backend)
+    finally:
+        conn.close()
+
+    log = []
+    university_db.connect_to_db = lambda *a, **kw: _RecordingConnection(connect(*a, **kw), log)
+    try:
+        errors = run_workload(keys)
+    finally:
+        university_db.connect_to_db = connect
+    for error in errors:
+        print(f"workload error: {error}")
+
+    failures = 0
+    seen = set()
+    conn = connect()
+    try:
+        for caller, operation, params in log:
+            if operation in seen or not _EXPLAINABLE.match(operation):
+                continue
+            seen.add(operation)
+            scans, index_scans, lines = explain(conn, args.backend, operation, params)
+            summary = ' '.join(operation.split())
+            status = 'SCAN' if scans else 'ok'
+            print(f"[{status:4}] {caller}: {summary[:90]}")
+            for detail in scans:
+                print(f"         full table scan: {detail}")
+            for detail in index_scans:
+                print(f"         note: full index scan: {detail}")
+            if args.verbose:
+                for line in lines:
+                    print(f"         | {line}")
+            failures += bool(scans)
+        conn.rollback()
+    finally:
+        conn.close()
+
+    missed = sorted(query_functions() - {caller for caller, _, _ in log})
+    for name in missed:
+        print(f"[MISS] {name}: not exercised by the workload; add it to run_workload()")
+    print(f"{len(seen)} statements checked, {failures} with full table scans, {len(missed)} functions not exercised.")
+    return 1 if failures or missed or errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
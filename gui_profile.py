@@ -0,0 +1,328 @@
+"""
+Opt-in latency profiling of the GUI's event handlers.
+
+A profiled handler (a button command or selection callback decorated with
+profiler.handler) starts an invocation that lasts until the last piece of work it set
+off has run: the database calls it hands to the BackgroundWorker, the callbacks that
+receive their results, and the chunked Treeview fills those start. Its wall time is
+split into phases:
+
+- db       the work run on a worker thread (the university_db calls and what they return),
+- compute  the handler and result callbacks on the Tk thread,
+- render   the widget updates, marked with profiler.phase('render'),
+- wait     the rest: queueing for a worker thread and the polling delay.
+
+Message boxes are modal, so time spent looking at one is counted in the phase that
+showed it. Work that is dropped before it runs (a request superseded by a newer one, a
+table fill cut short by the next) must be released with profiler.cancel(); the
+invocation then finishes without it and is recorded with cancelled set to true.
+
+Profiling is configured from the environment:
+
+- UNIVERSITY_DB_PROFILE      off by default; 1 records the phases, and a comma-separated
+                             list may add cprofile and/or tracemalloc, e.g. cprofile,tracemalloc.
+- UNIVERSITY_DB_PROFILE_DIR  the directory written to (default 'profiles').
+
+Every invocation appends a line to handlers.jsonl in that directory. With cprofile, its
+calls on all threads are written to NNNN-<handler>.prof (read with `python -m pstats`);
+with tracemalloc, the allocations it left behind go to NNNN-<handler>.tracemalloc.txt.
+"""
+import contextlib
+import cProfile
+import functools
+import itertools
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+PHASES = ('db', 'compute', 'render')
+DEFAULT_DIRECTORY = 'profiles'
+TRACEMALLOC_FRAMES = 10
+TOP_ALLOCATIONS = 25
+
+
+class _Invocation:
+    """The phase times and profiles of one handler invocation."""
+
+    def __init__(self, name, number):
+        self.name = name
+        self.number = number
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.db_calls = 0
+        self.pending = 1           # the handler itself, then every bound callback
+        self.cancelled = 0         # bound callbacks released without running
+        self.profiles = {}         # thread ident -> cProfile.Profile
+        self.unprofiled = 0        # segments another active profiler kept from being profiled
+        self.snapshot = None
+        self.lock = threading.Lock()
+
+    def add(self, phase, seconds):
+        with self.lock:
+            self.phases[phase] += seconds
+
+
+class _Bound:
+    # A callable tied to an invocation by HandlerProfiler.bind(). Its first run, or a
+    # cancel() before that, releases it from the invocation; a later run is not timed.
+    def __init__(self, profiler, invocation, phase, func):
+        functools.update_wrapper(self, func)
+        self._profiler = profiler
+        self._invocation = invocation
+        self._phase = phase
+        self._func = func
+        self._settled = False
+        self._lock = threading.Lock()
+
+    def _settle(self):
+        with self._lock:
+            settled, self._settled = self._settled, True
+        return not settled
+
+    def __call__(self, *args, **kwargs):
+        if not self._settle():
+            return self._func(*args, **kwargs)
+        return self._profiler._run(self._invocation, self._phase, self._func, args, kwargs)
+
+    def cancel(self):
+        if self._settle():
+            with self._invocation.lock:
+                self._invocation.cancelled += 1
+            self._profiler._release(self._invocation)
+
+
+class _Phase(contextlib.ContextDecorator):
+    # Usable both as a context manager and as a decorator; a no-op outside an invocation
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        profiler = self._profiler
+        invocation = profiler.current()
+        if invocation is not None:
+            profiler._enter(invocation, self._name)
+        profiler._entered().append(invocation is not None)
+        return self
+
+    def __exit__(self, *exc):
+        if self._profiler._entered().pop():
+            self._profiler._exit()
+        return False
+
+
+class _NoPhase(contextlib.ContextDecorator):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+class HandlerProfiler:
+    """
+    Times GUI handler invocations by phase and writes them to a profile directory.
+
+    Parameters:
+        enabled (bool): Profile at all; when False the decorators return functions unchanged.
+        directory (str): Where handlers.jsonl and the per-invocation files are written.
+        cprofile (bool): Write a cProfile dump per invocation.
+        trace_memory (bool): Write the tracemalloc allocation differences per invocation.
+    """
+
+    def __init__(self, enabled=False, directory=DEFAULT_DIRECTORY, cprofile=False, trace_memory=False):
+        self.enabled = enabled
+        self.directory = directory
+        self.cprofile = enabled and cprofile
+        self.trace_memory = enabled and trace_memory
+        self._numbers = itertools.count(1)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+    def handler(self, func):
+        """Decorate a GUI callback so that each call starts a profiled invocation."""
+        if not self.enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            invocation = _Invocation(func.__name__, next(self._numbers))
+            if self.trace_memory:
+                invocation.snapshot = tracemalloc.take_snapshot()
+            return self._run(invocation, 'compute', func, args, kwargs)
+        return wrapper
+
+    def current(self):
+        """The invocation being run on this thread, or None."""
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1][0] if stack else None
+
+    def phase(self, name):
+        """
+        Attribute the time spent in a block (or decorated function) to a phase of the
+        current invocation, if there is one.
+        """
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name)
+
+    def bind(self, func, phase):
+        """
+        Tie a callable that will run later, possibly on another thread, to the current
+        invocation: its run is timed as the given phase, and the invocation is only
+        complete once it has run, or has been given to cancel() because it never will.
+        Returns func itself outside an invocation.
+        """
+        invocation = self.current() if self.enabled else None
+        if invocation is None:
+            return func
+        with invocation.lock:
+            invocation.pending += 1
+            if phase == 'db':
+                invocation.db_calls += 1
+        return _Bound(self, invocation, phase, func)
+
+    def cancel(self, *funcs):
+        """
+        Release callables returned by bind() that will not run, e.g. a superseded
+        request's callbacks. Ones that already ran, and plain functions, are ignored.
+        """
+        for func in funcs:
+            if isinstance(func, _Bound):
+                func.cancel()
+
+    def _run(self, invocation, phase, func, args, kwargs):
+        self._enter(invocation, phase)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._exit()
+            self._release(invocation)
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _entered(self):
+        entered = getattr(self._local, 'entered', None)
+        if entered is None:
+            entered = self._local.entered = []
+        return entered
+
+    def _enter(self, invocation, phase):
+        # Nested segments pause the enclosing one, so no time is counted twice
+        stack = self._stack()
+        now = time.perf_counter()
+        if stack:
+            self._pause(stack[-1], now)
+        segment = [invocation, phase, now]
+        stack.append(segment)
+        self._resume(segment)
+
+    def _exit(self):
+        stack = self._stack()
+        now = time.perf_counter()
+        self._pause(stack.pop(), now)
+        if stack:
+            stack[-1][2] = now
+            self._resume(stack[-1])
+
+    def _pause(self, segment, now):
+        invocation, phase, started = segment
+        invocation.add(phase, now - started)
+        profile = invocation.profiles.get(threading.get_ident())
+        if profile is not None and getattr(profile, 'active', False):
+            profile.disable()
+            profile.active = False
+
+    def _resume(self, segment):
+        if not self.cprofile:
+            return
+        invocation = segment[0]
+        profile = invocation.profiles.get(threading.get_ident())
+        if profile is None:
+            profile = invocation.profiles[threading.get_ident()] = cProfile.Profile()
+        try:
+            profile.enable()
+            profile.active = True
+        except ValueError:
+            # Python 3.12+ allows one active profiler at a time
+            invocation.unprofiled += 1
+
+    def _release(self, invocation):
+        with invocation.lock:
+            invocation.pending -= 1
+            finished = invocation.pending == 0
+        if finished:
+            self._finish(invocation)
+
+    def _finish(self, invocation):
+        wall = time.perf_counter() - invocation.started
+        base = f"{invocation.number:04d}-{invocation.name}"
+        record = {
+            'handler': invocation.name,
+            'invocation': invocation.number,
+            'started': invocation.started_at,
+            'wall_ms': round(wall * 1000, 3),
+        }
+        for phase, seconds in invocation.phases.items():
+            record[f"{phase}_ms"] = round(seconds * 1000, 3)
+        record['wait_ms'] = round(max(0.0, wall - sum(invocation.phases.values())) * 1000, 3)
+        record['db_calls'] = invocation.db_calls
+        record['cancelled'] = invocation.cancelled > 0
+        files = []
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Memory first, before writing the profile allocates anything
+            if invocation.snapshot is not None:
+                path = os.path.join(self.directory, base + '.tracemalloc.txt')
+                self._write_allocations(path, invocation.snapshot)
+                files.append(path)
+            if invocation.profiles:
+                path = os.path.join(self.directory, base + '.prof')
+                pstats.Stats(*invocation.profiles.values()).dump_stats(path)
+                files.append(path)
+            if invocation.unprofiled:
+                record['unprofiled_segments'] = invocation.unprofiled
+            record['files'] = files
+            with self._write_lock:
+                with open(os.path.join(self.directory, 'handlers.jsonl'), 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + '\n')
+        except OSError as err:
+            print(f"Profile Error: {err}")
+
+    def _write_allocations(self, path, before):
+        # The profiling machinery's own allocations are not the handler's
+        ignore = [tracemalloc.Filter(False, module.__file__) for module in (tracemalloc, cProfile, pstats)]
+        ignore += [tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, '<frozen importlib._bootstrap>')]
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+        differences = after.compare_to(before.filter_traces(ignore), 'lineno')
+        current, peak = tracemalloc.get_traced_memory()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"traced now {current} B, peak {peak} B\n")
+            for difference in differences[:TOP_ALLOCATIONS]:
+                f.write(f"{difference}\n")
+
+
+def profiler_from_env():
+    """Build the process-wide HandlerProfiler from UNIVERSITY_DB_PROFILE and UNIVERSITY_DB_PROFILE_DIR."""
+    options = {option.strip().lower() for option in os.environ.get('UNIVERSITY_DB_PROFILE', '').split(',')}
+    options -= {'', '0', 'false', 'no', 'off'}
+    return HandlerProfiler(enabled=bool(options),
+                           directory=os.environ.get('UNIVERSITY_DB_PROFILE_DIR', DEFAULT_DIRECTORY),
+                           cprofile='cprofile' in options,
+                           trace_memory='tracemalloc' in options)
+
+
+profiler = profiler_from_env()
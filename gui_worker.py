@@ -0,0 +1,163 @@
+"""
+Run blocking work off the Tk mainloop thread.
+
+Tk widgets may only be touched from the thread running mainloop(), so database calls
+are handed to a small thread pool and their outcomes come back through a queue that
+the Tk thread drains with root.after(). Callbacks therefore always run on the Tk
+thread and may update widgets or show message boxes directly.
+"""
+import itertools
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+# About one frame at 60 fps; draining an empty queue costs next to nothing
+POLL_INTERVAL_MS = 16
+
+
+class BackgroundWorker:
+    """
+    Runs functions on worker threads and delivers their outcomes on the Tk thread.
+
+    Every request belongs to a channel (any hashable, typically the button or view it
+    serves). Submitting a new request on a channel supersedes the previous one: it is
+    cancelled if it has not started yet, and its outcome is discarded otherwise, so a
+    view only ever shows the result of the latest request made for it.
+
+    Parameters:
+        root (tk.Misc): A widget whose after() schedules the polling.
+        max_workers (int): The number of worker threads.
+        on_busy (callable): Called on the Tk thread with the number of requests in
+                            flight whenever that number changes.
+        poll_interval (int): Milliseconds between polls of the result queue.
+    """
+
+    def __init__(self, root, max_workers=2, on_busy=None, poll_interval=POLL_INTERVAL_MS):
+        self.root = root
+        self.on_busy = on_busy
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='gui-worker')
+        self._results = queue.Queue()
+        self._tickets = itertools.count(1)
+        self._pending = {}   # ticket -> (channel, widgets, on_done, on_cancel, future)
+        self._latest = {}    # channel -> ticket of the request whose outcome is wanted
+        self._disabled = {}  # widget -> number of pending requests holding it disabled
+        self._poll_job = None
+        self._busy = 0
+        self._closed = False
+
+    def submit(self, channel, func, args=(), on_done=None, widgets=(), on_cancel=None):
+        """
+        Run func(*args) on a worker thread.
+
+        Parameters:
+            channel: Identifies what the request is for; supersedes the channel's previous request.
+            func (callable): The blocking work. It must not touch any widget.
+            args (tuple): Its arguments.
+            on_done (callable): Called on the Tk thread as on_done(ok, value), where value is
+                                the return value, or the exception raised when ok is False.
+            widgets (tuple): ttk widgets to disable until the request finishes.
+            on_cancel (callable): Called on the Tk thread, without arguments, instead of
+                                  on_done if the request is superseded or shut down.
+                                  func has not run if the request had not started.
+
+        Returns:
+            int: A ticket identifying the request, or None once the worker is shut down.
+        """
+        if self._closed:
+            return None
+        self.cancel(channel)
+        ticket = next(self._tickets)
+        self._latest[channel] = ticket
+        self._hold(widgets)
+        future = self._executor.submit(self._run, ticket, func, args)
+        self._pending[ticket] = (channel, widgets, on_done, on_cancel, future)
+        self._update_busy()
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_interval, self._poll)
+        return ticket
+
+    def cancel(self, channel):
+        """Supersede the channel's request, if any, without submitting a new one."""
+        ticket = self._latest.pop(channel, None)
+        if ticket is None or ticket not in self._pending:
+            return
+        on_cancel, future = self._pending[ticket][3:]
+        if future.cancel():
+            # Never started, so nothing will arrive on the queue for it
+            self._finish(ticket)
+        # A request that is already running cannot be interrupted; its outcome is
+        # dropped when it arrives because it is no longer the channel's latest.
+        if on_cancel is not None:
+            on_cancel()
+
+    def is_busy(self, channel=None):
+        """Return True if a request (on the given channel, or on any) is in flight."""
+        if channel is None:
+            return bool(self._pending)
+        return channel in self._latest
+
+    def shutdown(self):
+        """Stop polling and cancel queued requests; running ones finish in the background."""
+        self._closed = True
+        for channel in list(self._latest):
+            self.cancel(channel)
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, ticket, func, args):
+        # Worker thread: never touch Tk here, only hand the outcome over
+        try:
+            outcome = (True, func(*args))
+        except Exception as e:
+            outcome = (False, e)
+        self._results.put((ticket, outcome))
+
+    def _poll(self):
+        self._poll_job = None
+        try:
+            while True:
+                try:
+                    ticket, (ok, value) = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                channel, _, on_done = self._finish(ticket)
+                if self._latest.get(channel) != ticket:
+                    continue  # Superseded while it ran
+                del self._latest[channel]
+                if on_done is not None:
+                    on_done(ok, value)
+        finally:
+            # Keep polling even if a callback raised (Tk reports the error itself);
+            # a callback may also have submitted, and thereby scheduled, a new request.
+            if self._pending and self._poll_job is None and not self._closed:
+                self._poll_job = self.root.after(self.poll_interval, self._poll)
+
+    def _finish(self, ticket):
+        channel, widgets, on_done, _, _ = self._pending.pop(ticket)
+        self._release(widgets)
+        self._update_busy()
+        return channel, widgets, on_done
+
+    def _hold(self, widgets):
+        for widget in widgets:
+            count = self._disabled.get(widget, 0)
+            if count == 0:
+                widget.state(['disabled'])
+            self._disabled[widget] = count + 1
+
+    def _release(self, widgets):
+        for widget in widgets:
+            count = self._disabled.pop(widget) - 1
+            if count:
+                self._disabled[widget] = count
+            else:
+                widget.state(['!disabled'])
+
+    def _update_busy(self):
+        busy = len(self._pending)
+        if busy != self._busy:
+            self._busy = busy
+            if self.on_busy is not None:
+                self.on_busy(busy)
@@ -1,6 +1,3 @@
-CREATE DATABASE IF NOT EXISTS university;
-USE university;
-
 -- Create base tables first
 CREATE TABLE IF NOT EXISTS Degree (
     degreeID VARCHAR(10) PRIMARY KEY,
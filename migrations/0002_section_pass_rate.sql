@@ -0,0 +1,29 @@
+-- Stored per-section pass rate (best goal), kept current by update_evaluation
+CREATE TABLE IF NOT EXISTS SectionPassRate (
+    courseNumber VARCHAR(50),
+    sectionID VARCHAR(3),
+    year INT,
+    term ENUM('Spring', 'Summer', 'Fall'),
+    passCount INT NOT NULL,
+    passRate DECIMAL(6,2) NOT NULL,
+    PRIMARY KEY (courseNumber, sectionID, year, term),
+    KEY section_pass_rate_idx (year, term, passRate),
+    FOREIGN KEY (courseNumber, sectionID, year, term)
+        REFERENCES Section(courseNumber, sectionID, year, term)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+-- Backfill from the evaluations already entered
+INSERT INTO SectionPassRate (courseNumber, sectionID, year, term, passCount, passRate)
+SELECT s.courseNumber, s.sectionID, s.year, s.term,
+       MAX(e.gradeCountA + e.gradeCountB + e.gradeCountC),
+       MAX(e.gradeCountA + e.gradeCountB + e.gradeCountC) * 100.0 / s.enrollmentCount
+FROM Section s
+JOIN Evaluation e
+  ON s.courseNumber = e.courseNumber
+ AND s.sectionID = e.sectionID
+ AND s.year = e.year
+ AND s.term = e.term
+WHERE s.enrollmentCount > 0
+GROUP BY s.courseNumber, s.sectionID, s.year, s.term, s.enrollmentCount;
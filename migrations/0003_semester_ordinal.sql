@@ -0,0 +1,9 @@
+-- Sortable position of the semester: year * 10 + 1/2/3 for Spring/Summer/Fall
+ALTER TABLE Semester
+    ADD COLUMN ordinal INT AS (year * 10 + CASE term WHEN 'Spring' THEN 1 WHEN 'Summer' THEN 2 WHEN 'Fall' THEN 3 END) STORED,
+    ADD UNIQUE KEY semester_ordinal_idx (ordinal);
+
+-- Semester range lookups per course and per instructor (year, term sorts like Semester.ordinal)
+ALTER TABLE Section
+    ADD KEY section_course_semester_idx (courseNumber, year, term),
+    ADD KEY section_instructor_semester_idx (instructorID, year, term);
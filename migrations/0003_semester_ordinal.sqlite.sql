@@ -0,0 +1,10 @@
+-- SQLite can only add VIRTUAL generated columns and needs separate index statements
+ALTER TABLE Semester
+    ADD COLUMN ordinal INT AS (year * 10 + CASE term WHEN 'Spring' THEN 1 WHEN 'Summer' THEN 2 WHEN 'Fall' THEN 3 END) VIRTUAL;
+CREATE UNIQUE INDEX semester_ordinal_idx ON Semester (ordinal);
+
+-- Semester range lookups per course and per instructor. Unlike the MySQL ENUM, term is
+-- TEXT here, so within a year these indexes sort Fall < Spring < Summer rather than like
+-- Semester.ordinal; they narrow the rows, and the range queries sort by sem.ordinal.
+CREATE INDEX section_course_semester_idx ON Section (courseNumber, year, term);
+CREATE INDEX section_instructor_semester_idx ON Section (instructorID, year, term);
@@ -0,0 +1,16 @@
+-- Sections of a semester in (courseNumber, sectionID) order, so the per-semester
+-- status, pass-rate and scaffolding queries group without sorting or touching rows
+CREATE INDEX section_semester_idx
+    ON Section (year, term, courseNumber, sectionID, enrollmentCount);
+
+-- Section by semester and instructor (get_sections_for_instructor), covering its select list
+CREATE INDEX section_semester_instructor_idx
+    ON Section (year, term, instructorID, courseNumber, sectionID, enrollmentCount);
+
+-- Evaluation by degree and goal (get_courses_for_goals), covering the course it needs
+CREATE INDEX evaluation_goal_course_idx
+    ON Evaluation (degreeID, goalCode, courseNumber);
+
+-- Degrees of a course (get_degrees_for_course, evaluation scaffolding), covering isCore
+CREATE INDEX course_degree_course_idx
+    ON Course_Degree (courseNumber, degreeID, isCore);
@@ -0,0 +1,60 @@
+-- Per-section evaluation summary, one row per section, kept current by university_db
+-- (update_evaluation, section creation, goal association) and rebuilt on demand with
+-- "python db_migrations.py rebuild". The status strings match SECTION_STATUS_SQL.
+CREATE TABLE IF NOT EXISTS SectionSummary (
+    courseNumber VARCHAR(50),
+    sectionID VARCHAR(3),
+    year INT,
+    term ENUM('Spring', 'Summer', 'Fall'),
+    evaluationCount INT NOT NULL,
+    enteredCount INT NOT NULL,
+    gradedCount INT NOT NULL,
+    noteCount INT NOT NULL,
+    gradeCountA INT NOT NULL,
+    gradeCountB INT NOT NULL,
+    gradeCountC INT NOT NULL,
+    gradeCountF INT NOT NULL,
+    status VARCHAR(40) NOT NULL,
+    PRIMARY KEY (courseNumber, sectionID, year, term),
+    KEY section_summary_semester_idx (year, term, courseNumber, sectionID, status),
+    FOREIGN KEY (courseNumber, sectionID, year, term)
+        REFERENCES Section(courseNumber, sectionID, year, term)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+-- Backfill from the sections and evaluations already entered
+INSERT INTO SectionSummary (courseNumber, sectionID, year, term, evaluationCount, enteredCount, gradedCount,
+                            noteCount, gradeCountA, gradeCountB, gradeCountC, gradeCountF, status)
+SELECT t.courseNumber, t.sectionID, t.year, t.term, t.evaluationCount, t.enteredCount, t.gradedCount,
+       t.noteCount, t.gradeCountA, t.gradeCountB, t.gradeCountC, t.gradeCountF,
+       CASE
+           WHEN t.enteredCount = 0 AND t.gradedCount = 0 THEN 'No Evaluation Entered'
+           WHEN t.enteredCount > 0 AND t.gradedCount > 0 AND t.noteCount > 0 THEN 'Fully Entered (With Improvement Note)'
+           WHEN t.enteredCount > 0 AND t.gradedCount > 0 THEN 'Fully Entered (No Improvement Note)'
+           ELSE 'Partially Entered'
+       END
+FROM (
+    SELECT s.courseNumber, s.sectionID, s.year, s.term,
+           COUNT(e.courseNumber) AS evaluationCount,
+           COALESCE(SUM(CASE WHEN e.evaluationType IS NOT NULL OR e.gradeCountA IS NOT NULL THEN 1 ELSE 0 END), 0)
+               AS enteredCount,
+           COALESCE(SUM(CASE WHEN COALESCE(e.gradeCountA, 0) + COALESCE(e.gradeCountB, 0)
+                                  + COALESCE(e.gradeCountC, 0) + COALESCE(e.gradeCountF, 0) > 0 THEN 1 ELSE 0 END), 0)
+               AS gradedCount,
+           COALESCE(SUM(CASE WHEN TRIM(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(e.improvementNote,
+                                  CHAR(9), ''), CHAR(10), ''), CHAR(11), ''), CHAR(12), ''), CHAR(13), '')) <> ''
+                             THEN 1 ELSE 0 END), 0)
+               AS noteCount,
+           COALESCE(SUM(e.gradeCountA), 0) AS gradeCountA,
+           COALESCE(SUM(e.gradeCountB), 0) AS gradeCountB,
+           COALESCE(SUM(e.gradeCountC), 0) AS gradeCountC,
+           COALESCE(SUM(e.gradeCountF), 0) AS gradeCountF
+    FROM Section s
+    LEFT JOIN Evaluation e
+      ON s.courseNumber = e.courseNumber
+     AND s.sectionID = e.sectionID
+     AND s.year = e.year
+     AND s.term = e.term
+    GROUP BY s.courseNumber, s.sectionID, s.year, s.term
+) t;
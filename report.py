@@ -0,0 +1,216 @@
+"""
+Run the university_db reports from the command line.
+
+Usage:
+    python report.py [--format csv|jsonl|table] [--output FILE]
+        [--backend sqlite|mysql] [--path FILE] [--database NAME] REPORT ...
+
+Reports:
+    status (--semester YEAR TERM ... | --all-semesters)
+    above PERCENTAGE [--rule RULE] [--stored] (--semester YEAR TERM ... | --all-semesters)
+    course-range COURSE START_YEAR START_TERM END_YEAR END_TERM
+    instructor-range INSTRUCTOR START_YEAR START_TERM END_YEAR END_TERM
+    degree-courses DEGREE
+    goal-courses DEGREE GOAL [GOAL ...]
+    notes COURSE SECTION
+
+The semester reports prefix every row with its year and term, so one run can export
+every semester. Rows are written as they are fetched, through the streaming iter_*
+queries and the connection pool, so memory stays flat however large the export. CSV
+and JSON Lines take their columns from the first row; an empty report writes nothing.
+The table format sizes its columns from the first TABLE_SAMPLE_ROWS rows.
+
+Without --backend, the database configured by the UNIVERSITY_DB_* variables is used;
+--path and --database are only accepted together with --backend.
+The exit status is 2 if the report failed.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+from decimal import Decimal
+
+import university_db
+
+TABLE_SAMPLE_ROWS = 100
+
+
+def _per_semester(semesters, query):
+    # query(year, term) -> rows; each row is prefixed with its semester
+    for year, term in semesters:
+        for row in query(year, term):
+            yield {'year': year, 'term': term, **row}
+
+
+def _json_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def write_csv(rows, out):
+    """Write dictionaries as CSV with a header row. Returns the number of rows written."""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+    writer = csv.DictWriter(out, fieldnames=list(first), lineterminator='\n')
+    writer.writeheader()
+    writer.writerow(first)
+    count = 1
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows, out):
+    """Write dictionaries as JSON Lines. Returns the number of rows written."""
+    count = 0
+    for row in rows:
+        out.write(json.dumps(row, default=_json_value) + '\n')
+        count += 1
+    return count
+
+
+def write_table(rows, out):
+    """
+    Write dictionaries as an aligned text table. The column widths are taken from the
+    first TABLE_SAMPLE_ROWS rows; longer values later on widen their cell only.
+    Returns the number of rows written.
+    """
+    rows = iter(rows)
+    sample = list(itertools.islice(rows, TABLE_SAMPLE_ROWS))
+    if not sample:
+        return 0
+    columns = list(sample[0])
+    widths = [max(len(column), *(len(_cell(row[column])) for row in sample)) for column in columns]
+
+    def line(values):
+        return '  '.join(value.ljust(width) for value, width in zip(values, widths)).rstrip() + '\n'
+
+    out.write(line(columns))
+    out.write(line(['-' * width for width in widths]))
+    count = 0
+    for row in itertools.chain(sample, rows):
+        out.write(line([_cell(row[column]) for column in columns]))
+        count += 1
+    return count
+
+
+def _cell(value):
+    return '' if value is None else str(value)
+
+
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl, 'table': write_table}
+
+
+def rows_for(args):
+    """
+    Start the report selected on the command line.
+
+    Returns:
+        iterator: Its rows, as dictionaries.
+
+    Raises:
+        UniversityDBError, DatabaseError: As raised by the university_db query.
+    """
+    if args.report in ('status', 'above'):
+        semesters = university_db.get_semesters() if args.all_semesters else args.semester
+        if args.report == 'status':
+            return _per_semester(semesters, university_db.iter_evaluation_status_for_semester)
+        return _per_semester(semesters, lambda year, term: university_db.iter_sections_above_percentage(
+            year, term, args.percentage, args.rule, args.stored))
+    if args.report == 'course-range':
+        return university_db.iter_course_sections_in_range(args.course, *args.range)
+    if args.report == 'instructor-range':
+        return university_db.iter_instructor_sections_in_range(args.instructor, *args.range)
+    if args.report == 'degree-courses':
+        return iter(university_db.get_degree_courses(args.degree))
+    if args.report == 'goal-courses':
+        return iter(university_db.get_courses_for_goals(args.degree, args.goals))
+    return iter(university_db.get_improvement_notes(args.course, args.section))
+
+
+def _semester(parser, value):
+    year, term = value
+    try:
+        university_db.semester_ordinal(year, term)
+    except university_db.ValidationError as err:
+        parser.error(str(err))
+    return int(year), term
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Write a university database report as CSV, JSON Lines or a table.")
+    parser.add_argument('--format', choices=sorted(WRITERS), default='csv')
+    parser.add_argument('--output', metavar='FILE', help="write to FILE instead of standard output")
+    parser.add_argument('--backend', choices=['sqlite', 'mysql'],
+                        help="default: the backend configured by UNIVERSITY_DB_BACKEND")
+    parser.add_argument('--path', help="SQLite database file (with --backend sqlite)")
+    parser.add_argument('--database', help="MySQL database (with --backend mysql; default university)")
+    reports = parser.add_subparsers(dest='report', required=True, metavar='REPORT')
+
+    def semesters(report):
+        group = report.add_mutually_exclusive_group(required=True)
+        group.add_argument('--semester', nargs=2, action='append', metavar=('YEAR', 'TERM'),
+                           help="a semester to report on; may be repeated")
+        group.add_argument('--all-semesters', action='store_true', help="every semester, oldest first")
+
+    status = reports.add_parser('status', help="evaluation status of every section of the semesters")
+    semesters(status)
+    above = reports.add_parser('above', help="sections whose pass rate exceeds a percentage")
+    above.add_argument('percentage', type=float)
+    above.add_argument('--rule', choices=list(university_db.PASS_RATE_RULES), default='any')
+    above.add_argument('--stored', action='store_true', help=f"read the stored pass rates (rule '{university_db.STORED_PASS_RATE_RULE}' only)")
+    semesters(above)
+    for name, key in (('course-range', 'course'), ('instructor-range', 'instructor')):
+        ranged = reports.add_parser(name, help=f"sections of a {key} between two semesters")
+        ranged.add_argument(key)
+        ranged.add_argument('range', nargs=4, metavar=('START_YEAR', 'START_TERM', 'END_YEAR', 'END_TERM'))
+    degree_courses = reports.add_parser('degree-courses', help="courses of a degree")
+    degree_courses.add_argument('degree')
+    goal_courses = reports.add_parser('goal-courses', help="courses evaluated against goals of a degree")
+    goal_courses.add_argument('degree')
+    goal_courses.add_argument('goals', nargs='+', metavar='GOAL')
+    notes = reports.add_parser('notes', help="improvement notes of a section")
+    notes.add_argument('course')
+    notes.add_argument('section')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.report in ('status', 'above') and args.semester:
+        args.semester = list(dict.fromkeys(_semester(parser, value) for value in args.semester))
+    if args.report in ('course-range', 'instructor-range'):
+        start_year, start_term, end_year, end_term = args.range
+        args.range = _semester(parser, (start_year, start_term)) + _semester(parser, (end_year, end_term))
+    if (args.path or args.database) and not args.backend:
+        parser.error("--path and --database only apply together with --backend")
+    if args.backend:
+        university_db.configure_backend(args.backend, path=args.path, database=args.database or 'university')
+
+    out = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+    try:
+        count = WRITERS[args.format](rows_for(args), out)
+    except (university_db.UniversityDBError, university_db.DatabaseError) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # The reader (e.g. head) went away; stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if args.output:
+            out.close()
+    if args.output:
+        print(f"{count} rows written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
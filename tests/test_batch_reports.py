@@ -0,0 +1,112 @@
+"""The batch reports return what the single-key queries return, concatenated in order."""
+import unittest
+from unittest import mock
+
+import datagen
+import university_db
+
+
+class BatchReportTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        university_db.configure_backend('sqlite', path=':memory:')
+        # Keeps the in-memory database alive for the whole class
+        cls.keeper = university_db.connect_to_db()
+        cls.sample = datagen.generate(evaluations=400, seed=5)['sample']
+        cls.semesters = university_db.get_semesters()
+        cursor = cls.keeper.cursor()
+        cursor.execute("SELECT instructorID FROM Instructor")
+        cls.instructors = [row[0] for row in cursor.fetchall()]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def chunked(self, size=2):
+        return mock.patch.object(university_db, 'BATCH_KEYS_PER_QUERY', size)
+
+    def expected_status(self, semesters):
+        return [{'year': year, 'term': term, **row}
+                for year, term in semesters
+                for row in university_db.get_evaluation_status_for_semester(year, term)]
+
+    def test_status_for_semesters(self):
+        expected = self.expected_status(self.semesters)
+        self.assertTrue(expected)
+        self.assertEqual(university_db.get_evaluation_status_for_semesters(self.semesters), expected)
+        with self.chunked():
+            # Shuffled and repeated semesters still come back once each, oldest first
+            shuffled = list(reversed(self.semesters)) + self.semesters[:1]
+            self.assertEqual(university_db.get_evaluation_status_for_semesters(shuffled), expected)
+
+    def test_sections_above_percentage_for_semesters(self):
+        for rule in university_db.PASS_RATE_RULES:
+            with self.subTest(rule=rule):
+                expected = [{'year': year, 'term': term, **row}
+                            for year, term in self.semesters
+                            for row in university_db.get_sections_above_percentage(year, term, 50, rule)]
+                self.assertEqual(university_db.get_sections_above_percentage_for_semesters(
+                    reversed(self.semesters), 50, rule, max_workers=3), expected)
+        stored = university_db.get_sections_above_percentage_for_semesters(self.semesters, 50, use_stored=True)
+        self.assertEqual(stored, university_db.get_sections_above_percentage_for_semesters(self.semesters, 50))
+
+    def test_sections_for_instructors(self):
+        expected = []
+        for year, term in self.semesters:
+            for instructor_id in sorted(self.instructors):
+                for row in university_db.get_sections_for_instructor(year, term, instructor_id):
+                    expected.append({'year': year, 'term': term, 'instructorID': instructor_id, **row})
+        self.assertTrue(expected)
+        self.assertEqual(university_db.get_sections_for_instructors(self.semesters, self.instructors), expected)
+        with self.chunked():
+            self.assertEqual(university_db.get_sections_for_instructors(
+                list(reversed(self.semesters)), list(reversed(self.instructors)) * 2), expected)
+
+    def test_degree_courses_for_degrees(self):
+        degrees = sorted(self.sample['degrees'])
+        expected = [{'degreeID': degree_id, **row}
+                    for degree_id in degrees
+                    for row in sorted(university_db.get_degree_courses(degree_id),
+                                      key=lambda r: r['courseNumber'])]
+        self.assertTrue(expected)
+        with self.chunked():
+            self.assertEqual(university_db.get_degree_courses_for_degrees(list(reversed(degrees)) * 2), expected)
+
+    def test_empty_keys(self):
+        self.assertEqual(university_db.get_evaluation_status_for_semesters([]), [])
+        self.assertEqual(university_db.get_sections_for_instructors(self.semesters, []), [])
+        self.assertEqual(university_db.get_sections_for_instructors([], self.instructors), [])
+        self.assertEqual(university_db.get_degree_courses_for_degrees([]), [])
+        self.assertEqual(university_db.get_sections_above_percentage_for_semesters([], 50), [])
+
+    def test_validation(self):
+        for semesters in ([(2024,)], [(2024, 'Winter')], [('20x4', 'Fall')]):
+            with self.subTest(semesters=semesters):
+                with self.assertRaises(university_db.ValidationError):
+                    university_db.get_evaluation_status_for_semesters(semesters)
+                with self.assertRaises(university_db.ValidationError):
+                    university_db.get_sections_for_instructors(semesters, self.instructors)
+        with self.assertRaises(university_db.ValidationError):
+            university_db.get_sections_above_percentage_for_semesters(self.semesters, 50, rule='median')
+        with self.assertRaises(university_db.ValidationError):
+            university_db.get_sections_above_percentage_for_semesters(self.semesters, 50, rule='all',
+                                                                      use_stored=True)
+
+    def test_run_batch_keeps_order_and_raises_first_failure(self):
+        self.assertEqual(university_db.run_batch(pow, [(n, 2) for n in range(10)], max_workers=4),
+                         [n * n for n in range(10)])
+
+        def check(n):
+            if n % 3 == 2:
+                raise ValueError(n)
+            return n
+
+        with self.assertRaises(ValueError) as raised:
+            university_db.run_batch(check, [(n,) for n in range(9)], max_workers=4)
+        self.assertEqual(raised.exception.args, (2,))
+
+
+if __name__ == '__main__':
+    unittest.main()
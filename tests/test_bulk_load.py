@@ -0,0 +1,137 @@
+"""Bulk loading validates rows with the add_* rules, inserts in dependency order and reports rejects."""
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+import bulk_load
+import university_db
+
+
+class BulkLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.keeper = university_db.connect_to_db()
+        self.directory = tempfile.TemporaryDirectory()
+        self.rejects = os.path.join(self.directory.name, 'rejects.csv')
+
+    def tearDown(self):
+        self.keeper.close()
+        self.directory.cleanup()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def write_csv(self, name, header, rows):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        return path
+
+    def write_jsonl(self, name, records):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+        return path
+
+    def count(self, sql, params=()):
+        cursor = self.keeper.cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchone()[0]
+
+    def load(self, chunk_size=2):
+        files = {
+            'Degree': self.write_csv('degrees.csv', ['degreeID', 'name', 'level'], [
+                ['BSCS', 'Computer Science', 'BS'],
+                ['MSCS', 'Computer Science', 'MS'],
+                ['BAD1', 'Computer Science', 'BS'],   # name and level taken
+                ['BAD2', 'Data 101', 'BS'],           # name not alphabetic
+                ['BAD3', 'Physics', 'PhD'],           # invalid level
+            ]),
+            'Course': self.write_jsonl('courses.jsonl', [
+                {'courseNumber': 'CS1010', 'name': 'Programming'},
+                {'courseNumber': 'CS2020', 'name': 'Data Structures'},
+                {'courseNumber': 'cs3030', 'name': 'Lowercase'},
+                {'courseNumber': 'CS1010', 'name': 'Duplicate'},
+            ]),
+            'Instructor': self.write_csv('instructors.csv', ['instructorID', 'name'], [
+                ['12345678', 'Ada Lovelace'],
+                ['1234', 'Too Short'],
+            ]),
+            'Goal': self.write_csv('goals.csv', ['goalCode', 'degreeID', 'description'], [
+                ['G001', 'BSCS', 'Programming'],
+                ['G002', 'BSCS', 'Design'],
+                ['G001', 'NOPE', 'Missing degree'],
+            ]),
+            'Course_Degree': self.write_csv('course_degree.csv', ['courseNumber', 'degreeID', 'isCore'], [
+                ['CS1010', 'BSCS', 'yes'],
+                ['CS2020', 'BSCS', '0'],
+                ['CS2020', 'MSCS', 'maybe'],
+            ]),
+            'Section': self.write_csv('sections.csv',
+                                      ['courseNumber', 'sectionID', 'year', 'term', 'instructorID', 'enrollmentCount'], [
+                ['CS1010', '001', '2024', 'Fall', '12345678', '30'],
+                ['CS1010', '002', '2024', 'Fall', '12345678', ''],
+                ['CS2020', '001', '2025', 'Spring', '12345678', '25'],
+                ['CS1010', '01', '2024', 'Fall', '12345678', '30'],
+                ['CS1010', '003', '2024', 'Winter', '12345678', '30'],
+                ['CS1010', '004', '2024', 'Fall', '99999999', '30'],
+                ['CS1010', '001', '2024', 'Fall', '12345678', '30'],
+            ]),
+        }
+        return bulk_load.bulk_load(files, self.rejects, chunk_size)
+
+    def test_summary_and_rejects(self):
+        summary = self.load()
+        self.assertEqual({table: (counts['read'], counts['inserted'], counts['rejected'])
+                          for table, counts in summary.items()}, {
+            'Degree': (5, 2, 3),
+            'Course': (4, 2, 2),
+            'Instructor': (2, 1, 1),
+            'Goal': (3, 2, 1),
+            'Course_Degree': (3, 2, 1),
+            'Section': (7, 3, 4),
+        })
+        with open(self.rejects, newline='', encoding='utf-8') as f:
+            rejects = list(csv.DictReader(f))
+        self.assertEqual(len(rejects), 12)
+        reasons = {(row['table'], row['line']): row['reason'] for row in rejects}
+        self.assertEqual(reasons[('Degree', '4')], "Duplicate degree name and level: already exists.")
+        self.assertTrue(reasons[('Degree', '6')].startswith("Invalid level."))
+        self.assertEqual(reasons[('Course', '4')], "Duplicate Course Number: already exists.")
+        self.assertEqual(reasons[('Section', '5')], "Section ID must be exactly 3 characters.")
+        self.assertEqual(reasons[('Section', '7')], "No match found for Instructor ID.")
+        records = {(row['table'], row['line']): json.loads(row['record']) for row in rejects}
+        self.assertEqual(records[('Degree', '4')]['degreeID'], 'BAD1')
+
+    def test_sections_get_their_semesters_and_evaluations(self):
+        self.load()
+        self.assertEqual(university_db.get_semesters(), [(2024, 'Fall'), (2025, 'Spring')])
+        # CS1010 is in BSCS (2 goals); CS2020 too
+        self.assertEqual(self.count("SELECT COUNT(*) FROM Evaluation"), 6)
+        self.assertEqual(self.count("SELECT enrollmentCount FROM Section WHERE sectionID = %s", ('002',)), 0)
+        self.assertEqual(self.count("SELECT COUNT(*) FROM Course_Degree WHERE isCore = %s", (1,)), 1)
+        status = university_db.get_evaluation_status_for_semester(2024, 'Fall')
+        self.assertEqual([row['status'] for row in status], ["Partially Entered"] * 2)
+
+    def test_rows_already_in_the_database_are_rejected(self):
+        self.load()
+        summary = self.load()
+        self.assertEqual(sum(counts['inserted'] for counts in summary.values()), 0)
+
+    def test_nothing_rejected_writes_no_file(self):
+        path = self.write_csv('courses.csv', ['courseNumber', 'name'], [['CS1010', 'Programming']])
+        self.assertEqual(bulk_load.bulk_load({'Course': path}, self.rejects),
+                         {'Course': {'read': 1, 'inserted': 1, 'rejected': 0}})
+        self.assertFalse(os.path.exists(self.rejects))
+
+    def test_unknown_table(self):
+        with self.assertRaises(ValueError):
+            bulk_load.bulk_load({'Evaluation': 'evaluations.csv'}, self.rejects)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""update_evaluations_batch reports an outcome per row and rolls back atomic batches as a whole."""
+import unittest
+
+import university_db
+from university_db import EVALUATION_FAILED, EVALUATION_ROLLED_BACK, EVALUATION_SAVED
+
+SECTION = ('CS1010', '001', 2024, 'Fall')
+
+
+def evaluation(goal, grades=(10, 5, 3, 2), evaluation_type='Quiz', note=None, section=SECTION):
+    return section + ('BSCS', goal, evaluation_type) + tuple(grades) + (note,)
+
+
+class EvaluationBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.keeper = university_db.connect_to_db()
+        university_db.add_degree('BSCS', 'Computer Science', 'BS')
+        for goal in ('G001', 'G002', 'G003'):
+            university_db.add_goal(goal, 'BSCS', f"Goal {goal}")
+        university_db.add_course('CS1010', 'Programming')
+        university_db.add_course_degree('CS1010', 'BSCS', True)
+        university_db.add_instructor('12345678', 'Ada Lovelace')
+        university_db.add_course_to_semester('CS1010', '001', '2024', 'Fall', '12345678', 20)
+
+    def tearDown(self):
+        self.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def grades(self):
+        return {row['goalCode']: (row['evaluationType'], row['gradeCountA'])
+                for row in university_db.get_evaluations_for_section(*SECTION)}
+
+    def statuses(self, outcomes):
+        return [outcome['status'] for outcome in outcomes]
+
+    def assertDerivedTablesCurrent(self):
+        for percentage in (0, 50, 90):
+            self.assertEqual(university_db.get_sections_above_percentage(2024, 'Fall', percentage, use_stored=True),
+                             university_db.get_sections_above_percentage(2024, 'Fall', percentage))
+        status = university_db.get_evaluation_status_for_semester(2024, 'Fall')
+        university_db.rebuild_section_summaries(2024, 'Fall')
+        self.assertEqual(university_db.get_evaluation_status_for_semester(2024, 'Fall'), status)
+
+    def test_all_rows_saved(self):
+        outcomes = university_db.update_evaluations_batch([
+            evaluation('G001'), evaluation('G002', (1, 1, 1, 17)), evaluation('G001', (12, 0, 0, 8), 'Project')])
+        self.assertEqual(outcomes, [{'status': EVALUATION_SAVED, 'error': None}] * 3)
+        # The later row for the same key wins
+        self.assertEqual(self.grades(), {'G001': ('Project', 12), 'G002': ('Quiz', 1), 'G003': (None, 0)})
+        self.assertDerivedTablesCurrent()
+
+    def test_atomic_batch_rolls_back_on_a_bad_row(self):
+        university_db.update_evaluation(*evaluation('G003', (4, 0, 0, 16), 'Report'))
+        before = self.grades()
+        outcomes = university_db.update_evaluations_batch([
+            evaluation('G001'), evaluation('G999'), evaluation('G002'), evaluation('G003', evaluation_type='Essay')])
+        self.assertEqual(self.statuses(outcomes),
+                         [EVALUATION_ROLLED_BACK, EVALUATION_FAILED, EVALUATION_ROLLED_BACK, EVALUATION_FAILED])
+        self.assertIsInstance(outcomes[1]['error'], university_db.DatabaseError)
+        self.assertIsNone(outcomes[0]['error'])
+        self.assertEqual(self.grades(), before)
+        self.assertDerivedTablesCurrent()
+
+    def test_non_atomic_batch_saves_the_good_rows(self):
+        outcomes = university_db.update_evaluations_batch([
+            evaluation('G001'), evaluation('G999'),
+            evaluation('G002', section=('CS1010', '009', 2024, 'Fall')), evaluation('G003', (2, 2, 2, 14))],
+            atomic=False)
+        self.assertEqual(self.statuses(outcomes),
+                         [EVALUATION_SAVED, EVALUATION_FAILED, EVALUATION_FAILED, EVALUATION_SAVED])
+        self.assertEqual(self.grades(), {'G001': ('Quiz', 10), 'G002': (None, 0), 'G003': ('Quiz', 2)})
+        self.assertDerivedTablesCurrent()
+
+    def test_malformed_rows(self):
+        outcomes = university_db.update_evaluations_batch([evaluation('G001'), evaluation('G002')[:5]])
+        self.assertEqual(self.statuses(outcomes), [EVALUATION_ROLLED_BACK, EVALUATION_FAILED])
+        self.assertIsInstance(outcomes[1]['error'], university_db.ValidationError)
+        self.assertEqual(self.grades()['G001'], (None, 0))
+
+        outcomes = university_db.update_evaluations_batch([evaluation('G001'), evaluation('G002')[:5]], atomic=False)
+        self.assertEqual(self.statuses(outcomes), [EVALUATION_SAVED, EVALUATION_FAILED])
+        self.assertEqual(self.grades()['G001'], ('Quiz', 10))
+
+    def test_empty_batch(self):
+        self.assertEqual(university_db.update_evaluations_batch([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
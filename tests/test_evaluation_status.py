@@ -0,0 +1,104 @@
+"""The server-side status classification gives the same strings as the original Python loop."""
+import unittest
+
+import university_db
+
+GOALS = ('G001', 'G002', 'G003')
+
+# Per section: its Evaluation rows as (evaluationType, A, B, C, F, improvementNote)
+CASES = {
+    '001': [],
+    '002': [(None, 0, 0, 0, 0, None)],
+    '003': [('Quiz', 0, 0, 0, 0, None)],
+    '004': [('Quiz', 5, 3, 1, 1, None)],
+    '005': [('Quiz', 5, 3, 1, 1, '   ')],
+    '006': [('Quiz', 5, 3, 1, 1, '\t\r\n \x0b\x0c')],
+    '007': [('Quiz', 5, 3, 1, 1, ' Revise week 3 ')],
+    '008': [('Quiz', 0, 0, 0, 0, 'Note without grades')],
+    '009': [(None, 0, 0, 0, 7, None)],
+    '010': [('Project', 0, 0, 0, 0, None), (None, 4, 0, 0, 0, None)],
+    '011': [(None, 0, 0, 0, 0, ''), ('Report', 1, 1, 1, 1, None), ('Other', 2, 0, 0, 0, '\n')],
+    '012': [('Homework', 1, 0, 0, 0, 'x'), (None, 0, 0, 0, 0, None), ('Quiz', 0, 0, 0, 0, None)],
+}
+
+
+def baseline_status(rows):
+    """The classification the GUI did in Python before it moved into SQL."""
+    has_evaluation = has_grades = has_improvement = False
+    for evaluation_type, a, b, c, f, note in rows:
+        if evaluation_type is not None or a is not None:
+            has_evaluation = True
+        if (a or 0) + (b or 0) + (c or 0) + (f or 0) > 0:
+            has_grades = True
+        if note and note.strip():
+            has_improvement = True
+    if not has_evaluation and not has_grades:
+        return "No Evaluation Entered"
+    if has_evaluation and has_grades:
+        return "Fully Entered (With Improvement Note)" if has_improvement else "Fully Entered (No Improvement Note)"
+    return "Partially Entered"
+
+
+class EvaluationStatusTest(unittest.TestCase):
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.keeper = university_db.connect_to_db()
+        university_db.add_degree('BSCS', 'Computer Science', 'BS')
+        for goal in GOALS:
+            university_db.add_goal(goal, 'BSCS', f"Goal {goal}")
+        university_db.add_course('CS1010', 'Programming')
+        university_db.add_instructor('12345678', 'Ada Lovelace')
+        university_db.add_semester('2024', 'Fall')
+        cursor = self.keeper.cursor()
+        for section, rows in CASES.items():
+            cursor.execute("""
+                INSERT INTO Section (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, ('CS1010', section, 2024, 'Fall', '12345678', 10))
+            for goal, row in zip(GOALS, rows):
+                cursor.execute("""
+                    INSERT INTO Evaluation (courseNumber, sectionID, year, term, degreeID, goalCode, evaluationType,
+                                            gradeCountA, gradeCountB, gradeCountC, gradeCountF, improvementNote)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """, ('CS1010', section, 2024, 'Fall', 'BSCS', goal) + row)
+        self.keeper.commit()
+        # The rows were written behind university_db's back
+        university_db.rebuild_section_summaries(2024, 'Fall')
+
+    def tearDown(self):
+        self.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def expected(self):
+        return [{'courseNumber': 'CS1010', 'sectionID': section, 'status': baseline_status(rows)}
+                for section, rows in CASES.items()]
+
+    def test_cases_cover_every_status(self):
+        self.assertEqual(len({row['status'] for row in self.expected()}), 4)
+
+    def test_grouped_classification_matches_the_baseline(self):
+        cursor = self.keeper.cursor(dictionary=True)
+        cursor.execute(f"""
+            SELECT s.courseNumber, s.sectionID, {university_db.SECTION_STATUS_SQL} AS status
+            FROM Section s
+            LEFT JOIN Evaluation e
+              ON s.courseNumber = e.courseNumber
+             AND s.sectionID = e.sectionID
+             AND s.year = e.year
+             AND s.term = e.term
+            WHERE s.year = %s AND s.term = %s
+            GROUP BY s.courseNumber, s.sectionID
+            ORDER BY s.courseNumber, s.sectionID
+        """, (2024, 'Fall'))
+        self.assertEqual(cursor.fetchall(), self.expected())
+
+    def test_semester_status_matches_the_baseline(self):
+        self.assertEqual(university_db.get_evaluation_status_for_semester(2024, 'Fall'), self.expected())
+
+    def test_unknown_semester_is_empty(self):
+        self.assertEqual(university_db.get_evaluation_status_for_semester(2030, 'Spring'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
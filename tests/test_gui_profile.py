@@ -0,0 +1,155 @@
+"""Handler invocations are recorded once all their bound work has run or been cancelled."""
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from gui_profile import HandlerProfiler
+from gui_worker import BackgroundWorker
+
+
+class FakeRoot:
+    """Stands in for the Tk root: after() jobs run when run_jobs() is called."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.ids = 0
+
+    def after(self, ms, func):
+        self.ids += 1
+        self.jobs[self.ids] = func
+        return self.ids
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_jobs(self):
+        jobs, self.jobs = self.jobs, {}
+        for func in jobs.values():
+            func()
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.profiler = HandlerProfiler(enabled=True, directory=self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def records(self):
+        path = os.path.join(self.directory.name, 'handlers.jsonl')
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_recorded_after_the_bound_work_ran(self):
+        bound = []
+
+        @self.profiler.handler
+        def handler():
+            bound.append(self.profiler.bind(lambda: 42, 'db'))
+
+        handler()
+        self.assertEqual(self.records(), [])
+        self.assertEqual(bound[0](), 42)
+        [record] = self.records()
+        self.assertEqual((record['handler'], record['db_calls'], record['cancelled']), ('handler', 1, False))
+
+    def test_cancelled_work_still_finishes_the_invocation(self):
+        bound = []
+
+        @self.profiler.handler
+        def handler():
+            bound.append(self.profiler.bind(lambda: None, 'db'))
+            bound.append(self.profiler.bind(lambda: None, 'render'))
+
+        handler()
+        bound[0]()
+        self.profiler.cancel(*bound)  # the first already ran and is ignored
+        [record] = self.records()
+        self.assertTrue(record['cancelled'])
+        self.profiler.cancel(*bound)
+        bound[1]()
+        self.assertEqual(len(self.records()), 1)
+
+    def test_bound_callables_keep_their_name(self):
+        # tkinter's after() copies the callback's __name__
+        @self.profiler.handler
+        def handler():
+            return self.profiler.bind(self.records, 'render')
+
+        bound = handler()
+        self.assertEqual(bound.__name__, 'records')
+        self.profiler.cancel(bound)
+
+    def test_cancel_ignores_plain_functions(self):
+        func = self.profiler.bind(len, 'db')
+        self.assertIs(func, len)
+        self.profiler.cancel(func)
+
+
+class WorkerCancelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.profiler = HandlerProfiler(enabled=True, directory=self.directory.name)
+        self.root = FakeRoot()
+        self.worker = BackgroundWorker(self.root, max_workers=1)
+
+    def tearDown(self):
+        self.worker.shutdown()
+        self.directory.cleanup()
+
+    def records(self):
+        with open(os.path.join(self.directory.name, 'handlers.jsonl'), encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def submit(self, channel, func, results):
+        call = self.profiler.bind(func, 'db')
+        on_done = self.profiler.bind(lambda ok, value: results.append(value), 'compute')
+        self.worker.submit(channel, call, (), on_done, on_cancel=lambda: self.profiler.cancel(call, on_done))
+
+    def test_superseded_requests_are_recorded_as_cancelled(self):
+        started, release = threading.Event(), threading.Event()
+        results = []
+
+        def blocking():
+            started.set()
+            release.wait(5)
+            return 'blocking'
+
+        @self.profiler.handler
+        def first():
+            self.submit('other', blocking, results)  # keeps the only worker thread busy
+
+        @self.profiler.handler
+        def second():
+            self.submit('view', lambda: 'stale', results)
+
+        @self.profiler.handler
+        def third():
+            self.submit('view', lambda: 'fresh', results)
+
+        first()
+        started.wait(5)
+        second()
+        third()  # supersedes second, which has not started
+        [record] = self.records()
+        self.assertEqual((record['handler'], record['cancelled']), ('second', True))
+
+        release.set()
+        while self.worker.is_busy():
+            time.sleep(0.01)
+            self.root.run_jobs()
+        self.assertEqual(sorted(results), ['blocking', 'fresh'])
+        self.assertEqual([(r['handler'], r['cancelled']) for r in self.records()],
+                         [('second', True), ('first', False), ('third', False)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Keyset pages add up to the full listing, without duplicates or gaps."""
+import unittest
+
+import datagen
+import university_db
+
+
+def read_all(page, page_size):
+    rows, token, pages = [], None, 0
+    while True:
+        chunk, token = page(page_size, token)
+        rows.extend(chunk)
+        pages += 1
+        if token is None:
+            return rows, pages
+
+
+class PaginationTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        university_db.configure_backend('sqlite', path=':memory:')
+        cls.keeper = university_db.connect_to_db()
+        sample = datagen.generate(evaluations=600, seed=11)['sample']
+        cls.year, cls.term = sample['year'], sample['term']
+        cls.first, cls.last = sample['first'], sample['last']
+        cls.instructor = sample['instructors'][0]
+        cls.course = sample['courses'][0]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def listings(self):
+        y, t, first, last = self.year, self.term, self.first, self.last
+        return {
+            'status': (lambda: university_db.get_evaluation_status_for_semester(y, t),
+                       lambda size, token: university_db.page_evaluation_status_for_semester(y, t, size, token)),
+            'instructor': (lambda: university_db.get_sections_for_instructor(y, t, self.instructor),
+                           lambda size, token: university_db.page_sections_for_instructor(
+                               y, t, self.instructor, size, token)),
+            'course_range': (lambda: university_db.get_course_sections_in_range(self.course, *first, *last),
+                             lambda size, token: university_db.page_course_sections_in_range(
+                                 self.course, *first, *last, page_size=size, page_token=token)),
+            'instructor_range': (lambda: university_db.get_instructor_sections_in_range(self.instructor, *first, *last),
+                                 lambda size, token: university_db.page_instructor_sections_in_range(
+                                     self.instructor, *first, *last, page_size=size, page_token=token)),
+        }
+
+    def test_pages_add_up_to_the_listing(self):
+        for name, (get, page) in self.listings().items():
+            full = get()
+            self.assertGreater(len(full), 3, name)
+            for page_size in (1, 3, len(full), len(full) + 1):
+                with self.subTest(listing=name, page_size=page_size):
+                    rows, pages = read_all(page, page_size)
+                    self.assertEqual(rows, full)
+                    self.assertEqual(pages, -(-len(full) // page_size))
+
+    def test_rows_added_before_the_cursor_do_not_shift_later_pages(self):
+        _, page = self.listings()['status']
+        first_page, token = page(3, None)
+        conn = university_db.connect_to_db()
+        try:
+            cursor = conn.cursor()
+            # Sorts before every generated course number
+            cursor.execute("INSERT INTO Course (courseNumber, name) VALUES (%s, %s)", ('AA0000', 'First'))
+            cursor.execute("""
+                INSERT INTO Section (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, ('AA0000', '001', self.year, self.term, self.instructor, 5))
+            conn.commit()
+            rest, _ = read_all(lambda size, next_token: page(size, next_token or token), 3)
+            self.assertEqual(first_page + rest,
+                             [row for row in university_db.get_evaluation_status_for_semester(self.year, self.term)
+                              if row['courseNumber'] != 'AA0000'])
+        finally:
+            cursor.execute("DELETE FROM Section WHERE courseNumber = %s", ('AA0000',))
+            cursor.execute("DELETE FROM Course WHERE courseNumber = %s", ('AA0000',))
+            conn.commit()
+            conn.close()
+
+    def test_tokens_belong_to_their_listing(self):
+        listings = self.listings()
+        _, token = listings['status'][1](1, None)
+        for name in ('instructor', 'course_range', 'instructor_range'):
+            with self.subTest(listing=name), self.assertRaises(university_db.ValidationError):
+                listings[name][1](1, token)
+
+    def test_invalid_tokens_and_sizes(self):
+        _, page = self.listings()['status']
+        for token in ('not a token', 'W10', '', 'WyJzdGF0dXMiLDEsMl0'):
+            with self.subTest(token=token), self.assertRaises(university_db.ValidationError):
+                page(10, token)
+        for size in (0, -1, True, 2.5, '10'):
+            with self.subTest(size=size), self.assertRaises(university_db.ValidationError):
+                page(size, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""The stored pass rates (SectionPassRate) agree with the ones aggregated from Evaluation."""
+import unittest
+
+import datagen
+import university_db
+
+PERCENTAGES = (0, 25, 50, 75, 90, 100)
+
+
+class StoredPassRateTest(unittest.TestCase):
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        # Keeps the in-memory database alive for the whole test
+        self.keeper = university_db.connect_to_db()
+
+    def tearDown(self):
+        self.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def assertStoredMatchesLive(self):
+        semesters = university_db.get_semesters()
+        self.assertTrue(semesters)
+        for year, term in semesters:
+            for percentage in PERCENTAGES:
+                with self.subTest(year=year, term=term, percentage=percentage):
+                    live = university_db.get_sections_above_percentage(year, term, percentage)
+                    stored = university_db.get_sections_above_percentage(year, term, percentage, use_stored=True)
+                    self.assertEqual(stored, live)
+
+    def _catalog(self):
+        university_db.add_degree('BSCS', 'Computer Science', 'BS')
+        university_db.add_goal('G001', 'BSCS', 'Programming')
+        university_db.add_goal('G002', 'BSCS', 'Design')
+        university_db.add_course('CS1010', 'Programming')
+        university_db.add_course_degree('CS1010', 'BSCS', True)
+        university_db.add_instructor('12345678', 'Ada Lovelace')
+
+    def test_generated_data(self):
+        datagen.generate(evaluations=400, seed=3)
+        self.assertStoredMatchesLive()
+
+    def test_scaffolded_section_without_passes(self):
+        # Scaffolded evaluations pass nobody, which still meets a 0% threshold
+        self._catalog()
+        university_db.add_course_to_semester('CS1010', '001', 2024, 'Fall', '12345678', 30)
+        expected = [{'courseNumber': 'CS1010', 'sectionID': '001', 'enrollmentCount': 30, 'passCount': 0}]
+        self.assertEqual(university_db.get_sections_above_percentage(2024, 'Fall', 0, use_stored=True), expected)
+        self.assertStoredMatchesLive()
+
+    def test_writes_keep_the_stored_rates_current(self):
+        self._catalog()
+        university_db.add_course_to_semester('CS1010', '001', 2024, 'Fall', '12345678', 30)
+        university_db.add_course_to_semester('CS1010', '002', 2024, 'Fall', '12345678', 0)
+        university_db.update_evaluation('CS1010', '001', 2024, 'Fall', 'BSCS', 'G001', 'Quiz', 10, 8, 2, 10, None)
+        self.assertStoredMatchesLive()
+
+        university_db.update_evaluation('CS1010', '001', 2024, 'Fall', 'BSCS', 'G002', 'Project', 20, 5, 3, 2, None)
+        self.assertStoredMatchesLive()
+
+        university_db.add_goal('G003', 'BSCS', 'Testing')
+        university_db.associate_course_with_goal('CS1010', 'BSCS', 'G003')
+        self.assertStoredMatchesLive()
+
+        # Sections added with plain SQL are picked up when their semester is scaffolded
+        conn = university_db.connect_to_db()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("INSERT INTO Semester (year, term) VALUES (%s, %s)", (2025, 'Spring'))
+            cursor.execute("""
+                INSERT INTO Section (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, ('CS1010', '001', 2025, 'Spring', '12345678', 12))
+            conn.commit()
+        finally:
+            conn.close()
+        university_db.scaffold_semester_evaluations(2025, 'Spring')
+        self.assertStoredMatchesLive()
+
+    def test_stored_rates_only_for_the_any_rule(self):
+        with self.assertRaises(university_db.ValidationError):
+            university_db.get_sections_above_percentage(2024, 'Fall', 50, rule='all', use_stored=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Checkout, checkin and closing of pooled connections."""
+import threading
+import time
+import unittest
+
+import university_db
+from db_pool import ConnectionPool, PoolClosedError, PoolTimeoutError
+
+
+class PoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = university_db.configure_backend('sqlite', path=':memory:')
+        self.opened = []
+        self.pool = ConnectionPool(self._connect, size=2, timeout=0.05)
+
+    def tearDown(self):
+        self.pool.close_all()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def _connect(self):
+        conn, _ = self.backend.connect()
+        self.opened.append(conn)
+        return conn
+
+    def test_checkin_reuses_the_connection(self):
+        first = self.pool.checkout()
+        raw = first._raw
+        first.close()
+        second = self.pool.checkout()
+        self.assertIs(second._raw, raw)
+        second.close()
+        stats = self.pool.stats()
+        self.assertEqual((stats['checkouts'], stats['checkins'], stats['creations']), (2, 2, 1))
+        self.assertEqual((stats['open'], stats['idle'], stats['in_use']), (1, 1, 0))
+
+    def test_close_is_idempotent(self):
+        conn = self.pool.checkout()
+        conn.close()
+        conn.close()
+        self.assertEqual(self.pool.stats()['checkins'], 1)
+        with self.assertRaises(AttributeError):
+            conn.cursor()
+
+    def test_checkin_rolls_back(self):
+        conn = self.pool.checkout()
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE Scratch (id INT PRIMARY KEY)")
+        conn.commit()
+        cursor.execute("INSERT INTO Scratch (id) VALUES (%s)", (1,))
+        conn.close()
+        with self.pool.checkout() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM Scratch")
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_exhausted_pool_times_out(self):
+        held = [self.pool.checkout(), self.pool.checkout()]
+        with self.assertRaises(PoolTimeoutError):
+            self.pool.checkout()
+        stats = self.pool.stats()
+        self.assertEqual((stats['waits'], stats['timeouts']), (1, 1))
+        for conn in held:
+            conn.close()
+
+    def test_discard_frees_the_slot(self):
+        conn = self.pool.checkout()
+        conn.discard()
+        stats = self.pool.stats()
+        self.assertEqual((stats['open'], stats['discarded']), (0, 1))
+
+    def test_close_all_closes_idle_and_returned_connections(self):
+        idle = self.pool.checkout()
+        busy = self.pool.checkout()
+        idle.close()
+        self.pool.close_all()
+        self.assertEqual((self.pool.stats()['open'], self.pool.stats()['idle']), (1, 0))
+        busy.close()
+        stats = self.pool.stats()
+        self.assertEqual((stats['open'], stats['idle']), (0, 0))
+        for raw in self.opened:
+            with self.assertRaises(Exception):
+                raw.cursor().execute("SELECT 1")
+
+    def test_closed_pool_refuses_checkouts(self):
+        self.pool.close_all()
+        with self.assertRaises(PoolClosedError):
+            self.pool.checkout()
+        self.assertEqual(self.pool.stats()['creations'], 0)
+
+    def test_close_all_wakes_waiting_checkouts(self):
+        held = [self.pool.checkout(), self.pool.checkout()]
+        self.pool.timeout = 5
+        errors = []
+
+        def wait():
+            try:
+                self.pool.checkout()
+            except PoolClosedError as err:
+                errors.append(err)
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        time.sleep(0.05)
+        self.pool.close_all()
+        waiter.join(1)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(len(errors), 1)
+        for conn in held:
+            conn.close()
+
+    def test_configure_backend_closes_the_old_pool(self):
+        conn = university_db.connect_to_db()
+        old_pool = university_db.get_pool()
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.assertIsNot(university_db.get_pool(), old_pool)
+        conn.close()
+        stats = old_pool.stats()
+        self.assertEqual((stats['open'], stats['idle']), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""The catalog writes invalidate the cached degree and course lookups."""
+import unittest
+
+import university_db
+
+
+class ReferenceCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.keeper = university_db.connect_to_db()
+        university_db.configure_cache(maxsize=256, ttl=300)
+        university_db.add_degree('BSCS', 'Computer Science', 'BS')
+        university_db.add_course('CS1010', 'Programming')
+
+    def tearDown(self):
+        self.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def test_repeated_lookups_are_served_from_the_cache(self):
+        university_db.get_degree_courses('BSCS')
+        misses = university_db.cache_stats()['misses']
+        university_db.get_degree_courses('BSCS')
+        self.assertEqual(university_db.cache_stats()['misses'], misses)
+
+    def test_writes_invalidate_their_lookups(self):
+        self.assertEqual(university_db.get_degree_courses('BSCS'), [])
+        self.assertEqual(university_db.get_degrees_for_course('CS1010'), [])
+        self.assertEqual(university_db.get_degree_goals('BSCS'), [])
+
+        university_db.add_course_degree('CS1010', 'BSCS', True)
+        self.assertEqual([row['courseNumber'] for row in university_db.get_degree_courses('BSCS')], ['CS1010'])
+        self.assertEqual([row['degreeID'] for row in university_db.get_degrees_for_course('CS1010')], ['BSCS'])
+
+        university_db.add_goal('G001', 'BSCS', 'Programming')
+        self.assertEqual([row['goalCode'] for row in university_db.get_degree_goals('BSCS')], ['G001'])
+
+        invalidations = university_db.cache_stats()['invalidations']
+        university_db.associate_course_with_goal('CS1010', 'BSCS', 'G001')
+        self.assertGreater(university_db.cache_stats()['invalidations'], invalidations)
+
+    def test_new_degree_replaces_a_cached_empty_result(self):
+        self.assertEqual(university_db.get_degree_goals('MSCS'), [])
+        university_db.add_degree('MSCS', 'Computer Science', 'MS')
+        university_db.add_goal('G001', 'MSCS', 'Research')
+        self.assertEqual(len(university_db.get_degree_goals('MSCS')), 1)
+
+    def test_returned_rows_are_copies(self):
+        university_db.add_course_degree('CS1010', 'BSCS', True)
+        university_db.get_degree_courses('BSCS')[0]['name'] = 'Changed'
+        self.assertEqual(university_db.get_degree_courses('BSCS')[0]['name'], 'Programming')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Writes that refer to missing rows raise NotFoundError naming the first missing key."""
+import unittest
+
+import university_db
+from university_db import NotFoundError
+
+
+class ReferencedKeysTest(unittest.TestCase):
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.keeper = university_db.connect_to_db()
+        university_db.add_degree('BSCS', 'Computer Science', 'BS')
+        university_db.add_degree('MSCS', 'Computer Science', 'MS')
+        university_db.add_goal('G001', 'BSCS', 'Programming')
+        university_db.add_course('CS1010', 'Programming')
+        university_db.add_course_degree('CS1010', 'BSCS', True)
+        university_db.add_instructor('12345678', 'Ada Lovelace')
+        university_db.add_semester('2024', 'Fall')
+
+    def tearDown(self):
+        self.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def assertMissing(self, error, message, func, *args):
+        with self.assertRaises(error) as caught:
+            func(*args)
+        self.assertEqual(str(caught.exception), message)
+
+    def count(self, table):
+        cursor = self.keeper.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        return cursor.fetchone()[0]
+
+    def test_add_goal(self):
+        self.assertMissing(NotFoundError, "No matching Degree ID found for: PHD1",
+                           university_db.add_goal, 'G002', 'PHD1', 'Research')
+
+    def test_add_section(self):
+        add = university_db.add_section
+        self.assertMissing(NotFoundError, "No match found for Instructor ID: 99999999",
+                           add, 'CS9999', '001', '2024', 'Fall', '99999999', '10')
+        self.assertMissing(NotFoundError, "No match found for Course Number: CS9999",
+                           add, 'CS9999', '001', '2024', 'Fall', '12345678', '10')
+        self.assertEqual(self.count('Section'), 0)
+
+    def test_add_section_for_a_missing_semester(self):
+        # Not one of the checked keys: the foreign-key error itself is raised
+        with self.assertRaises(university_db.DatabaseError):
+            university_db.add_section('CS1010', '001', '2030', 'Spring', '12345678', '10')
+
+    def test_add_course_to_semester(self):
+        add = university_db.add_course_to_semester
+        self.assertMissing(NotFoundError, "No matching Course Number found: CS9999",
+                           add, 'CS9999', '001', '2025', 'Spring', '99999999', 10)
+        self.assertMissing(NotFoundError, "No matching Instructor ID found: 99999999",
+                           add, 'CS1010', '001', '2025', 'Spring', '99999999', 10)
+        self.assertEqual((self.count('Section'), self.count('Semester')), (0, 1))
+
+    def test_add_course_degree(self):
+        add = university_db.add_course_degree
+        self.assertMissing(NotFoundError, "No matching course found for Course Number: CS9999",
+                           add, 'CS9999', 'PHD1', True)
+        self.assertMissing(NotFoundError, "No matching degree found for Degree ID: PHD1",
+                           add, 'CS1010', 'PHD1', True)
+
+    def test_associate_course_with_goal(self):
+        associate = university_db.associate_course_with_goal
+        self.assertMissing(NotFoundError, "No matching course found for Course Number: CS9999.",
+                           associate, 'CS9999', 'PHD1', 'G009')
+        self.assertMissing(NotFoundError, "No matching degree found for Degree ID: PHD1.",
+                           associate, 'CS1010', 'PHD1', 'G009')
+        self.assertMissing(NotFoundError, "No matching goal found for Goal Code: G009 and Degree ID: BSCS.",
+                           associate, 'CS1010', 'BSCS', 'G009')
+        university_db.add_goal('G001', 'MSCS', 'Research')
+        self.assertMissing(university_db.ValidationError, "The course CS1010 is not associated with the degree MSCS.",
+                           associate, 'CS1010', 'MSCS', 'G001')
+
+    def test_existing_keys_are_written(self):
+        university_db.add_section('CS1010', '001', '2024', 'Fall', '12345678', '10')
+        university_db.add_goal('G002', 'BSCS', 'Design')
+        university_db.associate_course_with_goal('CS1010', 'BSCS', 'G002')
+        self.assertEqual(self.count('Section'), 1)
+        self.assertEqual(self.count('Evaluation'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Sections get one Evaluation row per (degree, goal) of their course, created set-based."""
+import unittest
+
+import university_db
+
+
+class ScaffoldingTest(unittest.TestCase):
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.keeper = university_db.connect_to_db()
+        for degree, level in (('BSCS', 'BS'), ('MSCS', 'MS')):
+            university_db.add_degree(degree, 'Computer Science', level)
+            for goal in ('G001', 'G002', 'G003'):
+                university_db.add_goal(goal, degree, f"Goal {goal}")
+        university_db.add_course('CS1010', 'Programming')
+        university_db.add_course('CS2020', 'Data Structures')
+        university_db.add_course_degree('CS1010', 'BSCS', True)
+        university_db.add_course_degree('CS1010', 'MSCS', False)
+        university_db.add_course_degree('CS2020', 'BSCS', True)
+        university_db.add_instructor('12345678', 'Ada Lovelace')
+
+    def tearDown(self):
+        self.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def evaluations(self, *section):
+        cursor = self.keeper.cursor()
+        cursor.execute("""
+            SELECT degreeID, goalCode FROM Evaluation
+            WHERE courseNumber = %s AND sectionID = %s AND year = %s AND term = %s
+            ORDER BY degreeID, goalCode
+        """, section)
+        return cursor.fetchall()
+
+    def test_add_section_scaffolds_every_degree_goal(self):
+        university_db.add_semester('2024', 'Fall')
+        university_db.add_section('CS1010', '001', '2024', 'Fall', '12345678', '30')
+        self.assertEqual(self.evaluations('CS1010', '001', 2024, 'Fall'),
+                         [(d, g) for d in ('BSCS', 'MSCS') for g in ('G001', 'G002', 'G003')])
+
+    def test_add_course_to_semester_creates_the_semester(self):
+        university_db.add_course_to_semester('CS2020', '001', '2025', 'Spring', '12345678', 12)
+        self.assertEqual(university_db.get_semesters(), [(2025, 'Spring')])
+        self.assertEqual(len(self.evaluations('CS2020', '001', 2025, 'Spring')), 3)
+
+    def test_failed_section_insert_leaves_nothing_behind(self):
+        with self.assertRaises(university_db.NotFoundError):
+            university_db.add_course_to_semester('CS1010', '001', '2024', 'Fall', '99999999', 30)
+        self.assertEqual(university_db.get_semesters(), [])
+        self.assertEqual(self.evaluations('CS1010', '001', 2024, 'Fall'), [])
+
+    def test_scaffold_semester_fills_only_missing_rows(self):
+        university_db.add_course_to_semester('CS1010', '001', '2024', 'Fall', '12345678', 30)
+        university_db.update_evaluation('CS1010', '001', 2024, 'Fall', 'BSCS', 'G001', 'Quiz', 10, 10, 5, 5, 'Keep')
+        conn = university_db.connect_to_db()
+        try:
+            cursor = conn.cursor()
+            # Rows missing as if written by another tool
+            cursor.execute("DELETE FROM Evaluation WHERE degreeID = %s", ('MSCS',))
+            cursor.execute("""
+                INSERT INTO Section (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, ('CS2020', '001', 2024, 'Fall', '12345678', 20))
+            conn.commit()
+        finally:
+            conn.close()
+
+        self.assertEqual(university_db.scaffold_semester_evaluations('2024', 'Fall'), 3 + 3)
+        self.assertEqual(len(self.evaluations('CS1010', '001', 2024, 'Fall')), 6)
+        self.assertEqual(len(self.evaluations('CS2020', '001', 2024, 'Fall')), 3)
+        self.assertEqual(university_db.scaffold_semester_evaluations('2024', 'Fall'), 0)
+        [kept] = [row for row in university_db.get_evaluations_for_section('CS1010', '001', 2024, 'Fall')
+                  if row['degreeID'] == 'BSCS' and row['goalCode'] == 'G001']
+        self.assertEqual((kept['gradeCountA'], kept['improvementNote']), (10, 'Keep'))
+
+    def test_scaffold_semester_validates(self):
+        with self.assertRaises(university_db.ValidationError):
+            university_db.scaffold_semester_evaluations('24', 'Fall')
+        with self.assertRaises(university_db.ValidationError):
+            university_db.scaffold_semester_evaluations('2024', 'Winter')
+
+
+if __name__ == '__main__':
+    unittest.main()
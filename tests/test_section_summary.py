@@ -0,0 +1,122 @@
+"""SectionSummary stays equal to the summary computed from Evaluation across the writes."""
+import contextlib
+import io
+import unittest
+
+import db_migrations
+import university_db
+
+COLUMNS = ('courseNumber', 'sectionID', 'year', 'term', 'evaluationCount', 'enteredCount', 'gradedCount',
+           'noteCount', 'gradeCountA', 'gradeCountB', 'gradeCountC', 'gradeCountF', 'status')
+
+_LIVE_SQL = f"""
+    SELECT s.courseNumber, s.sectionID, s.year, s.term, COUNT(e.courseNumber),
+           COALESCE(SUM(CASE WHEN e.evaluationType IS NOT NULL OR e.gradeCountA IS NOT NULL THEN 1 ELSE 0 END), 0),
+           COALESCE(SUM(CASE WHEN e.gradeCountA + e.gradeCountB + e.gradeCountC + e.gradeCountF > 0
+                             THEN 1 ELSE 0 END), 0),
+           COALESCE(SUM(CASE WHEN TRIM(e.improvementNote) <> '' THEN 1 ELSE 0 END), 0),
+           COALESCE(SUM(e.gradeCountA), 0), COALESCE(SUM(e.gradeCountB), 0),
+           COALESCE(SUM(e.gradeCountC), 0), COALESCE(SUM(e.gradeCountF), 0),
+           {university_db.SECTION_STATUS_SQL}
+    FROM Section s
+    LEFT JOIN Evaluation e
+      ON s.courseNumber = e.courseNumber
+     AND s.sectionID = e.sectionID
+     AND s.year = e.year
+     AND s.term = e.term
+    GROUP BY s.courseNumber, s.sectionID, s.year, s.term
+    ORDER BY s.courseNumber, s.sectionID, s.year, s.term
+"""
+
+
+class SectionSummaryTest(unittest.TestCase):
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.keeper = university_db.connect_to_db()
+        university_db.add_degree('BSCS', 'Computer Science', 'BS')
+        university_db.add_goal('G001', 'BSCS', 'Programming')
+        university_db.add_goal('G002', 'BSCS', 'Design')
+        university_db.add_course('CS1010', 'Programming')
+        university_db.add_course('CS2020', 'Data Structures')
+        university_db.add_course_degree('CS1010', 'BSCS', True)
+        university_db.add_instructor('12345678', 'Ada Lovelace')
+
+    def tearDown(self):
+        self.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def query(self, sql, params=()):
+        conn = university_db.connect_to_db()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            rows = cursor.fetchall() if cursor.description else None
+            conn.commit()
+        finally:
+            conn.close()
+        return rows
+
+    def stored(self):
+        return self.query(f"SELECT {', '.join(COLUMNS)} FROM SectionSummary "
+                          "ORDER BY courseNumber, sectionID, year, term")
+
+    def assertSummariesCurrent(self):
+        live = self.query(_LIVE_SQL)
+        self.assertEqual(self.stored(), live)
+        return live
+
+    def test_kept_current_by_the_writes(self):
+        university_db.add_semester('2024', 'Fall')
+        university_db.add_section('CS1010', '001', '2024', 'Fall', '12345678', '30')
+        university_db.add_course_to_semester('CS2020', '001', '2024', 'Fall', '12345678', 15)
+        university_db.add_course_to_semester('CS1010', '002', '2025', 'Spring', '12345678', 25)
+        self.assertEqual(len(self.assertSummariesCurrent()), 3)
+
+        university_db.update_evaluation('CS1010', '001', 2024, 'Fall', 'BSCS', 'G001', 'Quiz', 10, 10, 5, 5, None)
+        self.assertEqual(self.assertSummariesCurrent()[0][-1], "Fully Entered (No Improvement Note)")
+        university_db.update_evaluation('CS1010', '001', 2024, 'Fall', 'BSCS', 'G002', None, 0, 0, 0, 0, 'Revise')
+        self.assertEqual(self.assertSummariesCurrent()[0][-1], "Fully Entered (With Improvement Note)")
+
+        university_db.update_evaluations_batch([
+            ('CS1010', '002', 2025, 'Spring', 'BSCS', 'G001', 'Project', 5, 5, 5, 10, None)])
+        self.assertSummariesCurrent()
+
+        university_db.add_goal('G003', 'BSCS', 'Testing')
+        university_db.associate_course_with_goal('CS1010', 'BSCS', 'G003')
+        self.assertEqual([row[4] for row in self.assertSummariesCurrent()], [3, 3, 0])
+
+    def test_scaffolding_a_semester_refreshes_it(self):
+        university_db.add_semester('2024', 'Fall')
+        self.query("""
+            INSERT INTO Section (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, ('CS1010', '001', 2024, 'Fall', '12345678', 30))
+        university_db.scaffold_semester_evaluations('2024', 'Fall')
+        self.assertEqual(self.assertSummariesCurrent()[0][4], 2)
+
+    def test_deleted_sections_take_their_summary_along(self):
+        university_db.add_course_to_semester('CS1010', '001', '2024', 'Fall', '12345678', 30)
+        self.query("DELETE FROM Section WHERE courseNumber = %s", ('CS1010',))
+        self.assertEqual(self.stored(), [])
+
+    def test_rebuild_after_cascaded_deletes(self):
+        university_db.add_course_to_semester('CS1010', '001', '2024', 'Fall', '12345678', 30)
+        university_db.update_evaluation('CS1010', '001', 2024, 'Fall', 'BSCS', 'G001', 'Quiz', 10, 10, 5, 5, 'Note')
+        # Deleting the goal cascades its evaluations away behind university_db's back
+        self.query("DELETE FROM Goal WHERE goalCode = %s", ('G001',))
+        self.assertNotEqual(self.stored(), self.query(_LIVE_SQL))
+        self.assertEqual(university_db.rebuild_section_summaries(2024, 'Fall'), 1)
+        self.assertEqual(self.assertSummariesCurrent()[0][-1], "Partially Entered")
+
+    def test_rebuild_command_covers_every_semester(self):
+        for year, term in ((2024, 'Fall'), (2025, 'Spring')):
+            university_db.add_course_to_semester('CS1010', '001', year, term, '12345678', 30)
+        self.query("DELETE FROM SectionSummary")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(db_migrations.rebuild_derived(university_db), 0)
+        self.assertEqual(len(self.assertSummariesCurrent()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Semester ranges include both boundary terms and order sections by semester across years."""
+import unittest
+
+import university_db
+
+SEMESTERS = [(2023, 'Spring'), (2023, 'Summer'), (2023, 'Fall'),
+             (2024, 'Spring'), (2024, 'Summer'), (2024, 'Fall'), (2025, 'Spring')]
+
+
+class SemesterRangeTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        university_db.configure_backend('sqlite', path=':memory:')
+        cls.keeper = university_db.connect_to_db()
+        university_db.add_course('CS1010', 'Programming')
+        university_db.add_course('CS2020', 'Data Structures')
+        university_db.add_instructor('12345678', 'Ada Lovelace')
+        university_db.add_instructor('87654321', 'Alan Turing')
+        # Inserted newest first, so the ordering cannot come from insertion order
+        for year, term in reversed(SEMESTERS):
+            university_db.add_course_to_semester('CS1010', '002', year, term, '12345678', 10)
+            university_db.add_course_to_semester('CS1010', '001', year, term, '87654321', 10)
+            university_db.add_course_to_semester('CS2020', '001', year, term, '12345678', 10)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def course_range(self, *bounds):
+        return [(row['year'], row['term'], row['sectionID'])
+                for row in university_db.get_course_sections_in_range('CS1010', *bounds)]
+
+    def instructor_range(self, *bounds):
+        return [(row['year'], row['term'], row['courseNumber'], row['sectionID'])
+                for row in university_db.get_instructor_sections_in_range('12345678', *bounds)]
+
+    def test_boundary_terms_across_a_year(self):
+        self.assertEqual(self.course_range(2023, 'Summer', 2024, 'Summer'), [
+            (2023, 'Summer', '001'), (2023, 'Summer', '002'),
+            (2023, 'Fall', '001'), (2023, 'Fall', '002'),
+            (2024, 'Spring', '001'), (2024, 'Spring', '002'),
+            (2024, 'Summer', '001'), (2024, 'Summer', '002'),
+        ])
+
+    def test_fall_to_spring(self):
+        self.assertEqual(self.instructor_range(2023, 'Fall', 2024, 'Spring'), [
+            (2023, 'Fall', 'CS1010', '002'), (2023, 'Fall', 'CS2020', '001'),
+            (2024, 'Spring', 'CS1010', '002'), (2024, 'Spring', 'CS2020', '001'),
+        ])
+
+    def test_single_semester_and_whole_span(self):
+        self.assertEqual(self.course_range(2024, 'Fall', 2024, 'Fall'), [(2024, 'Fall', '001'), (2024, 'Fall', '002')])
+        self.assertEqual(self.course_range('2020', 'Spring', '2030', 'Fall'),
+                         [(year, term, section) for year, term in SEMESTERS for section in ('001', '002')])
+
+    def test_within_one_year(self):
+        # On SQLite the term index sorts Fall first; the result must not
+        self.assertEqual([row[:2] for row in self.instructor_range(2024, 'Spring', 2024, 'Fall')],
+                         [(2024, 'Spring')] * 2 + [(2024, 'Summer')] * 2 + [(2024, 'Fall')] * 2)
+
+    def test_reversed_range_is_empty(self):
+        self.assertEqual(self.course_range(2024, 'Summer', 2024, 'Spring'), [])
+        self.assertEqual(self.course_range(2025, 'Spring', 2023, 'Fall'), [])
+
+    def test_invalid_bounds(self):
+        for bounds in ((23, 'Fall', 2024, 'Fall'), (2023, 'Fall', 'next', 'Fall'),
+                       (2023, 'Autumn', 2024, 'Fall'), (2023, 'Fall', 2024, 'fall')):
+            with self.subTest(bounds=bounds), self.assertRaises(university_db.ValidationError):
+                university_db.get_course_sections_in_range('CS1010', *bounds)
+
+    def test_semester_ordinal_follows_the_calendar(self):
+        ordinals = [university_db.semester_ordinal(year, term) for year, term in SEMESTERS]
+        self.assertEqual(ordinals, sorted(ordinals))
+        self.assertEqual(university_db.semester_ordinal('2024', 'Summer'), university_db.semester_ordinal(2024, 'Summer'))
+
+
+if __name__ == '__main__':
+    unittest.main()
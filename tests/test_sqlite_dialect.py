@@ -0,0 +1,98 @@
+"""The SQLite backend's translation of the application's MySQL statements."""
+import unittest
+
+import university_db
+from db_backends import IntegrityError, SQLiteDialect, errorcode
+
+
+class TranslateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dialect = SQLiteDialect()
+
+    def test_placeholders(self):
+        sql = "SELECT name FROM Course WHERE courseNumber = %s AND name LIKE '%s'"
+        self.assertEqual(self.dialect.translate(sql),
+                         ["SELECT name FROM Course WHERE courseNumber = ? AND name LIKE '%s'"])
+
+    def test_insert_ignore(self):
+        [sql] = self.dialect.translate("INSERT IGNORE INTO Semester (year, term) VALUES (%s, %s)")
+        self.assertEqual(sql, "INSERT OR IGNORE INTO Semester (year, term) VALUES (?, ?)")
+
+    def test_enum_becomes_check(self):
+        statements = self.dialect.translate("""
+            CREATE TABLE IF NOT EXISTS Semester (
+                year INT NOT NULL,
+                term ENUM('Spring', 'Summer', 'Fall') NOT NULL,
+                PRIMARY KEY (year, term)
+            );
+        """)
+        self.assertEqual(len(statements), 1)
+        self.assertIn("term TEXT CHECK (term IN ('Spring', 'Summer', 'Fall')) NOT NULL", statements[0])
+        self.assertNotIn('ENUM', statements[0])
+
+    def test_translations_are_cached(self):
+        sql = "SELECT 1 FROM Degree WHERE degreeID = %s"
+        self.assertIs(self.dialect.translate(sql), self.dialect.translate(sql))
+
+
+class SQLiteStatementTest(unittest.TestCase):
+    """Runs the MySQL statements against a fresh in-memory database."""
+
+    def setUp(self):
+        university_db.configure_backend('sqlite', path=':memory:')
+        self.conn = university_db.connect_to_db()
+        self.assertIsNotNone(self.conn)
+        self.cursor = self.conn.cursor()
+
+    def tearDown(self):
+        self.conn.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def test_insert_ignore_skips_duplicates(self):
+        self.cursor.execute("INSERT IGNORE INTO Semester (year, term) VALUES (%s, %s)", (2024, 'Fall'))
+        self.assertEqual(self.cursor.rowcount, 1)
+        self.cursor.execute("INSERT IGNORE INTO Semester (year, term) VALUES (%s, %s)", (2024, 'Fall'))
+        self.assertEqual(self.cursor.rowcount, 0)
+        self.cursor.execute("SELECT COUNT(*) FROM Semester")
+        self.assertEqual(self.cursor.fetchone()[0], 1)
+
+    def test_on_duplicate_key_update_upserts(self):
+        university_db.add_instructor('12345678', 'Ada Lovelace')
+        upsert = """
+            INSERT INTO Instructor (instructorID, name) VALUES (%s, %s)
+            ON DUPLICATE KEY UPDATE name = VALUES(name)
+        """
+        self.cursor.execute(upsert, ('12345678', 'Grace Hopper'))
+        self.cursor.execute(upsert, ('87654321', 'Alan Turing'))
+        self.conn.commit()
+        self.cursor.execute("SELECT instructorID, name FROM Instructor ORDER BY instructorID")
+        self.assertEqual(self.cursor.fetchall(), [('12345678', 'Grace Hopper'), ('87654321', 'Alan Turing')])
+
+    def test_enum_check_rejects_other_values(self):
+        with self.assertRaises(IntegrityError) as caught:
+            self.cursor.execute("INSERT INTO Semester (year, term) VALUES (%s, %s)", (2024, 'Winter'))
+        self.assertEqual(caught.exception.errno, errorcode.ER_CHECK_CONSTRAINT_VIOLATED)
+
+    def test_foreign_key_failure(self):
+        with self.assertRaises(IntegrityError) as caught:
+            self.cursor.execute("INSERT INTO Goal (goalCode, degreeID, description) VALUES (%s, %s, %s)",
+                                ('G001', 'NOPE', 'Missing degree'))
+        self.assertEqual(caught.exception.errno, errorcode.ER_NO_REFERENCED_ROW_2)
+
+    def test_duplicate_key_names_the_constraint(self):
+        university_db.add_degree('BSCS', 'Computer Science', 'BS')
+        with self.assertRaisesRegex(university_db.DuplicateError, 'ID'):
+            university_db.add_degree('BSCS', 'Mathematics', 'BS')
+        with self.assertRaisesRegex(university_db.DuplicateError, 'name and level'):
+            university_db.add_degree('BSCS2', 'Computer Science', 'BS')
+
+    def test_dictionary_cursor(self):
+        university_db.add_course('CS1010', 'Programming')
+        cursor = self.conn.cursor(dictionary=True)
+        cursor.execute("SELECT courseNumber, name FROM Course WHERE courseNumber = %s", ('CS1010',))
+        self.assertEqual(cursor.fetchall(), [{'courseNumber': 'CS1010', 'name': 'Programming'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""get_evaluation_status_for_sections agrees with the semester status for the sections asked for."""
+import unittest
+from unittest import mock
+
+import datagen
+import university_db
+
+
+class StatusForSectionsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        university_db.configure_backend('sqlite', path=':memory:')
+        cls.keeper = university_db.connect_to_db()
+        sample = datagen.generate(evaluations=400, seed=5)['sample']
+        cls.year, cls.term = sample['year'], sample['term']
+        cls.semester = university_db.get_evaluation_status_for_semester(cls.year, cls.term)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def key(self, row):
+        return (row['courseNumber'], row['sectionID'], self.year, self.term)
+
+    def test_matches_the_semester_status_in_the_given_order(self):
+        rows = list(reversed(self.semester))
+        found = university_db.get_evaluation_status_for_sections([self.key(row) for row in rows])
+        self.assertEqual([(self.key(row), row['status']) for row in found],
+                         [(self.key(row), row['status']) for row in rows])
+
+    def test_chunks_the_keys(self):
+        with mock.patch.object(university_db, 'STATUS_KEYS_PER_QUERY', 3):
+            found = university_db.get_evaluation_status_for_sections([self.key(row) for row in self.semester])
+        self.assertEqual([row['status'] for row in found], [row['status'] for row in self.semester])
+
+    def test_skips_duplicates_and_unknown_sections(self):
+        first = self.key(self.semester[0])
+        found = university_db.get_evaluation_status_for_sections(
+            [first, ('ZZ9999', '001', self.year, self.term), first])
+        self.assertEqual([self.key(row) for row in found], [first])
+
+    def test_accepts_string_years(self):
+        course, section, year, term = self.key(self.semester[0])
+        found = university_db.get_evaluation_status_for_sections([(course, section, str(year), term)])
+        self.assertEqual(found[0]['status'], self.semester[0]['status'])
+
+    def test_rejects_malformed_keys(self):
+        self.assertEqual(university_db.get_evaluation_status_for_sections([]), [])
+        with self.assertRaises(university_db.ValidationError):
+            university_db.get_evaluation_status_for_sections([('CS1010', '001', 2024)])
+        with self.assertRaises(university_db.ValidationError):
+            university_db.get_evaluation_status_for_sections([('CS1010', '001', 2024, 'Winter')])
+
+
+if __name__ == '__main__':
+    unittest.main()
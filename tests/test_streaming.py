@@ -0,0 +1,80 @@
+"""The iter_* variants stream the same rows as their get_* counterparts and give the connection back."""
+import unittest
+
+import datagen
+import university_db
+
+
+class StreamingTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        university_db.configure_backend('sqlite', path=':memory:')
+        cls.keeper = university_db.connect_to_db()
+        cls.sample = datagen.generate(evaluations=600, seed=7)['sample']
+        cls.year, cls.term = cls.sample['year'], cls.sample['term']
+        cls.first, cls.last = cls.sample['first'], cls.sample['last']
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.keeper.close()
+        university_db.configure_backend('sqlite', path=':memory:')
+
+    def in_use(self):
+        return university_db.pool_stats()['in_use']
+
+    def assertStreams(self, get, stream):
+        rows = get()
+        self.assertTrue(rows)
+        for batch_size in (1, 7, None):
+            with self.subTest(batch_size=batch_size):
+                self.assertEqual(list(stream(batch_size)), rows)
+
+    def test_same_rows_as_the_lists(self):
+        y, t = self.year, self.term
+        instructor = self.sample['instructors'][0]
+        course = self.sample['courses'][0]
+        self.assertStreams(lambda: university_db.get_evaluation_status_for_semester(y, t),
+                           lambda b: university_db.iter_evaluation_status_for_semester(y, t, batch_size=b))
+        self.assertStreams(lambda: university_db.get_sections_above_percentage(y, t, 40, 'avg'),
+                           lambda b: university_db.iter_sections_above_percentage(y, t, 40, 'avg', batch_size=b))
+        self.assertStreams(lambda: university_db.get_sections_above_percentage(y, t, 40, use_stored=True),
+                           lambda b: university_db.iter_sections_above_percentage(y, t, 40, use_stored=True,
+                                                                                  batch_size=b))
+        self.assertStreams(lambda: university_db.get_sections_for_instructor(y, t, instructor),
+                           lambda b: university_db.iter_sections_for_instructor(y, t, instructor, batch_size=b))
+        self.assertStreams(lambda: university_db.get_course_sections_in_range(course, *self.first, *self.last),
+                           lambda b: university_db.iter_course_sections_in_range(course, *self.first, *self.last,
+                                                                                 batch_size=b))
+        self.assertStreams(lambda: university_db.get_instructor_sections_in_range(instructor, *self.first, *self.last),
+                           lambda b: university_db.iter_instructor_sections_in_range(instructor, *self.first,
+                                                                                     *self.last, batch_size=b))
+
+    def test_connection_is_held_only_while_streaming(self):
+        before = self.in_use()
+        rows = university_db.iter_evaluation_status_for_semester(self.year, self.term, batch_size=2)
+        self.assertEqual(self.in_use(), before)
+        next(rows)
+        self.assertEqual(self.in_use(), before + 1)
+        for _ in rows:
+            pass
+        self.assertEqual(self.in_use(), before)
+
+    def test_abandoned_stream_gives_the_connection_back(self):
+        before = self.in_use()
+        rows = university_db.iter_evaluation_status_for_semester(self.year, self.term, batch_size=2)
+        next(rows)
+        rows.close()
+        self.assertEqual(self.in_use(), before)
+
+    def test_options_are_validated_before_iterating(self):
+        with self.assertRaises(university_db.ValidationError):
+            university_db.iter_sections_above_percentage(self.year, self.term, 50, rule='median')
+        with self.assertRaises(university_db.ValidationError):
+            university_db.iter_sections_above_percentage(self.year, self.term, 50, rule='all', use_stored=True)
+        with self.assertRaises(university_db.ValidationError):
+            university_db.iter_course_sections_in_range('CS1010', 2024, 'Winter', 2025, 'Fall')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,2023 @@
+"""
+Data access for the university database, without any user interface.
+
+Functions validate their input, raise the exceptions below (or the backend's
+DatabaseError) on failure, and return plain rows. Database.py puts the Tk GUI on top.
+The MySQL driver is only imported when the first MySQL connection is opened.
+"""
+import base64
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from db_backends import (DatabaseError, IntegrityError, OperationalError, ProgrammingError, backend_from_env,
+                         errorcode, make_backend, statement_stats)
+from db_cache import QueryCache, cache_settings_from_env
+from db_metrics import metrics
+from db_migrations import MigrationError, discover, migrate
+from db_pool import ConnectionPool, PoolClosedError, PoolTimeoutError, pool_size_from_env
+
+# The public API; also what `from university_db import *` (as in Database.py) brings in
+__all__ = [
+    # Errors
+    'UniversityDBError', 'ValidationError', 'InputError', 'NotFoundError', 'DuplicateError',
+    'DatabaseUnavailableError', 'DatabaseError',
+    # Backend, pool, metrics and cache
+    'DB_CONFIG', 'SQLITE_PATH', 'get_backend', 'configure_backend', 'get_pool', 'configure_pool',
+    'pool_stats', 'statement_stats', 'query_stats', 'dump_query_stats', 'configure_metrics',
+    'reset_query_stats', 'cache_stats', 'configure_cache', 'clear_cache', 'connect_to_db',
+    'handle_mysql_error',
+    # Validation rules
+    'VALID_LEVELS', 'VALID_TERMS', 'TERM_ORDER', 'NAME_PATTERN', 'COURSE_NUMBER_PATTERN',
+    'INSTRUCTOR_ID_PATTERN', 'GOAL_CODE_PATTERN', 'semester_ordinal',
+    # Writes and derived tables
+    'add_degree', 'add_course', 'add_instructor', 'add_goal', 'add_semester', 'add_section',
+    'add_course_degree', 'associate_course_with_goal', 'add_course_to_semester',
+    'scaffold_section', 'scaffold_semester', 'scaffold_semester_evaluations',
+    'SECTION_STATUS_SQL', 'refresh_section_summary', 'rebuild_section_summaries',
+    'refresh_section_pass_rate', 'refresh_section_pass_rates',
+    'update_evaluation', 'update_evaluations_batch',
+    'EVALUATION_SAVED', 'EVALUATION_FAILED', 'EVALUATION_ROLLED_BACK',
+    # Queries
+    'get_semesters', 'get_available_courses_for_semester', 'get_evaluation_status_for_semester',
+    'STATUS_KEYS_PER_QUERY', 'get_evaluation_status_for_sections',
+    'PASS_RATE_RULES', 'STORED_PASS_RATE_RULE', 'get_sections_above_percentage',
+    'get_sections_for_instructor', 'get_evaluations_for_section', 'get_degrees_for_course',
+    'get_degree_courses', 'get_degree_goals', 'get_courses_for_goals', 'get_improvement_notes',
+    'get_course_sections_in_range', 'get_instructor_sections_in_range',
+    # Streaming, paginated and batch variants
+    'STREAM_BATCH_SIZE', 'iter_evaluation_status_for_semester', 'iter_sections_above_percentage',
+    'iter_sections_for_instructor', 'iter_course_sections_in_range', 'iter_instructor_sections_in_range',
+    'PAGE_SIZE', 'page_evaluation_status_for_semester', 'page_sections_for_instructor',
+    'page_course_sections_in_range', 'page_instructor_sections_in_range',
+    'BATCH_KEYS_PER_QUERY', 'BATCH_WORKERS', 'run_batch', 'get_evaluation_status_for_semesters',
+    'get_sections_above_percentage_for_semesters', 'get_sections_for_instructors',
+    'get_degree_courses_for_degrees',
+]
+
+
+class UniversityDBError(Exception):
+    """Base class for the errors raised by the data-access functions."""
+
+
+class ValidationError(UniversityDBError, ValueError):
+    """A value is malformed, or refers to a record that does not exist."""
+
+
+class InputError(ValidationError):
+    """A required field is empty."""
+
+
+class NotFoundError(ValidationError):
+    """A referenced record (course, degree, instructor, goal, ...) does not exist."""
+
+
+class DuplicateError(UniversityDBError):
+    """The record being added already exists."""
+
+
+class DatabaseUnavailableError(UniversityDBError, ConnectionError):
+    """No database connection could be established."""
+
+
+# Database connection setup
+DB_CONFIG = {
+    'host': "localhost",
+    'user': "cs5330",
+    'password': "pw5330",
+    'charset': 'utf8mb4',
+}
+SQLITE_PATH = os.path.join(os.path.dirname(__file__), 'university.sqlite3')
+
+_backend = None
+_pool = None
+_pool_lock = threading.Lock()
+_schema_checked = False
+# Catalog lookups (degree courses and goals, a course's degrees) that change rarely
+_reference_cache = QueryCache(*cache_settings_from_env())
+
+
+def get_backend():
+    """Return the configured database backend (MySQL unless UNIVERSITY_DB_BACKEND says otherwise)."""
+    global _backend
+    if _backend is None:
+        with _pool_lock:
+            if _backend is None:
+                _backend = backend_from_env(DB_CONFIG, SQLITE_PATH)
+    return _backend
+
+
+def configure_backend(name, path=None, database='university'):
+    """
+    Switch the database backend, closing any pooled connections to the previous one.
+
+    Parameters:
+        name (str): 'mysql' or 'sqlite'.
+        path (str): The SQLite database file (or ':memory:'). Ignored for MySQL.
+        database (str): The MySQL database to use. Ignored for SQLite.
+
+    Returns:
+        The new backend.
+    """
+    global _backend, _pool, _schema_checked
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+        _backend = make_backend(name, mysql_config=DB_CONFIG, path=path or SQLITE_PATH, database=database)
+        _pool = None
+        _schema_checked = False
+    _reference_cache.clear()
+    return _backend
+
+
+def _open_connection():
+    """
+    Open a new backend connection. The first connection of the process checks the
+    schema version (one query) and applies any pending migrations.
+    """
+    global _schema_checked
+    backend = get_backend()
+    conn, _ = backend.connect()
+    if not _schema_checked:
+        with _pool_lock:
+            if not _schema_checked:
+                try:
+                    migrate(conn, backend.name, discover(backend.name))
+                except Exception:
+                    conn.close()
+                    raise
+                _schema_checked = True
+    return conn
+
+
+def get_pool():
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(_open_connection, size=pool_size_from_env())
+    return _pool
+
+
+def configure_pool(size=None, timeout=None, ping_interval=None):
+    """
+    Adjust the process-wide connection pool.
+
+    Parameters:
+        size (int): The maximum number of open connections.
+        timeout (float): Seconds to wait for a free connection.
+        ping_interval (float): Idle seconds after which a connection is pinged before reuse.
+
+    Returns:
+        ConnectionPool: The configured pool.
+    """
+    pool = get_pool()
+    if size is not None:
+        pool.resize(size)
+    if timeout is not None:
+        pool.timeout = timeout
+    if ping_interval is not None:
+        pool.ping_interval = ping_interval
+    return pool
+
+
+def pool_stats():
+    """Return the connection pool counters (checkouts, waits, creations, ...)."""
+    return get_pool().stats()
+
+
+# statement_stats() (prepares, executions, reuse_rate, ...) comes from db_backends
+
+def query_stats():
+    """
+    Return the sampled statement metrics: per calling function and normalized statement,
+    the count, errors, rows and latency (total, mean, max and rolling p50/p95/p99 with a
+    histogram), plus the connection-acquire times per calling function.
+    """
+    return metrics.stats()
+
+
+def dump_query_stats(path):
+    """Write query_stats() to a JSON file."""
+    metrics.dump(path)
+
+
+def configure_metrics(enabled=None, sample_rate=None, slow_ms=None):
+    """
+    Adjust the statement metrics.
+
+    Parameters:
+        enabled (bool): Record statements at all.
+        sample_rate (float): Share of statements aggregated, between 0 and 1.
+        slow_ms (float): Statements taking at least this many milliseconds go to the slow log.
+    """
+    metrics.configure(enabled, sample_rate, slow_ms)
+
+
+def reset_query_stats():
+    """Forget the statement metrics recorded so far."""
+    metrics.reset()
+
+
+def cache_stats():
+    """Return the reference-data cache counters (hits, misses, hit_rate, ...)."""
+    return _reference_cache.stats()
+
+
+def configure_cache(maxsize=None, ttl=None):
+    """
+    Adjust the reference-data cache.
+
+    Parameters:
+        maxsize (int): The maximum number of cached lookups; 0 turns caching off.
+        ttl (float): Seconds a cached lookup is served before it is re-read.
+    """
+    _reference_cache.configure(maxsize, ttl)
+
+
+def clear_cache():
+    """Forget every cached lookup, e.g. after changing catalog rows with plain SQL."""
+    _reference_cache.clear()
+
+
+def _cached_rows(key, load):
+    # Hand out copies so callers cannot modify the cached rows
+    return [dict(row) for row in _reference_cache.get_or_load(key, load)]
+
+
+def connect_to_db(run_schema=False):
+    """
+    Check a connection out of the pool, creating the database if necessary.
+
+    The returned connection is used like a normal one; close() returns it to the pool.
+    If run_schema is True, migrations added since the process started are applied too.
+    """
+    try:
+        started = time.perf_counter()
+        try:
+            conn = get_pool().checkout()
+        except Exception:
+            metrics.acquire(started, failed=True)
+            raise
+        metrics.acquire(started)
+
+        if run_schema:
+            backend = get_backend()
+            migrate(conn, backend.name, discover(backend.name))
+
+        return conn
+
+    except DatabaseError as err:
+        print(f"Database Error: {err}")
+        return None
+    except MigrationError as err:
+        print(f"Migration Error: {err}")
+        return None
+    except (PoolTimeoutError, PoolClosedError, ImportError) as err:
+        print(f"Database Error: {err}")
+        return None
+
+
+# Validation rules shared by the add_* functions and the bulk loader
+VALID_LEVELS = ['BA', 'BS', 'MS', 'Ph.D.', 'Cert']
+VALID_TERMS = ['Spring', 'Summer', 'Fall']
+# Position of each term within a year; must match Semester.ordinal in the schema
+TERM_ORDER = {'Spring': 1, 'Summer': 2, 'Fall': 3}
+NAME_PATTERN = re.compile(r'^[A-Za-z\s]+$')
+COURSE_NUMBER_PATTERN = re.compile(r'^[A-Z]{2,4}\d{4}$')
+INSTRUCTOR_ID_PATTERN = re.compile(r'^\d{8}$')
+GOAL_CODE_PATTERN = re.compile(r"^[A-Za-z]\d{3}$")
+
+def semester_ordinal(year, term):
+    """
+    Return the sortable ordinal of a semester (year * 10 + term position), as stored in Semester.ordinal.
+
+    Raises:
+        ValidationError: If the year or term is not valid.
+    """
+    _validate_year(year)
+    if term not in TERM_ORDER:
+        raise ValidationError(f"Invalid term. Must be one of: {', '.join(VALID_TERMS)}.")
+    return int(year) * 10 + TERM_ORDER[term]
+
+def handle_mysql_error(err):
+    if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
+        print("Invalid username or password")
+    elif err.errno == errorcode.ER_BAD_DB_ERROR:
+        print("Database does not exist")
+    elif err.errno == errorcode.CR_CONN_HOST_ERROR:
+        print("Database server is not running")
+    else:
+        print(f"MySQL Error: {err}")
+
+def _require_connection():
+    """Check a connection out of the pool, raising if the database cannot be reached."""
+    conn = connect_to_db()
+    if not conn:
+        raise DatabaseUnavailableError("Failed to establish a database connection.")
+    return conn
+
+def _require_fields(message, *values):
+    if any(value is None or not str(value).strip() for value in values):
+        raise InputError(message)
+
+def _validate_year(year):
+    if not str(year).isdigit() or len(str(year)) != 4:
+        raise ValidationError("Year must be a valid 4-digit number.")
+
+def _validate_term(term):
+    if term not in VALID_TERMS:
+        raise ValidationError(f"Invalid term. Must be one of: {', '.join(VALID_TERMS)}.")
+
+def _validate_enrollment(enrollment_count):
+    if not str(enrollment_count).isdigit() or int(enrollment_count) < 0:
+        raise ValidationError("Enrollment count must be a non-negative integer.")
+
+# Existence tests for the keys a write refers to, by kind
+_KEY_EXISTS_SQL = {
+    'course': "SELECT 1 FROM Course WHERE courseNumber = %s",
+    'degree': "SELECT 1 FROM Degree WHERE degreeID = %s",
+    'instructor': "SELECT 1 FROM Instructor WHERE instructorID = %s",
+    'goal': "SELECT 1 FROM Goal WHERE goalCode = %s AND degreeID = %s",
+    'course_degree': "SELECT 1 FROM Course_Degree WHERE courseNumber = %s AND degreeID = %s",
+}
+
+def _require_keys(conn, *checks):
+    """
+    Resolve every referenced key in a single round trip.
+
+    Parameters:
+        conn: The connection to query on.
+        *checks: (kind, params, error) tuples in the order their errors take precedence;
+                 kind names an entry of _KEY_EXISTS_SQL and error is raised if the key is missing.
+
+    Raises:
+        The error of the first check whose key does not exist.
+    """
+    query = "SELECT " + ", ".join(f"EXISTS({_KEY_EXISTS_SQL[kind]})" for kind, _, _ in checks)
+    params = tuple(value for _, key, _ in checks for value in key)
+    # The same few combinations run on every add, so they go through prepared statements
+    cursor = conn.prepared(query)
+    cursor.execute(query, params)
+    found = cursor.fetchall()[0]
+    for (_, _, error), exists in zip(checks, found):
+        if not exists:
+            raise error
+
+def _insert_referencing(conn, cursor, query, params, *checks):
+    """
+    Run an INSERT whose references are enforced by foreign keys, without checking them first.
+
+    Only when the database rejects the row for a missing reference are the keys resolved
+    (in one query, see _require_keys()) to raise the same error a pre-check would have.
+
+    Raises:
+        The error of the first missing key, or the IntegrityError if none is missing.
+    """
+    try:
+        cursor.execute(query, params)
+    except IntegrityError as e:
+        if e.errno != errorcode.ER_NO_REFERENCED_ROW_2:
+            raise
+        conn.rollback()
+        try:
+            _require_keys(conn, *checks)
+        except ValidationError as missing:
+            raise missing from e
+        raise
+
+# Basic record addition functions
+def add_degree(degree_id, name, level):
+    """
+    Add a new degree program.
+    
+    Parameters:
+        degree_id (str): The unique identifier for the degree
+        name (str): The name of the degree program
+        level (str): The academic level (BA, BS, MS, Ph.D., Cert)
+
+    Raises:
+        ValidationError: If a field is missing or invalid.
+        DuplicateError: If the degree ID, or the name and level, is already taken.
+    """
+    _require_fields("All fields (Degree ID, Name, and Level) are required.", degree_id, name, level)
+    if not NAME_PATTERN.match(name):
+        raise ValidationError("Degree name must contain only alphabetic characters and spaces.")
+    if level not in VALID_LEVELS:
+        raise ValidationError(f"Invalid level. Must be one of: {', '.join(VALID_LEVELS)}")
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO Degree (degreeID, name, level)
+            VALUES (%s, %s, %s)
+        """, (degree_id, name, level))
+        conn.commit()
+        # An empty result may have been cached for the ID before the degree existed
+        _reference_cache.invalidate(('degree_courses', degree_id), ('degree_goals', degree_id))
+    except IntegrityError as e:
+        if e.errno == errorcode.ER_DUP_ENTRY:
+            if 'unique_name_level' in str(e):
+                raise DuplicateError("A degree with this name and level already exists.") from e
+            raise DuplicateError("A degree with this ID already exists.") from e
+        raise
+    finally:
+        conn.close()
+
+
+def add_course(course_number, name):
+    """
+    Add a new course to the database.
+
+    Parameters:
+        course_number (str): The unique course number.
+        name (str): The name of the course.
+
+    Raises:
+        ValidationError: If a field is missing or invalid.
+    """
+    _require_fields("Both fields (Course Number and Name) are required.", course_number, name)
+    if not NAME_PATTERN.match(name):
+        raise ValidationError("Course name must contain only alphabetic characters and spaces.")
+    # Validate course number format (2-4 letters + 4 digits)
+    if not COURSE_NUMBER_PATTERN.match(course_number):
+        raise ValidationError("Course number must be 2-4 uppercase letters followed by 4 digits.")
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO Course (courseNumber, name)
+            VALUES (%s, %s)
+        """, (course_number, name))
+        conn.commit()
+        _reference_cache.invalidate(('course_degrees', course_number))
+    finally:
+        conn.close()
+
+
+def add_instructor(instructor_id, name):
+    """
+    Add a new instructor to the database.
+
+    Parameters:
+        instructor_id (str): The unique ID of the instructor.
+        name (str): The name of the instructor.
+
+    Raises:
+        ValidationError: If a field is missing or invalid.
+    """
+    instructor_id = str(instructor_id)
+    _require_fields("Both fields (Instructor ID and Name) are required.", instructor_id, name)
+    if not INSTRUCTOR_ID_PATTERN.match(instructor_id):
+        raise ValidationError("Instructor ID must be exactly 8 numeric characters.")
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO Instructor (instructorID, name)
+            VALUES (%s, %s)
+        """, (instructor_id, name))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def add_goal(goal_code, degree_id, description):
+    """
+    Add a new goal to the database.
+
+    Parameters:
+        goal_code (str): The unique code of the goal.
+        degree_id (str): The ID of the associated degree.
+        description (str): A text description of the goal.
+
+    Raises:
+        ValidationError: If a field is missing or invalid.
+        NotFoundError: If the degree does not exist.
+    """
+    _require_fields("All fields (Goal Code, Degree ID, and Description) are required.", goal_code, degree_id, description)
+    if len(goal_code) != 4:
+        raise ValidationError("Goal code must be exactly 4 characters.")
+    if not GOAL_CODE_PATTERN.match(goal_code):
+        raise ValidationError("Goal code must be any single character followed by 3 positive numbers.")
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        _insert_referencing(conn, cursor, """
+            INSERT INTO Goal (goalCode, degreeID, description)
+            VALUES (%s, %s, %s)
+        """, (goal_code, degree_id, description),
+            ('degree', (degree_id,), NotFoundError(f"No matching Degree ID found for: {degree_id}")))
+        conn.commit()
+        _reference_cache.invalidate(('degree_goals', degree_id))
+    finally:
+        conn.close()
+
+def add_semester(year, term):
+    """
+    Add a new semester to the database.
+
+    Parameters:
+        year (str): The year of the semester.
+        term (str): The term of the semester (e.g., Spring, Summer, Fall).
+
+    Raises:
+        ValidationError: If a field is missing or invalid.
+    """
+    _require_fields("Both fields (Year and Term) are required.", year, term)
+    _validate_year(year)
+    _validate_term(term)
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO Semester (year, term)
+            VALUES (%s, %s)
+        """, (year, term))
+        conn.commit()
+    finally:
+        conn.close()
+
+def scaffold_section(cursor, course_number, section_id, year, term):
+    """
+    Create the empty Evaluation rows for one section: one per (degree, goal) pair of every
+    degree the course belongs to, and its SectionSummary and SectionPassRate rows.
+    Existing Evaluation rows are left alone.
+    Runs on the caller's cursor, so it joins the caller's transaction.
+
+    Returns:
+        int: The number of Evaluation rows created.
+    """
+    cursor.execute("""
+        INSERT IGNORE INTO Evaluation (courseNumber, sectionID, year, term, degreeID, goalCode, gradeCountA, gradeCountB, gradeCountC, gradeCountF)
+        SELECT %s, %s, %s, %s, cd.degreeID, g.goalCode, 0, 0, 0, 0
+        FROM Course_Degree cd
+        JOIN Goal g ON cd.degreeID = g.degreeID
+        WHERE cd.courseNumber = %s
+    """, (course_number, section_id, year, term, course_number))
+    created = cursor.rowcount
+    refresh_section_summary(cursor, course_number, section_id, year, term)
+    refresh_section_pass_rate(cursor, course_number, section_id, year, term)
+    return created
+
+
+def scaffold_semester(cursor, year, term):
+    """
+    Create every missing Evaluation row for all sections of a semester in a single statement
+    on the caller's cursor, then rebuild the semester's SectionSummary and SectionPassRate rows.
+
+    Returns:
+        int: The number of Evaluation rows created.
+    """
+    cursor.execute("""
+        INSERT IGNORE INTO Evaluation (courseNumber, sectionID, year, term, degreeID, goalCode, gradeCountA, gradeCountB, gradeCountC, gradeCountF)
+        SELECT s.courseNumber, s.sectionID, s.year, s.term, cd.degreeID, g.goalCode, 0, 0, 0, 0
+        FROM Section s
+        JOIN Course_Degree cd ON cd.courseNumber = s.courseNumber
+        JOIN Goal g ON g.degreeID = cd.degreeID
+        WHERE s.year = %s AND s.term = %s
+    """, (year, term))
+    created = cursor.rowcount
+    _store_section_summaries(cursor, ('year', 'term'), (year, term))
+    _store_pass_rates(cursor, ('year', 'term'), (year, term))
+    return created
+
+
+def scaffold_semester_evaluations(year, term):
+    """
+    Materialize all missing Evaluation rows for every section offered in a semester.
+
+    Parameters:
+        year (str): The year of the semester.
+        term (str): The term of the semester (e.g., Spring, Summer, Fall).
+
+    Returns:
+        int: The number of Evaluation rows created.
+    """
+    _validate_year(year)
+    _validate_term(term)
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        created = scaffold_semester(cursor, year, term)
+        conn.commit()
+    finally:
+        conn.close()
+    return created
+
+def add_section(course_number, section_id, year, term, instructor_id, enrollment_count):
+    """
+    Add a new section to the database, with its empty Evaluation rows.
+
+    Parameters:
+        course_number (str): The course number associated with the section.
+        section_id (str): The unique ID of the section (3 characters).
+        year (str): The year of the semester.
+        term (str): The term of the semester (e.g., Spring, Summer, Fall).
+        instructor_id (str): The ID of the instructor teaching the section.
+        enrollment_count (str): The number of students enrolled in the section.
+
+    Raises:
+        ValidationError: If a field is missing or invalid.
+        NotFoundError: If the instructor or course does not exist.
+    """
+    _require_fields("All fields are required to add a section.",
+                    course_number, section_id, year, term, instructor_id, enrollment_count)
+    if len(section_id) != 3:
+        raise ValidationError("Section ID must be exactly 3 characters.")
+    _validate_year(year)
+    _validate_term(term)
+    _validate_enrollment(enrollment_count)
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        _insert_referencing(conn, cursor, """
+            INSERT INTO Section (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, (course_number, section_id, year, term, instructor_id, int(enrollment_count)),
+            ('instructor', (instructor_id,), NotFoundError(f"No match found for Instructor ID: {instructor_id}")),
+            ('course', (course_number,), NotFoundError(f"No match found for Course Number: {course_number}")))
+
+        # Create the section's Evaluation rows in the same transaction
+        scaffold_section(cursor, course_number, section_id, year, term)
+        conn.commit()
+    finally:
+        conn.close()
+
+def add_course_degree(course_number, degree_id, is_core):
+    """Associate a course with a degree program.
+    
+    Parameters:
+        course_number (str): The unique identifier of the course to be associated
+        degree_id (str): The unique identifier of the degree program
+        is_core (bool): Indicates whether the course is a core course for the degree
+
+    Raises:
+        NotFoundError: If the course or degree does not exist.
+    """
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        # Insert the course-degree association
+        _insert_referencing(conn, cursor, """
+            INSERT INTO Course_Degree (courseNumber, degreeID, isCore)
+            VALUES (%s, %s, %s)
+        """, (course_number, degree_id, is_core),
+            ('course', (course_number,), NotFoundError(f"No matching course found for Course Number: {course_number}")),
+            ('degree', (degree_id,), NotFoundError(f"No matching degree found for Degree ID: {degree_id}")))
+        conn.commit()
+        _reference_cache.invalidate(('degree_courses', degree_id), ('course_degrees', course_number))
+    finally:
+        conn.close()
+
+
+def associate_course_with_goal(course_number, degree_id, goal_code):
+    """
+    Associate a course with a goal for a specific degree, creating an Evaluation row for
+    every existing section of the course.
+
+    Parameters:
+        course_number (str): The course number to associate.
+        degree_id (str): The degree ID to associate.
+        goal_code (str): The goal code to associate.
+
+    Raises:
+        ValidationError: If a field is missing, or the course is not part of the degree.
+        NotFoundError: If the course, degree or goal does not exist.
+    """
+    _require_fields("All fields (Course Number, Degree ID, Goal Code) are required.", course_number, degree_id, goal_code)
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        # The course-degree association is not a foreign key of Evaluation, so all four
+        # keys are checked up front, in one query
+        _require_keys(
+            conn,
+            ('course', (course_number,), NotFoundError(f"No matching course found for Course Number: {course_number}.")),
+            ('degree', (degree_id,), NotFoundError(f"No matching degree found for Degree ID: {degree_id}.")),
+            ('goal', (goal_code, degree_id),
+             NotFoundError(f"No matching goal found for Goal Code: {goal_code} and Degree ID: {degree_id}.")),
+            ('course_degree', (course_number, degree_id),
+             ValidationError(f"The course {course_number} is not associated with the degree {degree_id}.")))
+
+        # Insert the association into the Evaluation table
+        cursor.execute("""
+            INSERT INTO Evaluation (courseNumber, sectionID, year, term, degreeID, goalCode)
+            SELECT DISTINCT s.courseNumber, s.sectionID, s.year, s.term, %s, %s
+            FROM Section s
+            WHERE s.courseNumber = %s
+        """, (degree_id, goal_code, course_number))
+        _store_section_summaries(cursor, ('courseNumber',), (course_number,))
+        _store_pass_rates(cursor, ('courseNumber',), (course_number,))
+
+        conn.commit()
+        # No cached lookup reads Evaluation; the course's and degree's lookups are still
+        # re-read after an association, as after add_course_degree
+        _reference_cache.invalidate(('degree_courses', degree_id), ('degree_goals', degree_id),
+                                    ('course_degrees', course_number))
+    finally:
+        conn.close()
+
+def add_course_to_semester(course_number, section_id, year, term, instructor_id, enrollment_count=0):
+    """
+    Add a course section to a semester, creating the semester if needed.
+
+    Parameters:
+        course_number (str): The course number.
+        section_id (str): The section ID.
+        year (str): The year.
+        term (str): The term (e.g., Spring, Summer, Fall).
+        instructor_id (str): The instructor ID.
+        enrollment_count (int): The number of students enrolled.
+
+    Raises:
+        ValidationError: If a field is missing or invalid.
+        NotFoundError: If the course or instructor does not exist.
+    """
+    _require_fields("All fields (Course Number, Section ID, Year, Term, and Instructor ID) are required.",
+                    course_number, section_id, year, term, instructor_id)
+    _validate_year(year)
+    _validate_term(term)
+    _validate_enrollment(enrollment_count)
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        # Ensure semester exists or create it
+        cursor.execute("""
+            INSERT IGNORE INTO Semester (year, term) 
+            VALUES (%s, %s)
+        """, (year, term))
+
+        # Add section
+        _insert_referencing(conn, cursor, """
+            INSERT INTO Section 
+            (courseNumber, sectionID, year, term, instructorID, enrollmentCount)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, (course_number, section_id, year, term, instructor_id, enrollment_count),
+            ('course', (course_number,), NotFoundError(f"No matching Course Number found: {course_number}")),
+            ('instructor', (instructor_id,), NotFoundError(f"No matching Instructor ID found: {instructor_id}")))
+
+        # Create the section's Evaluation rows in the same transaction
+        scaffold_section(cursor, course_number, section_id, year, term)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_semesters():
+    """
+    List every semester, oldest first.
+
+    Returns:
+        list: (year, term) tuples in Semester.ordinal order.
+    """
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT year, term FROM Semester ORDER BY ordinal")
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return [(year, term) for year, term in rows]
+
+
+def get_available_courses_for_semester(year, term):
+    """
+    Get a list of available courses for a specific semester.
+
+    Parameters:
+        year (str): The year of the semester.
+        term (str): The term of the semester (e.g., Spring, Summer, Fall).
+
+    Returns:
+        List[Tuple]: A list of available courses (courseNumber, name).
+    """
+    _require_fields("Both fields (Year and Term) are required.", year, term)
+    _validate_year(year)
+    _validate_term(term)
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT DISTINCT c.courseNumber, c.name 
+            FROM Course c 
+            JOIN Section s ON c.courseNumber = s.courseNumber
+            WHERE s.year = %s AND s.term = %s
+            ORDER BY c.courseNumber
+        """, (year, term))
+        results = cursor.fetchall()
+    finally:
+        conn.close()
+    return results
+
+# Evaluation status of a section, classified from how many of its Evaluation rows (alias e)
+# have an evaluation, grades and an improvement note. The strings must stay in sync with
+# what the GUI displays and with migrations/0005_section_summary.sql.
+_IS_ENTERED_SQL = "CASE WHEN e.evaluationType IS NOT NULL OR e.gradeCountA IS NOT NULL THEN 1 ELSE 0 END"
+_IS_GRADED_SQL = ("CASE WHEN COALESCE(e.gradeCountA, 0) + COALESCE(e.gradeCountB, 0)"
+                  " + COALESCE(e.gradeCountC, 0) + COALESCE(e.gradeCountF, 0) > 0 THEN 1 ELSE 0 END")
+# A note counts only if something other than whitespace is left, like str.strip() in Python
+_HAS_NOTE_SQL = ("CASE WHEN TRIM(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(e.improvementNote,"
+                 " CHAR(9), ''), CHAR(10), ''), CHAR(11), ''), CHAR(12), ''), CHAR(13), '')) <> ''"
+                 " THEN 1 ELSE 0 END")
+_ENTERED_COUNT_SQL = f"COALESCE(SUM({_IS_ENTERED_SQL}), 0)"
+_GRADED_COUNT_SQL = f"COALESCE(SUM({_IS_GRADED_SQL}), 0)"
+_NOTE_COUNT_SQL = f"COALESCE(SUM({_HAS_NOTE_SQL}), 0)"
+SECTION_STATUS_SQL = f"""CASE
+            WHEN {_ENTERED_COUNT_SQL} = 0 AND {_GRADED_COUNT_SQL} = 0 THEN 'No Evaluation Entered'
+            WHEN {_ENTERED_COUNT_SQL} > 0 AND {_GRADED_COUNT_SQL} > 0 AND {_NOTE_COUNT_SQL} > 0
+                THEN 'Fully Entered (With Improvement Note)'
+            WHEN {_ENTERED_COUNT_SQL} > 0 AND {_GRADED_COUNT_SQL} > 0 THEN 'Fully Entered (No Improvement Note)'
+            ELSE 'Partially Entered'
+        END"""
+
+# Recomputes the SectionSummary rows of the sections matched by {where} (on Section s).
+# Sections without Evaluation rows get a row too, with zero counts.
+_STORE_SUMMARIES_SQL = f"""
+    INSERT INTO SectionSummary (courseNumber, sectionID, year, term, evaluationCount, enteredCount, gradedCount,
+                                noteCount, gradeCountA, gradeCountB, gradeCountC, gradeCountF, status)
+    SELECT s.courseNumber, s.sectionID, s.year, s.term,
+           COUNT(e.courseNumber),
+           {_ENTERED_COUNT_SQL},
+           {_GRADED_COUNT_SQL},
+           {_NOTE_COUNT_SQL},
+           COALESCE(SUM(e.gradeCountA), 0),
+           COALESCE(SUM(e.gradeCountB), 0),
+           COALESCE(SUM(e.gradeCountC), 0),
+           COALESCE(SUM(e.gradeCountF), 0),
+           {SECTION_STATUS_SQL}
+    FROM Section s
+    LEFT JOIN Evaluation e
+      ON s.courseNumber = e.courseNumber
+     AND s.sectionID = e.sectionID
+     AND s.year = e.year
+     AND s.term = e.term
+    WHERE {{where}}
+    GROUP BY s.courseNumber, s.sectionID, s.year, s.term
+"""
+_SECTION_KEY = ('courseNumber', 'sectionID', 'year', 'term')
+
+def _store_section_summaries(cursor, columns, params):
+    # Replace the SectionSummary rows of the sections whose columns equal params
+    cursor.execute("DELETE FROM SectionSummary WHERE " + " AND ".join(f"{c} = %s" for c in columns), params)
+    cursor.execute(_STORE_SUMMARIES_SQL.format(where=" AND ".join(f"s.{c} = %s" for c in columns)), params)
+    return cursor.rowcount
+
+def refresh_section_summary(cursor, courseNumber, sectionID, year, term):
+    """
+    Recompute the SectionSummary row of one section on the caller's cursor (and transaction).
+    """
+    _store_section_summaries(cursor, _SECTION_KEY, (courseNumber, sectionID, year, term))
+
+def rebuild_section_summaries(year, term):
+    """
+    Rebuild the SectionSummary rows of every section in a semester, e.g. after rows were
+    changed outside this module or goals and degrees were deleted and their evaluations
+    cascaded away. "python db_migrations.py rebuild" does this for every semester.
+
+    Parameters:
+        year (int): The academic year (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+
+    Returns:
+        int: The number of sections summarized.
+    """
+    conn = _require_connection()
+    try:
+        rebuilt = _store_section_summaries(conn.cursor(), ('year', 'term'), (year, term))
+        conn.commit()
+    finally:
+        conn.close()
+    return rebuilt
+
+# {after} and {limit} are filled in by the paginated variant. Reads one stored summary
+# per section; a section that somehow lacks one reads as having no evaluation.
+_EVALUATION_STATUS_TEMPLATE = """
+        SELECT s.courseNumber, s.sectionID, COALESCE(t.status, 'No Evaluation Entered') AS status
+        FROM Section s
+        LEFT JOIN SectionSummary t
+          ON s.courseNumber = t.courseNumber
+         AND s.sectionID = t.sectionID
+         AND s.year = t.year
+         AND s.term = t.term
+        WHERE s.year = %s AND s.term = %s{after}
+        ORDER BY s.courseNumber, s.sectionID{limit}
+        """
+_EVALUATION_STATUS_SQL = _EVALUATION_STATUS_TEMPLATE.format(after='', limit='')
+
+def get_evaluation_status_for_semester(year, term):
+    """
+    Retrieve the evaluation status for all sections offered in a given semester.
+
+    Parameters:
+        year (int): The academic year for which the evaluation status is retrieved (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+
+    Returns:
+        list: A list of dictionaries, where each dictionary contains:
+            - 'courseNumber' (str): The course number (e.g., "CS101").
+            - 'sectionID' (int): The section ID for the course.
+            - 'status' (str): The evaluation status for the section, with possible values:
+                - "No Evaluation Entered": No evaluation or grades entered for the section.
+                - "Fully Entered (With Improvement Note)": Evaluation, grades, and improvement note are all entered.
+                - "Fully Entered (No Improvement Note)": Evaluation and grades are entered, but no improvement note is present.
+                - "Partially Entered": Either evaluation or grades are partially entered.
+    """
+    conn = _require_connection()
+    try:
+        cursor = conn.prepared(_EVALUATION_STATUS_SQL, dictionary=True)
+        cursor.execute(_EVALUATION_STATUS_SQL, (year, term))
+        # One compact row per section; consume them as they arrive
+        results = [row for row in cursor]
+    finally:
+        conn.close()
+    return results
+
+# Sections looked up per statement by get_evaluation_status_for_sections()
+STATUS_KEYS_PER_QUERY = 100
+
+_SECTIONS_STATUS_TEMPLATE = """
+        SELECT s.courseNumber, s.sectionID, s.year, s.term, COALESCE(t.status, 'No Evaluation Entered') AS status
+        FROM Section s
+        LEFT JOIN SectionSummary t
+          ON s.courseNumber = t.courseNumber
+         AND s.sectionID = t.sectionID
+         AND s.year = t.year
+         AND s.term = t.term
+        WHERE {keys}
+        """
+_SECTION_KEY_SQL = "(s.courseNumber = %s AND s.sectionID = %s AND s.year = %s AND s.term = %s)"
+
+def get_evaluation_status_for_sections(sections):
+    """
+    Retrieve the evaluation status of the given sections only, e.g. the rows on screen,
+    with primary-key lookups instead of reading the whole semester.
+
+    Parameters:
+        sections (iterable): Section keys as (courseNumber, sectionID, year, term) tuples.
+
+    Returns:
+        list: One dictionary per existing section, in the order the keys were given
+              (duplicates and unknown sections left out), with 'courseNumber',
+              'sectionID', 'year', 'term' and 'status' (the values documented for
+              get_evaluation_status_for_semester()).
+
+    Raises:
+        ValidationError: If a key is malformed, or has an invalid year or term.
+    """
+    keys = []
+    for section in sections:
+        if len(section) != 4:
+            raise ValidationError("A section key is (courseNumber, sectionID, year, term).")
+        courseNumber, sectionID, year, term = section
+        _validate_year(year)
+        _validate_term(term)
+        keys.append((courseNumber, sectionID, int(year), term))
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return []
+
+    found = {}
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        for start in range(0, len(keys), STATUS_KEYS_PER_QUERY):
+            chunk = keys[start:start + STATUS_KEYS_PER_QUERY]
+            cursor.execute(_SECTIONS_STATUS_TEMPLATE.format(keys=" OR ".join([_SECTION_KEY_SQL] * len(chunk))),
+                           tuple(value for key in chunk for value in key))
+            for row in cursor.fetchall():
+                found[(row['courseNumber'], row['sectionID'], row['year'], row['term'])] = row
+    finally:
+        conn.close()
+    return [found[key] for key in keys if key in found]
+
+# How a section's evaluations are combined into one pass count
+PASS_RATE_RULES = {
+    'any': 'MAX',  # at least one goal reaches the threshold
+    'all': 'MIN',  # every goal reaches the threshold
+    'avg': 'AVG',  # the average over the section's goals reaches the threshold
+}
+STORED_PASS_RATE_RULE = 'any'
+
+_STORED_SECTIONS_ABOVE_SQL = """
+            SELECT p.courseNumber, p.sectionID, s.enrollmentCount, p.passCount
+            FROM SectionPassRate p
+            JOIN Section s
+              ON s.courseNumber = p.courseNumber
+             AND s.sectionID = p.sectionID
+             AND s.year = p.year
+             AND s.term = p.term
+            WHERE p.year = %s AND p.term = %s AND p.passRate >= %s
+            ORDER BY p.courseNumber, p.sectionID;
+            """
+_SECTIONS_ABOVE_SQL = """
+            SELECT s.courseNumber, s.sectionID, s.enrollmentCount,
+                   {aggregate}(e.gradeCountA + e.gradeCountB + e.gradeCountC) as passCount
+            FROM Section s
+            JOIN Evaluation e
+              ON s.courseNumber = e.courseNumber
+             AND s.sectionID = e.sectionID
+             AND s.year = e.year
+             AND s.term = e.term
+            WHERE s.year = %s AND s.term = %s AND s.enrollmentCount > 0
+            GROUP BY s.courseNumber, s.sectionID, s.enrollmentCount
+            HAVING {aggregate}(e.gradeCountA + e.gradeCountB + e.gradeCountC) * 100 >= %s * s.enrollmentCount
+            ORDER BY s.courseNumber, s.sectionID;
+            """
+
+def _sections_above_percentage_query(year, term, percentage, rule, use_stored):
+    # Validates the options and returns (query, params)
+    if rule not in PASS_RATE_RULES:
+        raise ValidationError(f"Invalid rule. Must be one of: {', '.join(PASS_RATE_RULES)}.")
+    if use_stored and rule != STORED_PASS_RATE_RULE:
+        raise ValidationError(f"Stored pass rates are only kept for the '{STORED_PASS_RATE_RULE}' rule.")
+    if use_stored:
+        query = _STORED_SECTIONS_ABOVE_SQL
+    else:
+        query = _SECTIONS_ABOVE_SQL.format(aggregate=PASS_RATE_RULES[rule])
+    return query, (year, term, float(percentage))
+
+def get_sections_above_percentage(year, term, percentage, rule='any', use_stored=False):
+    """
+    Retrieve sections where the percentage of passing students exceeds a given threshold.
+
+    Parameters:
+        year (int): The academic year for which sections are retrieved (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+        percentage (float): The minimum percentage of passing students to include the section.
+        rule (str): How the section's evaluations are combined: 'any' (best goal, the default),
+            'all' (worst goal) or 'avg' (average over goals).
+        use_stored (bool): Read the pass rates kept in SectionPassRate instead of aggregating
+            Evaluation rows. Only available for the 'any' rule.
+
+    Returns:
+        list: A list of dictionaries, one per section, where each dictionary contains:
+            - 'courseNumber' (str): The course number.
+            - 'sectionID' (int): The section ID for the course.
+            - 'enrollmentCount' (int): The total number of students enrolled in the section.
+            - 'passCount' (int): The number of students who passed, combined according to the rule.
+    """
+    query, params = _sections_above_percentage_query(year, term, percentage, rule, use_stored)
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, params)
+        results = cursor.fetchall()
+    finally:
+        conn.close()
+    return results
+
+# Recomputes SectionPassRate rows for the sections matched by {where} (on Section s)
+_STORE_PASS_RATES_SQL = f"""
+    INSERT INTO SectionPassRate (courseNumber, sectionID, year, term, passCount, passRate)
+    SELECT s.courseNumber, s.sectionID, s.year, s.term,
+           {PASS_RATE_RULES[STORED_PASS_RATE_RULE]}(e.gradeCountA + e.gradeCountB + e.gradeCountC),
+           {PASS_RATE_RULES[STORED_PASS_RATE_RULE]}(e.gradeCountA + e.gradeCountB + e.gradeCountC) * 100.0 / s.enrollmentCount
+    FROM Section s
+    JOIN Evaluation e
+      ON s.courseNumber = e.courseNumber
+     AND s.sectionID = e.sectionID
+     AND s.year = e.year
+     AND s.term = e.term
+    WHERE {{where}} AND s.enrollmentCount > 0
+    GROUP BY s.courseNumber, s.sectionID, s.year, s.term, s.enrollmentCount
+"""
+
+def _store_pass_rates(cursor, columns, params):
+    # Replace the SectionPassRate rows of the sections whose columns equal params
+    cursor.execute("DELETE FROM SectionPassRate WHERE " + " AND ".join(f"{c} = %s" for c in columns), params)
+    cursor.execute(_STORE_PASS_RATES_SQL.format(where=" AND ".join(f"s.{c} = %s" for c in columns)), params)
+    return cursor.rowcount
+
+def refresh_section_pass_rate(cursor, courseNumber, sectionID, year, term):
+    """
+    Recompute the stored pass rate of one section on the caller's cursor (and transaction).
+    A section without evaluations, or without enrolled students, has no stored rate.
+    """
+    _store_pass_rates(cursor, _SECTION_KEY, (courseNumber, sectionID, year, term))
+
+def refresh_section_pass_rates(year, term):
+    """
+    Rebuild the stored pass rates of every section in a semester, e.g. after goals or
+    degrees were deleted and their evaluations cascaded away.
+
+    Parameters:
+        year (int): The academic year (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+
+    Returns:
+        int: The number of sections with a stored pass rate.
+    """
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        refreshed = _store_pass_rates(cursor, ('year', 'term'), (year, term))
+        conn.commit()
+    finally:
+        conn.close()
+    return refreshed
+
+_SECTIONS_FOR_INSTRUCTOR_TEMPLATE = """
+        SELECT s.courseNumber, s.sectionID, s.enrollmentCount
+        FROM Section s
+        WHERE s.year = %s AND s.term = %s AND s.instructorID = %s{after}
+        ORDER BY s.courseNumber, s.sectionID{limit}
+        """
+_SECTIONS_FOR_INSTRUCTOR_SQL = _SECTIONS_FOR_INSTRUCTOR_TEMPLATE.format(after='', limit='')
+
+def get_sections_for_instructor(year, term, instructor_id):
+    """
+    Retrieve sections taught by a specific instructor in a given semester.
+
+    Parameters:
+        year (int): The academic year for which sections are retrieved (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+        instructor_id (int): The unique ID of the instructor.
+
+    Returns:
+        list: A list of dictionaries, where each dictionary contains:
+            - 'courseNumber' (str): The course number.
+            - 'sectionID' (int): The section ID for the course.
+            - 'enrollmentCount' (int): The total number of students enrolled in the section.
+    """
+    conn = _require_connection()
+    try:
+        cursor = conn.prepared(_SECTIONS_FOR_INSTRUCTOR_SQL, dictionary=True)
+        cursor.execute(_SECTIONS_FOR_INSTRUCTOR_SQL, (year, term, instructor_id))
+        sections = cursor.fetchall()
+    finally:
+        conn.close()
+    return sections
+
+_SECTION_EVALUATIONS_SQL = """
+        SELECT e.*, g.description as goalDescription, d.name as degreeName
+        FROM Evaluation e
+        JOIN Goal g ON e.degreeID = g.degreeID AND e.goalCode = g.goalCode
+        JOIN Degree d ON e.degreeID = d.degreeID
+        WHERE e.courseNumber = %s AND e.sectionID = %s AND e.year = %s AND e.term = %s;
+        """
+
+def get_evaluations_for_section(courseNumber, sectionID, year, term):
+    """
+    Retrieve evaluation details for a specific section, including associated goals and degrees.
+
+    Parameters:
+        courseNumber (str): The unique identifier for the course (e.g., "CS101").
+        sectionID (int): The unique identifier for the section.
+        year (int): The academic year for the section (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+
+    Returns:
+        list: A list of dictionaries, where each dictionary contains:
+            - Evaluation details (e.g., 'evaluationType', 'gradeCountA', 'gradeCountB', etc.).
+            - 'goalDescription' (str): Description of the goal being evaluated.
+            - 'degreeName' (str): Name of the associated degree.
+    """
+    conn = _require_connection()
+    try:
+        cursor = conn.prepared(_SECTION_EVALUATIONS_SQL, dictionary=True)
+        cursor.execute(_SECTION_EVALUATIONS_SQL, (courseNumber, sectionID, year, term))
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return rows
+
+def get_degrees_for_course(courseNumber):
+    """
+    Retrieve the degree programs associated with a given course.
+    Results are served from the reference cache (see configure_cache()).
+
+    Parameters:
+        courseNumber (str): The unique identifier for the course (e.g., "CS101").
+
+    Returns:
+        list: A list of dictionaries, where each dictionary contains:
+            - 'degreeID' (str): The unique identifier for the degree program.
+            - 'name' (str): The name of the degree program.
+            - 'isCore' (bool): Indicates whether the course is a core requirement for the degree.
+    """
+    return _cached_rows(('course_degrees', courseNumber), lambda: _fetch_degrees_for_course(courseNumber))
+
+def _fetch_degrees_for_course(courseNumber):
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        query = """
+        SELECT d.degreeID, d.name, cd.isCore
+        FROM Course_Degree cd
+        JOIN Degree d ON cd.degreeID = d.degreeID
+        WHERE cd.courseNumber = %s;
+        """
+        cursor.execute(query, (courseNumber,))
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return rows
+
+_UPSERT_EVALUATION_SQL = """
+        INSERT INTO Evaluation (courseNumber, sectionID, year, term, degreeID, goalCode, evaluationType, gradeCountA, gradeCountB, gradeCountC, gradeCountF, improvementNote)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE 
+          evaluationType=VALUES(evaluationType),
+          gradeCountA=VALUES(gradeCountA),
+          gradeCountB=VALUES(gradeCountB),
+          gradeCountC=VALUES(gradeCountC),
+          gradeCountF=VALUES(gradeCountF),
+          improvementNote=VALUES(improvementNote);
+        """
+
+def update_evaluation(courseNumber, sectionID, year, term, degreeID, goalCode, evaluationType, gradeA, gradeB, gradeC, gradeF, improvementNote):
+    """
+    Update or insert evaluation details for a specific course section and goal.
+    The section's stored pass rate and summary are refreshed in the same transaction.
+
+    Parameters:
+        courseNumber (str): The unique identifier for the course (e.g., "CS101").
+        sectionID (int): The unique identifier for the section.
+        year (int): The academic year for the section (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+        degreeID (str): The unique identifier for the degree program.
+        goalCode (str): The unique code for the goal being evaluated.
+        evaluationType (str): The type of evaluation (e.g., "Homework", "Quiz").
+        gradeA (int): The number of students achieving grade A.
+        gradeB (int): The number of students achieving grade B.
+        gradeC (int): The number of students achieving grade C.
+        gradeF (int): The number of students achieving grade F.
+        improvementNote (str): A note for improvement, if any.
+
+    Returns:
+        None
+    """
+    conn = _require_connection()
+    try:
+        cursor = conn.prepared(_UPSERT_EVALUATION_SQL)
+        cursor.execute(_UPSERT_EVALUATION_SQL, (courseNumber, sectionID, year, term, degreeID, goalCode, evaluationType, gradeA, gradeB, gradeC, gradeF, improvementNote))
+        cursor = conn.cursor()
+        refresh_section_pass_rate(cursor, courseNumber, sectionID, year, term)
+        refresh_section_summary(cursor, courseNumber, sectionID, year, term)
+        conn.commit()
+    finally:
+        conn.close()
+
+# Per-row outcomes of update_evaluations_batch()
+EVALUATION_SAVED = 'saved'
+EVALUATION_FAILED = 'failed'
+EVALUATION_ROLLED_BACK = 'rolled back'
+
+def update_evaluations_batch(evaluations, atomic=True):
+    """
+    Insert or update many evaluations in one transaction on one connection.
+
+    The rows are sent with a single executemany(). If that fails on a row's data (a
+    missing section, degree or goal, a bad value), the rows are retried one by one in
+    the same transaction to find which ones fail. Pass rates are refreshed once per
+    affected section, as are the section summaries.
+
+    Parameters:
+        evaluations (iterable): Tuples of update_evaluation()'s arguments (courseNumber,
+            sectionID, year, term, degreeID, goalCode, evaluationType, gradeA, gradeB,
+            gradeC, gradeF, improvementNote).
+        atomic (bool): If True (the default), nothing is saved when any row fails; the
+            other rows are then reported as EVALUATION_ROLLED_BACK. If False, the rows
+            that can be saved are committed.
+
+    Returns:
+        list: One dictionary per input row, in order, with:
+            - 'status' (str): EVALUATION_SAVED, EVALUATION_FAILED or EVALUATION_ROLLED_BACK.
+            - 'error' (Exception): Why the row failed, or None.
+
+    Raises:
+        DatabaseError: If the connection or the statement itself fails (not a row's data).
+    """
+    rows = [tuple(evaluation) for evaluation in evaluations]
+    outcomes = [{'status': EVALUATION_SAVED, 'error': None} for _ in rows]
+    valid = []
+    for outcome, row in zip(outcomes, rows):
+        if len(row) != 12:
+            outcome['status'] = EVALUATION_FAILED
+            outcome['error'] = ValidationError(f"An evaluation has 12 fields, not {len(row)}.")
+        else:
+            valid.append((outcome, row))
+    if atomic and len(valid) < len(rows):
+        for outcome, _ in valid:
+            outcome['status'] = EVALUATION_ROLLED_BACK
+        return outcomes
+    if not valid:
+        return outcomes
+
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(_UPSERT_EVALUATION_SQL, [row for _, row in valid])
+        except (OperationalError, ProgrammingError):
+            raise
+        except DatabaseError:
+            # Some row is unacceptable; find out which by retrying them individually
+            conn.rollback()
+            saved = []
+            for outcome, row in valid:
+                try:
+                    cursor.execute(_UPSERT_EVALUATION_SQL, row)
+                except (OperationalError, ProgrammingError):
+                    raise
+                except DatabaseError as e:
+                    outcome['status'] = EVALUATION_FAILED
+                    outcome['error'] = e
+                else:
+                    saved.append((outcome, row))
+            if atomic and len(saved) < len(valid):
+                conn.rollback()
+                for outcome, _ in saved:
+                    outcome['status'] = EVALUATION_ROLLED_BACK
+                return outcomes
+            valid = saved
+
+        for section in dict.fromkeys(row[:4] for _, row in valid):
+            refresh_section_pass_rate(cursor, *section)
+            refresh_section_summary(cursor, *section)
+        conn.commit()
+    finally:
+        conn.close()
+    return outcomes
+
+def get_degree_courses(degreeID):
+    """
+    Retrieve the courses associated with a given degree program.
+    Results are served from the reference cache (see configure_cache()).
+
+    Parameters:
+        degreeID (str): The unique identifier for the degree program.
+
+    Returns:
+        list: A list of dictionaries, where each dictionary contains:
+            - 'courseNumber' (str): The unique identifier for the course.
+            - 'name' (str): The name of the course.
+            - 'isCore' (bool): Indicates whether the course is a core requirement for the degree.
+    """
+    return _cached_rows(('degree_courses', degreeID), lambda: _fetch_degree_courses(degreeID))
+
+def _fetch_degree_courses(degreeID):
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        query = """
+        SELECT c.courseNumber, c.name, cd.isCore
+        FROM Course_Degree cd
+        JOIN Course c ON cd.courseNumber = c.courseNumber
+        WHERE cd.degreeID = %s;
+        """
+        cursor.execute(query, (degreeID,))
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return rows
+
+def get_degree_goals(degreeID):
+    """
+    Retrieve the goals associated with a specific degree program.
+    Results are served from the reference cache (see configure_cache()).
+
+    Parameters:
+        degreeID (str): The unique identifier for the degree program.
+
+    Returns:
+        list: A list of dictionaries, where each dictionary contains:
+            - 'goalCode' (str): The unique code for the goal.
+            - 'description' (str): The description of the goal.
+    """
+    return _cached_rows(('degree_goals', degreeID), lambda: _fetch_degree_goals(degreeID))
+
+def _fetch_degree_goals(degreeID):
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        query = "SELECT goalCode, description FROM Goal WHERE degreeID = %s;"
+        cursor.execute(query, (degreeID,))
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return rows
+
+def get_courses_for_goals(degreeID, goalCodes):
+    """
+    Retrieve the courses associated with specific goals for a degree program.
+
+    Parameters:
+        degreeID (str): The unique identifier for the degree program.
+        goalCodes (list): A list of goal codes to filter the courses.
+
+    Returns:
+        list: A list of dictionaries, where each dictionary contains:
+            - 'courseNumber' (str): The unique identifier for the course.
+            - 'name' (str): The name of the course.
+            - 'goalCode' (str): The unique code for the goal associated with the course.
+    """
+    if not goalCodes:
+        return []
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        format_str = ','.join(['%s'] * len(goalCodes))
+        query = f"""
+        SELECT DISTINCT c.courseNumber, c.name, g.goalCode
+        FROM Evaluation e
+        JOIN Course c ON e.courseNumber = c.courseNumber
+        JOIN Goal g ON e.degreeID = g.degreeID AND e.goalCode = g.goalCode
+        WHERE e.degreeID = %s AND g.goalCode IN ({format_str});
+        """
+        params = [degreeID] + goalCodes
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return rows
+
+def get_improvement_notes(courseNumber, sectionID):
+    """
+    Retrieve the improvement notes entered for a section, across all of its semesters.
+
+    Parameters:
+        courseNumber (str): The unique identifier for the course (e.g., "CS101").
+        sectionID (str): The section ID.
+
+    Returns:
+        list: A list of dictionaries with 'degreeID', 'degreeName' and 'improvementNote'.
+    """
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT e.degreeID, d.name as degreeName, e.improvementNote
+            FROM Evaluation e
+            JOIN Degree d ON e.degreeID = d.degreeID
+            WHERE e.courseNumber = %s AND e.sectionID = %s AND e.improvementNote IS NOT NULL AND e.improvementNote <> ''
+        """, (courseNumber, sectionID))
+        notes = cursor.fetchall()
+    finally:
+        conn.close()
+    return notes
+
+# The year bounds let the (courseNumber|instructorID, year, term) index limit the scan to
+# the window; the ordinal then trims the boundary years to the exact terms.
+_COURSE_SECTIONS_IN_RANGE_TEMPLATE = """
+        SELECT s.*
+        FROM Section s
+        JOIN Semester sem ON sem.year = s.year AND sem.term = s.term
+        WHERE s.courseNumber = %s
+          AND s.year BETWEEN %s AND %s
+          AND sem.ordinal BETWEEN %s AND %s{after}
+        ORDER BY sem.ordinal, s.sectionID{limit}
+        """
+_INSTRUCTOR_SECTIONS_IN_RANGE_TEMPLATE = """
+        SELECT s.*
+        FROM Section s
+        JOIN Semester sem ON sem.year = s.year AND sem.term = s.term
+        WHERE s.instructorID = %s
+          AND s.year BETWEEN %s AND %s
+          AND sem.ordinal BETWEEN %s AND %s{after}
+        ORDER BY sem.ordinal, s.courseNumber, s.sectionID{limit}
+        """
+_COURSE_SECTIONS_IN_RANGE_SQL = _COURSE_SECTIONS_IN_RANGE_TEMPLATE.format(after='', limit='')
+_INSTRUCTOR_SECTIONS_IN_RANGE_SQL = _INSTRUCTOR_SECTIONS_IN_RANGE_TEMPLATE.format(after='', limit='')
+
+def _range_params(key, startYear, startTerm, endYear, endTerm):
+    _validate_year(startYear)
+    _validate_year(endYear)
+    return (key, int(startYear), int(endYear),
+            semester_ordinal(startYear, startTerm), semester_ordinal(endYear, endTerm))
+
+def get_course_sections_in_range(courseNumber, startYear, startTerm, endYear, endTerm):
+    """
+    Retrieve course sections offered within a specific time range.
+
+    Parameters:
+        courseNumber (str): The unique identifier for the course.
+        startYear (int): The starting year of the range.
+        startTerm (str): The starting term of the range ('Spring', 'Summer', 'Fall').
+        endYear (int): The ending year of the range.
+        endTerm (str): The ending term of the range ('Spring', 'Summer', 'Fall').
+
+    Returns:
+        list: A list of dictionaries, where each dictionary represents a course section and contains all attributes of the Section table.
+    """
+    params = _range_params(courseNumber, startYear, startTerm, endYear, endTerm)
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(_COURSE_SECTIONS_IN_RANGE_SQL, params)
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return rows
+
+def get_instructor_sections_in_range(instructorID, startYear, startTerm, endYear, endTerm):
+    """
+    Retrieve sections taught by a specific instructor within a given time range.
+
+    Parameters:
+        instructorID (str): The unique identifier for the instructor.
+        startYear (int): The starting year of the range.
+        startTerm (str): The starting term of the range ('Spring', 'Summer', 'Fall').
+        endYear (int): The ending year of the range.
+        endTerm (str): The ending term of the range ('Spring', 'Summer', 'Fall').
+
+    Returns:
+        list: A list of dictionaries, where each dictionary represents a section taught by the instructor.
+              Each dictionary contains all attributes of the Section table.
+    """
+    params = _range_params(instructorID, startYear, startTerm, endYear, endTerm)
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(_INSTRUCTOR_SECTIONS_IN_RANGE_SQL, params)
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return rows
+
+
+# Streaming variants of the report queries. They yield the same rows as their get_*
+# counterparts, fetched batch_size rows at a time: the first row is available as soon as
+# the database produces it and memory stays flat however large the result. MySQL cursors
+# are unbuffered, so rows stay on the server until fetched; SQLite steps its statement
+# on demand. The connection is held until the generator is exhausted or closed.
+STREAM_BATCH_SIZE = 500
+
+def _stream_rows(query, params, batch_size=None):
+    batch_size = batch_size or STREAM_BATCH_SIZE
+    conn = _require_connection()
+    finished = False
+    try:
+        cursor = conn.cursor(dictionary=True, buffered=False)
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+        finished = True
+    finally:
+        if finished or not getattr(conn, 'streams_unbuffered', False):
+            conn.close()
+        else:
+            # Abandoned part way: the unread rows would have to be read off the wire
+            # before the connection could be reused, so drop it instead.
+            conn.discard()
+
+def iter_evaluation_status_for_semester(year, term, batch_size=None):
+    """
+    Stream get_evaluation_status_for_semester() rows.
+
+    Parameters:
+        year (int): The academic year (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+        batch_size (int): Rows fetched per round trip (default STREAM_BATCH_SIZE).
+
+    Returns:
+        generator: Dictionaries with 'courseNumber', 'sectionID' and 'status'.
+    """
+    return _stream_rows(_EVALUATION_STATUS_SQL, (year, term), batch_size)
+
+def iter_sections_above_percentage(year, term, percentage, rule='any', use_stored=False, batch_size=None):
+    """
+    Stream get_sections_above_percentage() rows. The options are validated immediately.
+
+    Parameters:
+        year, term, percentage, rule, use_stored: As for get_sections_above_percentage().
+        batch_size (int): Rows fetched per round trip (default STREAM_BATCH_SIZE).
+
+    Returns:
+        generator: Dictionaries with 'courseNumber', 'sectionID', 'enrollmentCount' and 'passCount'.
+
+    Raises:
+        ValidationError: If the rule is unknown or has no stored pass rates.
+    """
+    query, params = _sections_above_percentage_query(year, term, percentage, rule, use_stored)
+    return _stream_rows(query, params, batch_size)
+
+def iter_sections_for_instructor(year, term, instructor_id, batch_size=None):
+    """
+    Stream get_sections_for_instructor() rows.
+
+    Parameters:
+        year (int): The academic year (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+        instructor_id (str): The unique ID of the instructor.
+        batch_size (int): Rows fetched per round trip (default STREAM_BATCH_SIZE).
+
+    Returns:
+        generator: Dictionaries with 'courseNumber', 'sectionID' and 'enrollmentCount'.
+    """
+    return _stream_rows(_SECTIONS_FOR_INSTRUCTOR_SQL, (year, term, instructor_id), batch_size)
+
+def iter_course_sections_in_range(courseNumber, startYear, startTerm, endYear, endTerm, batch_size=None):
+    """
+    Stream get_course_sections_in_range() rows, oldest semester first.
+
+    Parameters:
+        courseNumber, startYear, startTerm, endYear, endTerm: As for get_course_sections_in_range().
+        batch_size (int): Rows fetched per round trip (default STREAM_BATCH_SIZE).
+
+    Returns:
+        generator: Dictionaries with all attributes of the Section table.
+
+    Raises:
+        ValidationError: If a bound is not a valid semester.
+    """
+    params = _range_params(courseNumber, startYear, startTerm, endYear, endTerm)
+    return _stream_rows(_COURSE_SECTIONS_IN_RANGE_SQL, params, batch_size)
+
+def iter_instructor_sections_in_range(instructorID, startYear, startTerm, endYear, endTerm, batch_size=None):
+    """
+    Stream get_instructor_sections_in_range() rows, oldest semester first.
+
+    Parameters:
+        instructorID, startYear, startTerm, endYear, endTerm: As for get_instructor_sections_in_range().
+        batch_size (int): Rows fetched per round trip (default STREAM_BATCH_SIZE).
+
+    Returns:
+        generator: Dictionaries with all attributes of the Section table.
+
+    Raises:
+        ValidationError: If a bound is not a valid semester.
+    """
+    params = _range_params(instructorID, startYear, startTerm, endYear, endTerm)
+    return _stream_rows(_INSTRUCTOR_SECTIONS_IN_RANGE_SQL, params, batch_size)
+
+
+# Paginated variants. Each page is read with a keyset condition ("rows after the last key
+# of the previous page") in the listing's index order, never with OFFSET, so every page
+# costs the same however deep into the listing it is. The continuation token is opaque
+# to callers; None means there are no more rows.
+PAGE_SIZE = 100
+
+_LIMIT_SQL = "\n        LIMIT %s"
+# The redundant leading ">=" gives the planner a range start to seek to in the index
+_AFTER_SECTION_SQL = (" AND s.courseNumber >= %s"
+                      " AND (s.courseNumber > %s OR (s.courseNumber = %s AND s.sectionID > %s))")
+_AFTER_ORDINAL_SECTION_SQL = " AND (sem.ordinal > %s OR (sem.ordinal = %s AND s.sectionID > %s))"
+_AFTER_ORDINAL_COURSE_SECTION_SQL = (" AND (sem.ordinal > %s OR (sem.ordinal = %s AND (s.courseNumber > %s"
+                                     " OR (s.courseNumber = %s AND s.sectionID > %s))))")
+
+def _encode_page_token(kind, key):
+    data = json.dumps([kind, *key], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+def _decode_page_token(kind, token, types):
+    # Returns the key stored in a token made by _encode_page_token(kind, ...), checking its
+    # fields against types so a forged token cannot reach the query with the wrong shape
+    try:
+        data = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        value = json.loads(data)
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid page token.") from e
+    if (not isinstance(value, list) or len(value) != len(types) + 1 or value[0] != kind
+            or not all(isinstance(field, type_) for field, type_ in zip(value[1:], types))):
+        raise ValidationError("Invalid page token.")
+    return value[1:]
+
+def _validate_page_size(page_size):
+    if not isinstance(page_size, int) or isinstance(page_size, bool) or page_size < 1:
+        raise ValidationError("Page size must be a positive integer.")
+
+def _fetch_page(query, params, page_size, kind, key_of):
+    # One extra row tells whether another page follows
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, params + (page_size + 1,))
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, _encode_page_token(kind, key_of(rows[-1]))
+
+def page_evaluation_status_for_semester(year, term, page_size=PAGE_SIZE, page_token=None):
+    """
+    Read get_evaluation_status_for_semester() one page at a time.
+
+    Parameters:
+        year (int): The academic year (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+        page_size (int): The maximum number of rows per page.
+        page_token (str): The token returned with the previous page, or None for the first page.
+
+    Returns:
+        tuple: (rows, next_token) where next_token is None after the last page.
+
+    Raises:
+        ValidationError: If the page size or token is invalid.
+    """
+    _validate_page_size(page_size)
+    params = (year, term)
+    after = ''
+    if page_token is not None:
+        course, section = _decode_page_token('status', page_token, (str, (str, int)))
+        after = _AFTER_SECTION_SQL
+        params += (course, course, course, section)
+    query = _EVALUATION_STATUS_TEMPLATE.format(after=after, limit=_LIMIT_SQL)
+    return _fetch_page(query, params, page_size, 'status',
+                       lambda row: (row['courseNumber'], row['sectionID']))
+
+def page_sections_for_instructor(year, term, instructor_id, page_size=PAGE_SIZE, page_token=None):
+    """
+    Read get_sections_for_instructor() one page at a time, in (courseNumber, sectionID) order.
+
+    Parameters:
+        year (int): The academic year (e.g., 2024).
+        term (str): The term in the academic year (e.g., 'Spring', 'Summer', 'Fall').
+        instructor_id (str): The unique ID of the instructor.
+        page_size (int): The maximum number of rows per page.
+        page_token (str): The token returned with the previous page, or None for the first page.
+
+    Returns:
+        tuple: (rows, next_token) where next_token is None after the last page.
+
+    Raises:
+        ValidationError: If the page size or token is invalid.
+    """
+    _validate_page_size(page_size)
+    params = (year, term, instructor_id)
+    after = ''
+    if page_token is not None:
+        course, section = _decode_page_token('instructor', page_token, (str, (str, int)))
+        after = _AFTER_SECTION_SQL
+        params += (course, course, course, section)
+    query = _SECTIONS_FOR_INSTRUCTOR_TEMPLATE.format(after=after, limit=_LIMIT_SQL)
+    return _fetch_page(query, params, page_size, 'instructor',
+                       lambda row: (row['courseNumber'], row['sectionID']))
+
+def page_course_sections_in_range(courseNumber, startYear, startTerm, endYear, endTerm,
+                                  page_size=PAGE_SIZE, page_token=None):
+    """
+    Read get_course_sections_in_range() one page at a time, oldest semester first.
+
+    Parameters:
+        courseNumber, startYear, startTerm, endYear, endTerm: As for get_course_sections_in_range().
+        page_size (int): The maximum number of rows per page.
+        page_token (str): The token returned with the previous page, or None for the first page.
+
+    Returns:
+        tuple: (rows, next_token) where next_token is None after the last page.
+
+    Raises:
+        ValidationError: If a bound is not a valid semester, or the page size or token is invalid.
+    """
+    _validate_page_size(page_size)
+    params = _range_params(courseNumber, startYear, startTerm, endYear, endTerm)
+    after = ''
+    if page_token is not None:
+        ordinal, section = _decode_page_token('course_range', page_token, (int, (str, int)))
+        # Resume the year bound at the last row's year as well, so the index seek skips earlier years
+        params = (courseNumber, max(params[1], ordinal // 10)) + params[2:]
+        after = _AFTER_ORDINAL_SECTION_SQL
+        params += (ordinal, ordinal, section)
+    query = _COURSE_SECTIONS_IN_RANGE_TEMPLATE.format(after=after, limit=_LIMIT_SQL)
+    return _fetch_page(query, params, page_size, 'course_range',
+                       lambda row: (semester_ordinal(row['year'], row['term']), row['sectionID']))
+
+def page_instructor_sections_in_range(instructorID, startYear, startTerm, endYear, endTerm,
+                                      page_size=PAGE_SIZE, page_token=None):
+    """
+    Read get_instructor_sections_in_range() one page at a time, oldest semester first.
+
+    Parameters:
+        instructorID, startYear, startTerm, endYear, endTerm: As for get_instructor_sections_in_range().
+        page_size (int): The maximum number of rows per page.
+        page_token (str): The token returned with the previous page, or None for the first page.
+
+    Returns:
+        tuple: (rows, next_token) where next_token is None after the last page.
+
+    Raises:
+        ValidationError: If a bound is not a valid semester, or the page size or token is invalid.
+    """
+    _validate_page_size(page_size)
+    params = _range_params(instructorID, startYear, startTerm, endYear, endTerm)
+    after = ''
+    if page_token is not None:
+        ordinal, course, section = _decode_page_token('instructor_range', page_token, (int, str, (str, int)))
+        # Resume the year bound at the last row's year as well, so the index seek skips earlier years
+        params = (instructorID, max(params[1], ordinal // 10)) + params[2:]
+        after = _AFTER_ORDINAL_COURSE_SECTION_SQL
+        params += (ordinal, ordinal, course, course, section)
+    query = _INSTRUCTOR_SECTIONS_IN_RANGE_TEMPLATE.format(after=after, limit=_LIMIT_SQL)
+    return _fetch_page(query, params, page_size, 'instructor_range',
+                       lambda row: (semester_ordinal(row['year'], row['term']), row['courseNumber'],
+                                    row['sectionID']))
+
+
+# Batch reports over many semesters, instructors or degrees. A report that one statement
+# can answer for a list of keys is read that way, BATCH_KEYS_PER_QUERY keys at a time, on
+# one pooled connection; the rest fan the single-key function out with run_batch(). Either
+# way the rows come back in a fixed order, whatever order the chunks or workers finish in.
+BATCH_KEYS_PER_QUERY = 100
+BATCH_WORKERS = 4
+
+def run_batch(func, arg_tuples, max_workers=None):
+    """
+    Call func(*args) for every argument tuple on a bounded thread pool. Each call checks
+    its own connection out of the pool, so at most min(max_workers, pool size) run at once.
+
+    Parameters:
+        func (callable): A university_db function.
+        arg_tuples (iterable): One argument tuple per call.
+        max_workers (int): The maximum number of concurrent calls (default BATCH_WORKERS).
+
+    Returns:
+        list: The results, in the order of arg_tuples.
+
+    Raises:
+        Exception: The exception of the first failed call, in the order of arg_tuples.
+    """
+    arg_tuples = list(arg_tuples)
+    workers = min(max_workers or BATCH_WORKERS, get_pool().size, len(arg_tuples))
+    if workers <= 1:
+        return [func(*args) for args in arg_tuples]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='university-batch') as executor:
+        return list(executor.map(lambda args: func(*args), arg_tuples))
+
+def _semester_ordinals(semesters):
+    # Validated, de-duplicated ordinals, oldest first, with the (year, term) of each
+    ordinals = {}
+    for semester in semesters:
+        if len(semester) != 2:
+            raise ValidationError("A semester is (year, term).")
+        year, term = semester
+        ordinal = semester_ordinal(year, term)
+        ordinals[ordinal] = (int(year), term)
+    return dict(sorted(ordinals.items()))
+
+def _chunks(items):
+    items = list(items)
+    return [items[start:start + BATCH_KEYS_PER_QUERY] for start in range(0, len(items), BATCH_KEYS_PER_QUERY)]
+
+def _in_list(values):
+    return ', '.join(['%s'] * len(values))
+
+_SEMESTERS_STATUS_TEMPLATE = """
+        SELECT s.year, s.term, s.courseNumber, s.sectionID, COALESCE(t.status, 'No Evaluation Entered') AS status
+        FROM Semester sem
+        JOIN Section s ON s.year = sem.year AND s.term = sem.term
+        LEFT JOIN SectionSummary t
+          ON s.courseNumber = t.courseNumber
+         AND s.sectionID = t.sectionID
+         AND s.year = t.year
+         AND s.term = t.term
+        WHERE sem.ordinal IN ({ordinals})
+        ORDER BY sem.ordinal, s.courseNumber, s.sectionID
+        """
+
+def get_evaluation_status_for_semesters(semesters):
+    """
+    Retrieve the evaluation status of every section of many semesters at once, e.g. the
+    whole history with get_evaluation_status_for_semesters(get_semesters()).
+
+    Parameters:
+        semesters (iterable): (year, term) tuples.
+
+    Returns:
+        list: Dictionaries with 'year', 'term', 'courseNumber', 'sectionID' and 'status'
+              (as for get_evaluation_status_for_semester()), oldest semester first, then
+              by course number and section ID.
+
+    Raises:
+        ValidationError: If a semester is malformed or has an invalid year or term.
+    """
+    ordinals = list(_semester_ordinals(semesters))
+    if not ordinals:
+        return []
+    results = []
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        # The chunks cover consecutive ordinal ranges, so their rows concatenate in order
+        for chunk in _chunks(ordinals):
+            cursor.execute(_SEMESTERS_STATUS_TEMPLATE.format(ordinals=_in_list(chunk)), tuple(chunk))
+            results.extend(cursor.fetchall())
+    finally:
+        conn.close()
+    return results
+
+def get_sections_above_percentage_for_semesters(semesters, percentage, rule='any', use_stored=False,
+                                                max_workers=None):
+    """
+    Run get_sections_above_percentage() for many semesters. Each semester is its own
+    aggregation, so they run in parallel with run_batch().
+
+    Parameters:
+        semesters (iterable): (year, term) tuples.
+        percentage, rule, use_stored: As for get_sections_above_percentage().
+        max_workers (int): The maximum number of semesters queried at once.
+
+    Returns:
+        list: get_sections_above_percentage() rows with 'year' and 'term' added, oldest
+              semester first, then by course number and section ID.
+
+    Raises:
+        ValidationError: If a semester or the rule is invalid.
+    """
+    semesters = list(_semester_ordinals(semesters).values())
+    # Check the options once, before any worker starts
+    _sections_above_percentage_query(None, None, percentage, rule, use_stored)
+    per_semester = run_batch(get_sections_above_percentage,
+                             [(year, term, percentage, rule, use_stored) for year, term in semesters],
+                             max_workers)
+    return [{'year': year, 'term': term, **row}
+            for (year, term), rows in zip(semesters, per_semester) for row in rows]
+
+_INSTRUCTORS_SECTIONS_TEMPLATE = """
+        SELECT s.year, s.term, s.instructorID, s.courseNumber, s.sectionID, s.enrollmentCount
+        FROM Semester sem
+        JOIN Section s ON s.year = sem.year AND s.term = sem.term
+        WHERE sem.ordinal IN ({ordinals}) AND s.instructorID IN ({instructors})
+        """
+
+def get_sections_for_instructors(semesters, instructor_ids):
+    """
+    Retrieve the sections taught by any of several instructors in any of several semesters.
+
+    Parameters:
+        semesters (iterable): (year, term) tuples.
+        instructor_ids (iterable): Instructor IDs.
+
+    Returns:
+        list: Dictionaries with 'year', 'term', 'instructorID', 'courseNumber', 'sectionID'
+              and 'enrollmentCount', oldest semester first, then by instructor ID, course
+              number and section ID.
+
+    Raises:
+        ValidationError: If a semester is malformed or has an invalid year or term.
+    """
+    ordinals = _semester_ordinals(semesters)
+    instructor_ids = list(dict.fromkeys(str(i) for i in instructor_ids))
+    if not ordinals or not instructor_ids:
+        return []
+    rows = []
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        for semester_chunk in _chunks(ordinals):
+            for instructor_chunk in _chunks(instructor_ids):
+                cursor.execute(_INSTRUCTORS_SECTIONS_TEMPLATE.format(ordinals=_in_list(semester_chunk),
+                                                                     instructors=_in_list(instructor_chunk)),
+                               tuple(semester_chunk) + tuple(instructor_chunk))
+                rows.extend(cursor.fetchall())
+    finally:
+        conn.close()
+    # Merge the chunks' rows
+    position = {semester: ordinal for ordinal, semester in ordinals.items()}
+    rows.sort(key=lambda r: (position[(int(r['year']), r['term'])], r['instructorID'],
+                             r['courseNumber'], str(r['sectionID'])))
+    return rows
+
+_DEGREES_COURSES_TEMPLATE = """
+        SELECT cd.degreeID, c.courseNumber, c.name, cd.isCore
+        FROM Course_Degree cd
+        JOIN Course c ON cd.courseNumber = c.courseNumber
+        WHERE cd.degreeID IN ({degrees})
+        """
+
+def get_degree_courses_for_degrees(degree_ids):
+    """
+    Retrieve the courses of several degree programs with one query per
+    BATCH_KEYS_PER_QUERY degrees. Unlike get_degree_courses(), this reads the database
+    rather than the reference cache.
+
+    Parameters:
+        degree_ids (iterable): Degree IDs.
+
+    Returns:
+        list: Dictionaries with 'degreeID', 'courseNumber', 'name' and 'isCore', ordered
+              by degree ID and course number.
+    """
+    degree_ids = list(dict.fromkeys(degree_ids))
+    if not degree_ids:
+        return []
+    rows = []
+    conn = _require_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        for chunk in _chunks(degree_ids):
+            cursor.execute(_DEGREES_COURSES_TEMPLATE.format(degrees=_in_list(chunk)), tuple(chunk))
+            rows.extend(cursor.fetchall())
+    finally:
+        conn.close()
+    rows.sort(key=lambda r: (r['degreeID'], r['courseNumber']))
+    return rows
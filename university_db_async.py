@@ -0,0 +1,106 @@
+"""
+Coroutine versions of the university_db queries and updates.
+
+There is no asyncio driver for both backends (sqlite3 and mysql.connector are
+blocking), so each coroutine runs its university_db counterpart on a thread
+executor whose size matches the connection pool: as many calls run at once as there
+are connections to serve them, and the event loop is never blocked. Independent
+reads can therefore be overlapped with asyncio.gather():
+
+    sections, status = await asyncio.gather(
+        get_sections_for_instructor(2024, 'Fall', '12345678'),
+        get_evaluation_status_for_semester(2024, 'Fall'),
+    )
+
+The coroutines raise the same exceptions as the synchronous functions.
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import university_db
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the executor the coroutines run on, sized to the connection pool on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=university_db.get_pool().size,
+                                               thread_name_prefix='university-db')
+    return _executor
+
+
+def configure_executor(max_workers=None):
+    """
+    Replace the executor, e.g. after university_db.configure_pool() changed the pool size.
+
+    Calls already running on the old executor finish there.
+
+    Parameters:
+        max_workers (int): The number of threads; defaults to the current pool size.
+    """
+    global _executor
+    with _executor_lock:
+        old = _executor
+        _executor = ThreadPoolExecutor(max_workers=max_workers or university_db.get_pool().size,
+                                       thread_name_prefix='university-db')
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+async def run(func, *args, **kwargs):
+    """
+    Run any blocking university_db function (or a function of several) on the executor.
+
+    Parameters:
+        func (callable): The function.
+        *args, **kwargs: Its arguments.
+
+    Returns:
+        The function's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def _coroutine(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run(func, *args, **kwargs)
+    wrapper.__doc__ = f"Coroutine version of university_db.{func.__name__}().\n{func.__doc__ or ''}"
+    return wrapper
+
+
+# Queries
+get_semesters = _coroutine(university_db.get_semesters)
+get_available_courses_for_semester = _coroutine(university_db.get_available_courses_for_semester)
+get_evaluation_status_for_semester = _coroutine(university_db.get_evaluation_status_for_semester)
+get_evaluation_status_for_sections = _coroutine(university_db.get_evaluation_status_for_sections)
+get_sections_above_percentage = _coroutine(university_db.get_sections_above_percentage)
+get_sections_for_instructor = _coroutine(university_db.get_sections_for_instructor)
+get_evaluations_for_section = _coroutine(university_db.get_evaluations_for_section)
+get_degrees_for_course = _coroutine(university_db.get_degrees_for_course)
+get_degree_courses = _coroutine(university_db.get_degree_courses)
+get_degree_goals = _coroutine(university_db.get_degree_goals)
+get_courses_for_goals = _coroutine(university_db.get_courses_for_goals)
+get_improvement_notes = _coroutine(university_db.get_improvement_notes)
+get_course_sections_in_range = _coroutine(university_db.get_course_sections_in_range)
+get_instructor_sections_in_range = _coroutine(university_db.get_instructor_sections_in_range)
+get_evaluation_status_for_semesters = _coroutine(university_db.get_evaluation_status_for_semesters)
+get_sections_above_percentage_for_semesters = _coroutine(university_db.get_sections_above_percentage_for_semesters)
+get_sections_for_instructors = _coroutine(university_db.get_sections_for_instructors)
+get_degree_courses_for_degrees = _coroutine(university_db.get_degree_courses_for_degrees)
+
+# Updates
+update_evaluation = _coroutine(university_db.update_evaluation)
+update_evaluations_batch = _coroutine(university_db.update_evaluations_batch)
+refresh_section_pass_rates = _coroutine(university_db.refresh_section_pass_rates)
+rebuild_section_summaries = _coroutine(university_db.rebuild_section_summaries)
+scaffold_semester_evaluations = _coroutine(university_db.scaffold_semester_evaluations)
+